@@ -0,0 +1,9 @@
+import sys
+
+# note: asynchronous resources use asynchronous generators and comprehensions
+#       that are syntax errors on Python older than 3.6
+collect_ignore = [] if sys.version_info >= (3, 6) else [
+    'src/graceful/resources/asyncio.py',
+    'tests/test_asyncio.py',
+    'tests/test_asgi.py',
+]
@@ -26,6 +26,11 @@ INSTALL_REQUIRES = [
     'singledispatch',
 ]
 
+EXTRAS_REQUIRE = {
+    'orjson': ['orjson'],
+    'msgpack': ['msgpack'],
+}
+
 README = os.path.join(os.path.dirname(__file__), 'README.md')
 PACKAGES = find_packages('src')
 PACKAGE_DIR = {'': 'src'}
@@ -43,7 +48,9 @@ setup(
 
     url='https://github.com/swistakm/graceful',
     include_package_data=True,
+    python_requires='>=3.5',
     install_requires=INSTALL_REQUIRES,
+    extras_require=EXTRAS_REQUIRE,
     zip_safe=True,
 
     license="BSD",
@@ -55,8 +62,6 @@ setup(
         'Topic :: Software Development :: Libraries :: Application Frameworks',
 
         'Programming Language :: Python',
-        'Programming Language :: Python :: 3.3',
-        'Programming Language :: Python :: 3.4',
         'Programming Language :: Python :: 3.5',
         'Programming Language :: Python :: 3.6',
         'Programming Language :: Python :: 3 :: Only',
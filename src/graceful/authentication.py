@@ -1,9 +1,20 @@
 # -*- coding: utf-8 -*-
-import json
+import asyncio
 import base64
 import binascii
+from bisect import bisect_right
+from contextlib import contextmanager
+import hashlib
+import hmac
+from inspect import isawaitable
+import ipaddress
+import os
+from queue import Empty, LifoQueue
 import re
 import abc
+from threading import BoundedSemaphore
+import time
+from warnings import warn
 
 try:
     from functools import singledispatch
@@ -12,8 +23,47 @@ except ImportError:  # pragma: nocover
     # compat: backport of singledispatch module introduced in Python 3.4
     from singledispatch import singledispatch
 
+try:
+    from asyncio import get_running_loop
+except ImportError:  # pragma: nocover
+    # future: remove when dropping support for Python 3.6
+    # compat: get_event_loop() returns running loop when called from
+    #         coroutine and get_running_loop() was introduced in Python 3.7
+    from asyncio import get_event_loop as get_running_loop
+
 from falcon import HTTPMissingHeader, HTTPBadRequest
 
+from graceful import signing
+from graceful.caching import InMemoryCache
+from graceful.codecs import BaseCodec, get_default_codec
+
+
+_NOT_FOUND = object()
+
+
+def _sync_user(middleware, user):
+    """Return user found by middleware in synchronous (WSGI) flow.
+
+    Asynchronous user storages return awaitables that can't be awaited
+    outside of the event loop. They are discarded and the request is treated
+    as not authenticated so they never end up in the request context.
+    """
+    if not isawaitable(user):
+        return user
+
+    if hasattr(user, 'close'):
+        # note: avoid "coroutine was never awaited" warnings
+        user.close()
+
+    warn(
+        "{} authentication middleware got awaitable user from asynchronous "
+        "user storage in synchronous application so the request is not "
+        "authenticated. Asynchronous user storages can be used only with "
+        "falcon's ASGI applications.".format(middleware.__class__.__name__),
+        RuntimeWarning,
+    )
+    return None
+
 
 class BaseUserStorage(metaclass=abc.ABCMeta):
     """Base user storage class that defines required API for user storages.
@@ -94,7 +144,7 @@ class IPRangeWhitelistStorage(BaseUserStorage):
         ip_range: Any object that supports ``in`` operator (i.e. implements the
             ``__cointains__`` method). The ``__contains__`` method should
             return ``True`` if identifier falls into specified whitelist.
-            Tip: use ``iptools``.
+            Tip: use :any:`IPWhitelist` for long lists of CIDR ranges.
         user: Default user object to return on successful authentication.
 
     .. versionadded:: 0.4.0
@@ -117,6 +167,136 @@ class IPRangeWhitelistStorage(BaseUserStorage):
             return self.user
 
 
+class IPWhitelist:
+    """Compiled whitelist of IPv4 and IPv6 networks.
+
+    Networks are normalized with the standard library ``ipaddress`` module
+    and compiled into sorted lists of merged (non-overlapping and
+    non-adjacent) address intervals separately for each IP version. Thanks
+    to that the membership test is a single binary search that takes
+    ``O(log n)`` time regardless of how many networks are whitelisted. This
+    makes it well suited for the :any:`IPRangeWhitelistStorage`:
+
+    .. code-block:: python
+
+        from graceful import authentication
+
+        whitelist = authentication.IPWhitelist(
+            '10.0.0.0/8', '192.168.1.1', '2001:db8::/32',
+        )
+
+        user_storage = authentication.IPRangeWhitelistStorage(
+            whitelist, user={"username": "internal"}
+        )
+
+    The whitelist can be replaced with the ``reload()`` method at any time.
+    New intervals are compiled aside and swapped in with a single attribute
+    assignment so concurrent lookups never block and always see either the
+    complete old or the complete new whitelist.
+
+    Args:
+        *networks: networks or single addresses to whitelist as strings or
+            ``ipaddress`` objects (e.g. ``'10.0.0.0/8'`` or ``'::1'``). Host
+            bits of networks are ignored.
+
+    Raises:
+        ValueError: if any of the networks is not a valid IPv4 or IPv6
+            network.
+
+    .. versionadded:: 0.7.0
+    """
+
+    def __init__(self, *networks):
+        """Compile initial whitelist."""
+        self._intervals = self._compile(networks)
+
+    @staticmethod
+    def _compile(networks):
+        """Compile networks into merged intervals of integer addresses.
+
+        Returns:
+            dict: mapping of IP version to ``(starts, ends)`` tuple of sorted
+            lists with the first and the last address of each interval.
+
+        """
+        ranges = {4: [], 6: []}
+
+        for network in networks:
+            network = ipaddress.ip_network(network, strict=False)
+            ranges[network.version].append((
+                int(network.network_address), int(network.broadcast_address)
+            ))
+
+        intervals = {}
+
+        for version, version_ranges in ranges.items():
+            starts, ends = [], []
+
+            for start, end in sorted(version_ranges):
+                if ends and start <= ends[-1] + 1:
+                    ends[-1] = max(ends[-1], end)
+                else:
+                    starts.append(start)
+                    ends.append(end)
+
+            intervals[version] = (starts, ends)
+
+        return intervals
+
+    def reload(self, *networks):
+        """Atomically replace whitelisted networks.
+
+        Args:
+            *networks: new networks to whitelist (see :any:`IPWhitelist`).
+
+        Raises:
+            ValueError: if any of the networks is not valid. Whitelist is left
+                unchanged in that case.
+
+        """
+        self._intervals = self._compile(networks)
+
+    def __contains__(self, address):
+        """Return ``True`` if address belongs to any whitelisted network.
+
+        Values that are not valid IP addresses (e.g. ``None`` when client
+        address is unknown) are never whitelisted. IPv4-mapped IPv6 addresses
+        (e.g. ``::ffff:10.0.0.1``) are matched against IPv4 networks.
+        """
+        try:
+            address = ipaddress.ip_address(address)
+        except ValueError:
+            return False
+
+        if address.version == 6 and address.ipv4_mapped is not None:
+            address = address.ipv4_mapped
+
+        # note: read intervals once so concurrent reload() cannot mix
+        #       the old and new whitelist within single lookup
+        starts, ends = self._intervals[address.version]
+        value = int(address)
+        index = bisect_right(starts, value) - 1
+
+        return index >= 0 and value <= ends[index]
+
+    def __iter__(self):
+        """Iterate over merged whitelisted networks."""
+        for version, address_class in (
+            (4, ipaddress.IPv4Address), (6, ipaddress.IPv6Address)
+        ):
+            for start, end in zip(*self._intervals[version]):
+                yield from ipaddress.summarize_address_range(
+                    address_class(start), address_class(end)
+                )
+
+    def __repr__(self):
+        """Return readable representation of merged whitelist."""
+        return "{cls}({networks})".format(
+            cls=self.__class__.__name__,
+            networks=", ".join(repr(str(network)) for network in self),
+        )
+
+
 class KeyValueUserStorage(BaseUserStorage):
     """Basic user storage using any key-value store as authentication backend.
 
@@ -152,16 +332,21 @@ class KeyValueUserStorage(BaseUserStorage):
             methods must be strings.
         key_prefix: key prefix used to store client identities.
         serialization: serialization object/module that uses the
-            ``dumps()``/``loads()`` protocol. Defaults to ``json``.
+            ``dumps()``/``loads()`` protocol. Defaults to the global default
+            codec (see: :func:`graceful.codecs.set_default_codec`).
 
     .. versionadded:: 0.4.0
+
+    .. versionchanged:: 0.7.0
+       Default serialization is the global default codec instead of
+       the ``json`` module.
     """
 
     def __init__(self, kv_store, key_prefix='users', serialization=None):
         """Initialize kv_store user storage."""
         self.kv_store = kv_store
         self.key_prefix = key_prefix
-        self.serialization = serialization or json
+        self.serialization = serialization or get_default_codec()
 
     def _get_storage_key(self, identified_with, identifier):
         """Get key string for given user identifier in consistent manner."""
@@ -220,15 +405,54 @@ class KeyValueUserStorage(BaseUserStorage):
         Returns:
             dict: user object stored in Redis if it exists, otherwise ``None``
         """
-        stored_value = self.kv_store.get(
+        with self._kv_client() as kv_store:
+            stored_value = kv_store.get(
+                self._get_storage_key(identified_with, identifier)
+            )
+
+        return self._decode_user(stored_value)
+
+    def get_users_many(self, identified_with, identifiers):
+        """Get user objects for multiple identifiers in single round trip.
+
+        Values are retrieved with the ``mget(keys)`` method of key-value
+        store or with a pipeline (``pipeline()`` method) if ``mget()`` is
+        not available. Stores that provide neither of them are queried key
+        by key.
+
+        Args:
+            identified_with (object): authentication middleware used
+                to identify the users.
+            identifiers (list): list of middleware specific user identifiers.
+
+        Returns:
+            list: list of user objects (or ``None`` values for unknown
+            users) in order of identifiers.
+
+        .. versionadded:: 0.7.0
+        """
+        keys = [
             self._get_storage_key(identified_with, identifier)
-        )
-        if stored_value is not None:
-            user = self.serialization.loads(stored_value.decode())
-        else:
-            user = None
+            for identifier in identifiers
+        ]
 
-        return user
+        if not keys:
+            return []
+
+        with self._kv_client() as kv_store:
+            if hasattr(kv_store, 'mget'):
+                stored_values = kv_store.mget(keys)
+
+            elif hasattr(kv_store, 'pipeline'):
+                pipeline = kv_store.pipeline()
+                for key in keys:
+                    pipeline.get(key)
+                stored_values = pipeline.execute()
+
+            else:
+                stored_values = [kv_store.get(key) for key in keys]
+
+        return [self._decode_user(value) for value in stored_values]
 
     def register(self, identified_with, identifier, user):
         """Register new key for given client identifier.
@@ -242,11 +466,376 @@ class KeyValueUserStorage(BaseUserStorage):
             identifier (str): user identifier.
             user (str): user object to be stored in the backend.
         """
-        self.kv_store.set(
+        with self._kv_client() as kv_store:
+            kv_store.set(
+                self._get_storage_key(identified_with, identifier),
+                self._encode_user(user),
+            )
+
+    @contextmanager
+    def _kv_client(self):
+        """Provide key-value store client for the duration of operation."""
+        yield self.kv_store
+
+    def _decode_user(self, stored_value):
+        """Decode user object from value stored in key-value store."""
+        if stored_value is None:
+            return None
+        elif isinstance(self.serialization, BaseCodec):
+            # note: codecs are able to decode directly from bytes
+            return self.serialization.loads(stored_value)
+        else:
+            return self.serialization.loads(stored_value.decode())
+
+    def _encode_user(self, user):
+        """Encode user object to bytes stored in key-value store."""
+        encoded = self.serialization.dumps(user)
+        return encoded.encode() if isinstance(encoded, str) else encoded
+
+
+class PooledKeyValueUserStorage(KeyValueUserStorage):
+    """Key-value user storage that uses a pool of key-value store clients.
+
+    Some key-value store clients (e.g. most of memcached clients) are not
+    thread-safe and can serve only one request at a time. This storage
+    creates clients on demand with ``kv_store_factory`` and keeps at most
+    ``pool_size`` of them. Every storage operation borrows an idle client
+    (or waits for one if all of them are busy) so clients are never shared
+    between concurrent requests and the number of connections stays bounded.
+
+    .. code-block:: python
+
+        from pymemcache.client.base import Client
+
+        storage = PooledKeyValueUserStorage(
+            lambda: Client(('localhost', 11211)), pool_size=8,
+        )
+
+    Note:
+        Clients that already pool connections internally (e.g. the
+        ``redis.Redis`` client) should rather be used with
+        :class:`KeyValueUserStorage`.
+
+    Args:
+        kv_store_factory (callable): function that creates new key-value
+            store client with the API required by :class:`KeyValueUserStorage`
+        pool_size (int): maximum number of clients.
+        key_prefix: key prefix used to store client identities.
+        serialization: serialization object/module that uses the
+            ``dumps()``/``loads()`` protocol. Defaults to the global default
+            codec.
+
+    .. versionadded:: 0.7.0
+    """
+
+    def __init__(
+        self, kv_store_factory, pool_size=10, key_prefix='users',
+        serialization=None,
+    ):
+        """Initialize pooled user storage."""
+        super().__init__(None, key_prefix, serialization)
+        self.kv_store_factory = kv_store_factory
+        self.pool_size = pool_size
+
+        self._idle = LifoQueue()
+        self._slots = BoundedSemaphore(pool_size)
+
+    @contextmanager
+    def _kv_client(self):
+        """Borrow key-value store client from the pool."""
+        self._slots.acquire()
+
+        try:
+            try:
+                client = self._idle.get_nowait()
+            except Empty:
+                client = self.kv_store_factory()
+
+            yield client
+
+            # note: clients are returned to the pool only on success because
+            #       failed clients can be left in inconsistent state (e.g.
+            #       with partially read response). Most recently used clients
+            #       are reused first so idle connections above the usual
+            #       load can time out.
+            self._idle.put(client)
+        finally:
+            self._slots.release()
+
+
+class AsyncKeyValueUserStorage(KeyValueUserStorage):
+    """Key-value user storage for asyncio key-value store clients.
+
+    Asynchronous counterpart of :class:`KeyValueUserStorage` that works with
+    clients providing coroutine ``get()``, ``set()`` and ``mget()`` methods
+    (e.g. ``redis.asyncio.Redis``). The ``get_user()``, ``register()`` and
+    ``get_users_many()`` methods are coroutines. Authentication middleware
+    awaits them when it is used by ASGI applications (see:
+    :meth:`BaseAuthenticationMiddleware.process_resource_async`).
+
+    If ``collapse_lookups`` is enabled then concurrent ``get_user()`` calls
+    made by requests handled in the same iteration of event loop are
+    collapsed into single ``mget()`` round trip.
+
+    Args:
+        kv_store: asyncio key-value store client instance.
+        key_prefix: key prefix used to store client identities.
+        serialization: serialization object/module that uses the
+            ``dumps()``/``loads()`` protocol. Defaults to the global default
+            codec.
+        collapse_lookups (bool): collapse concurrent lookups into single
+            round trip.
+
+    Note:
+        Storage with collapsed lookups must be used with single event loop.
+
+    .. versionadded:: 0.7.0
+    """
+
+    def __init__(
+        self, kv_store, key_prefix='users', serialization=None,
+        collapse_lookups=True,
+    ):
+        """Initialize asyncio user storage."""
+        super().__init__(kv_store, key_prefix, serialization)
+        self.collapse_lookups = collapse_lookups
+        self._pending = None
+        self._lookup = None
+
+    async def get_user(
+        self, identified_with, identifier, req, resp, resource, uri_kwargs
+    ):
+        """Get user object for given identifier.
+
+        Args:
+            identified_with (object): authentication middleware used
+                to identify the user.
+            identifier: middleware specifix user identifier (string or tuple
+                in case of all built in authentication middleware classes).
+
+        Returns:
+            dict: user object stored in key-value store if it exists,
+            otherwise ``None``
+        """
+        key = self._get_storage_key(identified_with, identifier)
+
+        if not self.collapse_lookups:
+            return self._decode_user(await self.kv_store.get(key))
+
+        if self._pending is None:
+            self._pending = {}
+            # note: lookup starts in next iteration of event loop so other
+            #       requests can add their keys to the same round trip.
+            #       Event loop keeps only weak references to tasks so the
+            #       task is referenced until it is finished.
+            self._lookup = asyncio.ensure_future(self._lookup_pending())
+            self._lookup.add_done_callback(self._lookup_done)
+
+        future = self._pending.get(key)
+
+        if future is None:
+            future = self._pending[key] = get_running_loop().create_future()
+
+        # note: every waiter decodes own copy of the user object
+        return self._decode_user(await asyncio.shield(future))
+
+    async def _lookup_pending(self):
+        """Retrieve values of all pending keys in single round trip."""
+        pending, self._pending = self._pending, None
+
+        try:
+            stored_values = await self.kv_store.mget(list(pending))
+        except Exception as err:
+            for future in pending.values():
+                future.set_exception(err)
+        else:
+            for future, value in zip(pending.values(), stored_values):
+                future.set_result(value)
+
+    def _lookup_done(self, task):
+        """Release finished lookup task and retrieve its exception."""
+        if self._lookup is task:
+            self._lookup = None
+
+        # note: waiters of the lookup may be already cancelled so nothing
+        #       else would retrieve the exception of the task
+        if not task.cancelled():
+            task.exception()
+
+    async def get_users_many(self, identified_with, identifiers):
+        """Get user objects for multiple identifiers in single round trip.
+
+        Args:
+            identified_with (object): authentication middleware used
+                to identify the users.
+            identifiers (list): list of middleware specific user identifiers.
+
+        Returns:
+            list: list of user objects (or ``None`` values for unknown
+            users) in order of identifiers.
+        """
+        keys = [
+            self._get_storage_key(identified_with, identifier)
+            for identifier in identifiers
+        ]
+
+        if not keys:
+            return []
+
+        return [
+            self._decode_user(value)
+            for value in await self.kv_store.mget(keys)
+        ]
+
+    async def register(self, identified_with, identifier, user):
+        """Register new key for given client identifier.
+
+        Args:
+            identified_with (object): authentication middleware used
+                to identify the user.
+            identifier (str): user identifier.
+            user (str): user object to be stored in the backend.
+        """
+        await self.kv_store.set(
             self._get_storage_key(identified_with, identifier),
-            self.serialization.dumps(user).encode(),
+            self._encode_user(user),
+        )
+
+
+class CachedUserStorage(BaseUserStorage):
+    """In-process cache of user lookups for any user storage.
+
+    Users found in the wrapped storage are cached for ``ttl`` seconds. Failed
+    lookups (unknown identities) are cached too but for shorter
+    ``negative_ttl`` so repeated requests of unauthenticated clients do
+    not hit the backend either. Cache holds at most ``max_size`` entries and
+    evicts least recently used ones when it is full.
+
+    Entries are keyed by the name of authentication middleware and SHA-256
+    hash of the identifier so user secrets (e.g. Basic auth passwords) are
+    never kept in memory as cache keys.
+
+    .. code-block:: python
+
+        from graceful.authentication import (
+            CachedUserStorage, KeyValueUserStorage, Token
+        )
+
+        storage = CachedUserStorage(
+            KeyValueUserStorage(redis.StrictRedis()),
+            ttl=60, negative_ttl=5,
+        )
+        api = falcon.API(middleware=[Token(storage)])
+
+    Note:
+        Cache is not shared between processes. Changes made in the wrapped
+        storage by other processes (or directly in the backend) become
+        visible after cached entries expire. Only wrap storages whose
+        results depend on the identifier alone and not on the request.
+
+    Asynchronous storages (e.g. :class:`AsyncKeyValueUserStorage`) can be
+    wrapped too. Then ``get_user()`` and ``register()`` return awaitables on
+    cache misses and results are cached only after they are awaited.
+
+    Args:
+        user_storage (BaseUserStorage): wrapped user storage.
+        max_size (int): maximum number of cached users.
+        ttl (float): time (in seconds) for which found users are cached.
+        negative_ttl (float): time (in seconds) for which failed lookups are
+            cached. Set to ``0`` in order to disable negative caching.
+        clock (callable): function returning current time in seconds.
+            Defaults to ``time.monotonic``.
+
+    .. versionadded:: 0.7.0
+    """
+
+    def __init__(
+        self, user_storage, max_size=1024, ttl=60, negative_ttl=5,
+        clock=time.monotonic,
+    ):
+        """Initialize cached user storage."""
+        self.user_storage = user_storage
+        self.negative_ttl = negative_ttl
+        self.cache = InMemoryCache(max_size=max_size, ttl=ttl, clock=clock)
+
+    @staticmethod
+    def _get_cache_key(identifier):
+        """Return hashed identifier used as the cache key."""
+        return hashlib.sha256(repr(identifier).encode()).hexdigest()
+
+    def get_user(
+        self, identified_with, identifier, req, resp, resource, uri_kwargs
+    ):
+        """Get user from cache or from the wrapped storage on cache miss."""
+        key = self._get_cache_key(identifier)
+        user = self.cache.get(identified_with.name, key)
+
+        if user is None:
+            user = self.user_storage.get_user(
+                identified_with, identifier, req, resp, resource, uri_kwargs
+            )
+
+            if isawaitable(user):
+                return self._cache_user_async(identified_with, key, user)
+
+            self._cache_user(identified_with, key, user)
+
+        return None if user is _NOT_FOUND else user
+
+    def _cache_user(self, identified_with, key, user):
+        """Cache user found in the wrapped storage or failed lookup."""
+        if user is not None:
+            self.cache.set(identified_with.name, key, user)
+        elif self.negative_ttl:
+            self.cache.set(
+                identified_with.name, key, _NOT_FOUND,
+                ttl=self.negative_ttl
+            )
+
+    async def _cache_user_async(self, identified_with, key, lookup):
+        """Await user lookup of asyncio storage and cache its result."""
+        user = await lookup
+        self._cache_user(identified_with, key, user)
+        return user
+
+    def register(self, identified_with, identifier, user):
+        """Register user in the wrapped storage and invalidate cached entry.
+
+        Args:
+            identified_with (object): authentication middleware used
+                to identify the user.
+            identifier (str): user identifier.
+            user (str): user object to be stored in the backend.
+        """
+        registered = self.user_storage.register(
+            identified_with, identifier, user
+        )
+
+        if isawaitable(registered):
+            return self._register_async(
+                identified_with, identifier, registered
+            )
+
+        self.cache.delete(
+            identified_with.name, self._get_cache_key(identifier)
         )
 
+    async def _register_async(self, identified_with, identifier, registered):
+        """Await registration in asyncio storage and invalidate cache."""
+        await registered
+        self.cache.delete(
+            identified_with.name, self._get_cache_key(identifier)
+        )
+
+    def stats(self):
+        """Return cache statistics.
+
+        Returns:
+            dict: dictionary with ``hits``, ``misses``, ``hit_ratio``,
+            ``size`` and ``evictions`` keys.
+        """
+        return self.cache.stats()
+
 
 class BaseAuthenticationMiddleware:
     """Base class for all authentication middleware classes.
@@ -269,6 +858,11 @@ class BaseAuthenticationMiddleware:
     #: object to identify users
     only_with_storage = False
 
+    #: lowercase scheme of the ``Authorization`` header handled by the
+    #: middleware (see: :meth:`identify_authorization`) or ``None`` if
+    #: middleware does not use the ``Authorization`` header.
+    authorization_scheme = None
+
     def __init__(self, user_storage=None, name=None):
         """Initialize authentication middleware."""
         self.user_storage = user_storage
@@ -302,7 +896,33 @@ class BaseAuthenticationMiddleware:
 
         identifier = self.identify(req, resp, resource, uri_kwargs)
         user = self.try_storage(identifier, req, resp, resource, uri_kwargs)
+        self._set_user(req, _sync_user(self, user))
+
+    async def process_resource_async(
+        self, req, resp, resource, uri_kwargs=None
+    ):
+        """Process resource after routing to it in ASGI application.
+
+        This is asynchronous counterpart of :meth:`process_resource` used
+        by falcon's ASGI applications. Results of user storages with
+        coroutine ``get_user()`` method (e.g.
+        :class:`AsyncKeyValueUserStorage`) are awaited.
+
+        .. versionadded:: 0.7.0
+        """
+        if 'user' in req.context:
+            return
 
+        identifier = self.identify(req, resp, resource, uri_kwargs)
+        user = self.try_storage(identifier, req, resp, resource, uri_kwargs)
+
+        if isawaitable(user):
+            user = await user
+
+        self._set_user(req, user)
+
+    def _set_user(self, req, user):
+        """Store identified user in request context."""
         if user is not None:
             req.context['user'] = user
 
@@ -328,6 +948,41 @@ class BaseAuthenticationMiddleware:
         """
         raise NotImplementedError  # pragma: nocover
 
+    def identify_authorization(self, auth, req, resp, resource, uri_kwargs):
+        """Identify the user from already parsed ``Authorization`` header.
+
+        Middlewares that define :attr:`authorization_scheme` implement this
+        method so :any:`CompositeAuthentication` can parse the header only
+        once and pass it to the middleware matching its scheme.
+
+        Args:
+            auth (list): ``Authorization`` header value split on spaces.
+                Its first element always matches :attr:`authorization_scheme`
+                (case insensitive).
+            req (falcon.Request): request object
+            resp (falcon.Response): response object
+            resource (object): resource object matched by falcon router
+            uri_kwargs (dict): additional keyword argument from uri template.
+
+        Returns:
+            object: user identifier.
+
+        .. versionadded:: 0.7.0
+        """
+        raise NotImplementedError  # pragma: nocover
+
+    def _identify_with_header(self, req, resp, resource, uri_kwargs):
+        """Identify the user with ``Authorization`` header of own scheme."""
+        header = req.get_header('Authorization', False)
+        auth = header.split(' ') if header else None
+
+        if auth is None or auth[0].lower() != self.authorization_scheme:
+            return None
+
+        return self.identify_authorization(
+            auth, req, resp, resource, uri_kwargs
+        )
+
     def try_storage(self, identifier, req, resp, resource, uri_kwargs):
         """Try to find user in configured user storage object.
 
@@ -393,6 +1048,19 @@ class Basic(BaseAuthenticationMiddleware):
 
         username, _, password = identifier.partition(":")
 
+    Verification of passwords hashed with slow key derivation functions
+    (bcrypt, scrypt, argon2) can take tens of milliseconds on every request.
+    If ``verification_cache_ttl`` is set then users successfully verified
+    by the storage are cached for that many seconds under keyed fingerprint
+    (HMAC-SHA256 with random per-process key) of the raw ``Authorization``
+    header value so slow verification runs only on cache misses. Failed
+    verifications are never cached. Use :meth:`flush_verification_cache`
+    when user password changes.
+
+    Note:
+        Cached user objects are shared by requests with the same credentials
+        so they should not be modified during request processing.
+
     Args:
         realm (str): name of the protected realm. This can be only alphanumeric
             string with spaces (see: the ``REALM_RE`` pattern).
@@ -401,18 +1069,30 @@ class Basic(BaseAuthenticationMiddleware):
         name (str): custom name of the authentication middleware useful
             for handling custom user storage backends. Defaults to middleware
             class name.
+        verification_cache_ttl (float): time (in seconds) for which verified
+            users are cached. Defaults to ``None`` (no caching).
+        verification_cache_size (int): maximum number of cached
+            verifications.
 
     .. versionadded:: 0.4.0
 
+    .. versionchanged:: 0.7.0
+       Added ``verification_cache_ttl`` and ``verification_cache_size``
+       arguments.
+
     .. _RFC 7617: https://tools.ietf.org/html/rfc7616
     """
 
     only_with_storage = True
+    authorization_scheme = 'basic'
 
     #: regular expression used to validate configured realm
     REALM_RE = re.compile(r"^[\w ]+$")
 
-    def __init__(self, user_storage=None, name=None, realm="api"):
+    def __init__(
+        self, user_storage=None, name=None, realm="api",
+        verification_cache_ttl=None, verification_cache_size=1024,
+    ):
         """Initialize middleware and validate realm string."""
         if not self.REALM_RE.match(realm):
             raise ValueError(
@@ -423,14 +1103,74 @@ class Basic(BaseAuthenticationMiddleware):
         self.challenge = "Basic realm={}".format(realm)
         super(Basic, self).__init__(user_storage, name)
 
+        self.verification_cache = InMemoryCache(
+            max_size=verification_cache_size, ttl=verification_cache_ttl,
+        ) if verification_cache_ttl else None
+        self._fingerprint_key = os.urandom(32)
+
+    def flush_verification_cache(self, username=None):
+        """Remove cached verifications of given user or of all users.
+
+        Args:
+            username (str): name of the user whose verifications should be
+                removed. Defaults to ``None`` (remove all verifications).
+
+        .. versionadded:: 0.7.0
+        """
+        if self.verification_cache is None:
+            return
+
+        if username is None:
+            self.verification_cache.clear()
+        else:
+            self.verification_cache.invalidate(username)
+
+    def try_storage(self, identifier, req, resp, resource, uri_kwargs):
+        """Try to find user in verification cache or in the user storage."""
+        if self.verification_cache is None or identifier is None:
+            return super().try_storage(
+                identifier, req, resp, resource, uri_kwargs
+            )
+
+        # note: cached entries are grouped by username so they can be
+        #       flushed when user password changes
+        username = identifier[0]
+        fingerprint = hmac.new(
+            self._fingerprint_key,
+            req.get_header("Authorization").encode(),
+            hashlib.sha256,
+        ).hexdigest()
+
+        user = self.verification_cache.get(username, fingerprint)
+
+        if user is None:
+            user = super().try_storage(
+                identifier, req, resp, resource, uri_kwargs
+            )
+
+            if isawaitable(user):
+                return self._cache_verified_async(username, fingerprint, user)
+
+            if user is not None:
+                self.verification_cache.set(username, fingerprint, user)
+
+        return user
+
+    async def _cache_verified_async(self, username, fingerprint, lookup):
+        """Await user lookup of asyncio storage and cache verified user."""
+        user = await lookup
+
+        if user is not None:
+            self.verification_cache.set(username, fingerprint, user)
+
+        return user
+
     def identify(self, req, resp, resource, uri_kwargs):
         """Identify user using Authenticate header with Basic auth."""
-        header = req.get_header("Authorization", False)
-        auth = header.split(" ") if header else None
-
-        if auth is None or auth[0].lower() != 'basic':
-            return None
+        return self._identify_with_header(req, resp, resource, uri_kwargs)
 
+    def identify_authorization(self, auth, req, resp, resource, uri_kwargs):
+        """Decode username and password from Basic auth credentials."""
         if len(auth) != 2:
             raise HTTPBadRequest(
                 "Invalid Authorization header",
@@ -520,15 +1260,14 @@ class Token(BaseAuthenticationMiddleware):
 
     challenge = 'Token'
     only_with_storage = True
+    authorization_scheme = 'token'
 
     def identify(self, req, resp, resource, uri_kwargs):
         """Identify user using Authenticate header with Token auth."""
-        header = req.get_header('Authorization', False)
-        auth = header.split(' ') if header else None
-
-        if auth is None or auth[0].lower() != 'token':
-            return None
+        return self._identify_with_header(req, resp, resource, uri_kwargs)
 
+    def identify_authorization(self, auth, req, resp, resource, uri_kwargs):
+        """Return token value from Token auth credentials."""
         if len(auth) != 2:
             raise HTTPBadRequest(
                 "Invalid Authorization header",
@@ -539,6 +1278,249 @@ class Token(BaseAuthenticationMiddleware):
         return auth[1]
 
 
+class SignedToken(BaseAuthenticationMiddleware):
+    """Authenticate user with stateless HMAC-signed bearer tokens.
+
+    Signed token authentication takes form of ``Authorization`` header::
+
+        Authorization: Bearer <token>
+
+    Where ``<token>`` has following form::
+
+        <key_id>.<claims>.<signature>
+
+    * ``<key_id>`` is the identifier of the secret key used to sign token.
+    * ``<claims>`` is URL-safe base64 encoded user object (claims) encoded
+      with the configured codec. Claims must be a dictionary and may
+      include the ``exp`` key with token expiry time (UNIX timestamp).
+    * ``<signature>`` is URL-safe base64 encoded HMAC-SHA256 signature of
+      the ``<key_id>.<claims>`` string made with the secret key.
+
+    Unlike :any:`Token` this middleware does not require any user storage.
+    Signature and expiry are verified locally and decoded claims become
+    the user object so authentication does not require any network round
+    trip. Tokens can be issued with the :meth:`issue` method:
+
+    .. code-block:: python
+
+        auth_middleware = authentication.SignedToken(
+            keys={'2024-01': b'old secret', '2024-02': b'new secret'},
+            signing_key_id='2024-02',
+        )
+
+        token = auth_middleware.issue({'username': 'foo'}, ttl=3600)
+
+    Multiple keys can be active at the same time so keys can be rotated
+    without invalidating tokens that are already issued: add the new key,
+    start signing with it and remove the old key when all tokens signed
+    with it expire (see: :meth:`update_keys`).
+
+    Verified tokens are cached in a bounded LRU cache until they expire so
+    repeated requests with the same token skip signature verification and
+    decoding. Tokens with invalid signatures are never cached.
+
+    If client fails to authenticate on protected endpoint the response will
+    include following challenge::
+
+        WWW-Authenticate: Bearer
+
+    Note:
+        Claims are only signed and not encrypted so they must not include
+        any secrets. Cached user objects are shared by requests with the same
+        token so they should not be modified during request processing.
+
+    Args:
+        keys (dict): mapping of key identifiers to secret keys (``bytes``).
+        signing_key_id (str): identifier of the key used to issue new tokens.
+            Can be omitted if ``keys`` include only single key.
+        name (str): custom name of the authentication middleware. Defaults
+            to middleware class name.
+        codec (BaseCodec): codec used to encode claims. Defaults to the
+            global default codec (see:
+            :func:`graceful.codecs.set_default_codec`).
+        cache_size (int): maximum number of cached verified tokens. Use
+            ``0`` to disable caching.
+        clock (callable): function returning current UNIX time in seconds.
+            Defaults to ``time.time``.
+
+    Raises:
+        ValueError: if signing key cannot be determined from arguments.
+
+    .. versionadded:: 0.7.0
+    """
+
+    challenge = 'Bearer'
+    only_with_storage = False
+    authorization_scheme = 'bearer'
+
+    def __init__(
+        self, keys, signing_key_id=None, name=None, codec=None,
+        cache_size=1024, clock=time.time,
+    ):
+        """Initialize middleware with secret keys."""
+        super().__init__(None, name)
+        self.codec = codec or get_default_codec()
+        self.clock = clock
+
+        # note: token expiry is enforced with per-entry TTL
+        self.verification_cache = InMemoryCache(
+            max_size=cache_size, ttl=0, clock=clock,
+        ) if cache_size else None
+
+        self.update_keys(keys, signing_key_id)
+
+    def update_keys(self, keys, signing_key_id=None):
+        """Replace secret keys and the key used to issue new tokens.
+
+        Cached tokens signed with keys that are no longer available are
+        removed from the cache.
+
+        Args:
+            keys (dict): mapping of key identifiers to secret keys.
+            signing_key_id (str): identifier of the key used to issue new
+                tokens. Can be omitted if ``keys`` include only single key.
+
+        Raises:
+            ValueError: if signing key cannot be determined from arguments.
+
+        """
+        if signing_key_id is None and len(keys) == 1:
+            signing_key_id = next(iter(keys))
+
+        if signing_key_id not in keys:
+            raise ValueError(
+                "signing_key_id must be one of keys identifiers. Got {}."
+                "".format(signing_key_id)
+            )
+
+        if any('.' in key_id for key_id in keys):
+            raise ValueError("key identifiers must not contain dots")
+
+        removed = set(getattr(self, 'keys', {})) - set(keys)
+
+        self.keys = dict(keys)
+        self.signing_key_id = signing_key_id
+
+        if self.verification_cache is not None:
+            for key_id in removed:
+                self.verification_cache.invalidate(key_id)
+
+    def issue(self, claims, ttl=None):
+        """Issue signed token for given claims.
+
+        Args:
+            claims (dict): user object to include in the token.
+            ttl (float): time (in seconds) after which token expires. Defaults
+                to ``None`` (token expires only if claims include the ``exp``
+                key).
+
+        Returns:
+            str: signed token.
+
+        """
+        if ttl is not None:
+            claims = dict(claims, exp=int(self.clock() + ttl))
+
+        encoded = self.codec.dumps(claims)
+        signed = '.'.join((
+            self.signing_key_id,
+            signing.b64encode(
+                encoded.encode() if isinstance(encoded, str) else encoded
+            ),
+        ))
+
+        signature = signing.sign(
+            self.keys[self.signing_key_id], signed.encode()
+        )
+
+        return '.'.join((signed, signing.b64encode(signature)))
+
+    def identify(self, req, resp, resource, uri_kwargs):
+        """Identify user using Authenticate header with signed token."""
+        return self._identify_with_header(req, resp, resource, uri_kwargs)
+
+    def identify_authorization(self, auth, req, resp, resource, uri_kwargs):
+        """Return verified claims of signed token or ``None``."""
+        if len(auth) != 2:
+            raise HTTPBadRequest(
+                "Invalid Authorization header",
+                "The Authorization header for signed token auth should be in "
+                "form:\nAuthorization: Bearer <token>"
+            )
+
+        return self.verify(auth[1])
+
+    def verify(self, token):
+        """Verify signed token and return its claims.
+
+        Args:
+            token (str): signed token.
+
+        Returns:
+            dict: token claims or ``None`` if token is malformed, its
+            signature is invalid, it was signed with unknown key or it has
+            expired.
+
+        """
+        parts = token.split('.')
+
+        if len(parts) != 3:
+            return None
+
+        key_id, encoded_claims, signature = parts
+
+        if self.verification_cache is not None:
+            claims = self.verification_cache.get(key_id, token)
+
+            if claims is not None:
+                return claims
+
+        key = self.keys.get(key_id)
+
+        if key is None:
+            return None
+
+        # note: binascii.Error raised on invalid base64 is a ValueError
+        try:
+            if not signing.verify(
+                key,
+                (key_id + '.' + encoded_claims).encode(),
+                signing.b64decode(signature),
+            ):
+                return None
+
+            claims = self.codec.loads(signing.b64decode(encoded_claims))
+        except ValueError:
+            return None
+
+        if not isinstance(claims, dict):
+            return None
+
+        expires = claims.get('exp')
+        now = self.clock()
+
+        if expires is not None and (
+            # note: bool is an int subclass and NaN never compares as
+            #       expired so both are rejected explicitly
+            not isinstance(expires, (int, float)) or
+            isinstance(expires, bool) or
+            not expires > now
+        ):
+            return None
+
+        if self.verification_cache is not None:
+            self.verification_cache.set(
+                key_id, token, claims,
+                ttl=float('inf') if expires is None else expires - now,
+            )
+
+        return claims
+
+    def try_storage(self, identifier, req, resp, resource, uri_kwargs):
+        """Return verified claims as the user object."""
+        return identifier
+
+
 class XForwardedFor(BaseAuthenticationMiddleware):
     """Authenticate user with ``X-Forwarded-For`` header or remote address.
 
@@ -554,18 +1536,17 @@ class XForwardedFor(BaseAuthenticationMiddleware):
 
     .. code-block:: python
 
-        from iptools import IPRangeList
         import falcon
 
         from graceful import authentication
 
-        IP_WHITELIST = IpRangeList(
+        IP_WHITELIST = authentication.IPWhitelist(
             '127.0.0.1',
             # ...
         )
 
         auth_middleware = authentication.XForwardedFor(
-            user_storage=authentication.IPWRangehitelistStorage(
+            user_storage=authentication.IPRangeWhitelistStorage(
                 IP_WHITELIST, user={"username": "internal"}
             )
         )
@@ -655,3 +1636,143 @@ class Anonymous(BaseAuthenticationMiddleware):
         # note: this is just a sentinel value to trigger successful
         #       lookup in the dummy user storage
         return ...
+
+
+class CompositeAuthentication:
+    """Authenticate user with the first matching of multiple middlewares.
+
+    Installing multiple authentication middlewares (e.g. :any:`Token`,
+    :any:`Basic` and :any:`XAPIKey`) works but every one of them processes
+    each request on its own: the ``Authorization`` header is read and split
+    by every middleware that uses it and the whole middleware chain is
+    walked even when the header scheme can match only one of them. This
+    middleware wraps such set of middlewares and authenticates in a single
+    pass:
+
+    .. code-block:: python
+
+        import falcon
+
+        from graceful import authentication
+
+        auth_middleware = authentication.CompositeAuthentication(
+            authentication.Token(user_storage),
+            authentication.Basic(user_storage),
+            authentication.XAPIKey(user_storage),
+        )
+
+        api = application = falcon.API(middleware=[auth_middleware])
+
+    The ``Authorization`` header is parsed once and its scheme is looked up
+    in the table of middlewares (see: the ``authorization_scheme`` attribute
+    of :any:`BaseAuthenticationMiddleware`). Only middlewares handling that
+    scheme and middlewares that do not use the ``Authorization`` header at
+    all (e.g. :any:`XAPIKey` or :any:`XForwardedFor`) are tried, in the
+    order they were given. The first identified user is stored in the
+    request context.
+
+    If no user could be identified the challenges of all wrapped middlewares
+    are added to the request context just like when these middlewares are
+    installed separately.
+
+    Args:
+        *middlewares (BaseAuthenticationMiddleware): authentication
+            middlewares to try in order.
+
+    .. versionadded:: 0.7.0
+    """
+
+    def __init__(self, *middlewares):
+        """Initialize middleware and build scheme dispatch table."""
+        self.middlewares = middlewares
+        self.challenges = [
+            middleware.challenge for middleware in middlewares
+            if middleware.challenge is not None
+        ]
+
+        # note: keep the original order of middlewares within every chain
+        #       so the precedence is the same as with separate middlewares
+        self._fallback_chain = tuple(
+            middleware for middleware in middlewares
+            if middleware.authorization_scheme is None
+        )
+        self._scheme_chains = {
+            scheme: tuple(
+                middleware for middleware in middlewares
+                if middleware.authorization_scheme in (scheme, None)
+            )
+            for scheme in set(
+                middleware.authorization_scheme for middleware in middlewares
+            ) if scheme is not None
+        }
+
+    def _identify_all(self, req, resp, resource, uri_kwargs):
+        """Yield middlewares matching the request with their identifiers."""
+        header = req.get_header('Authorization', False)
+        auth = header.split(' ') if header else None
+        chain = self._scheme_chains.get(
+            auth[0].lower(), self._fallback_chain
+        ) if auth else self._fallback_chain
+
+        for middleware in chain:
+            if middleware.authorization_scheme is None:
+                identifier = middleware.identify(
+                    req, resp, resource, uri_kwargs
+                )
+            else:
+                identifier = middleware.identify_authorization(
+                    auth, req, resp, resource, uri_kwargs
+                )
+
+            yield middleware, identifier
+
+    def process_resource(self, req, resp, resource, uri_kwargs=None):
+        """Process resource after routing to it.
+
+        This is basic falcon middleware handler.
+        """
+        if 'user' in req.context:
+            return
+
+        for middleware, identifier in self._identify_all(
+            req, resp, resource, uri_kwargs
+        ):
+            user = _sync_user(middleware, middleware.try_storage(
+                identifier, req, resp, resource, uri_kwargs
+            ))
+
+            if user is not None:
+                req.context['user'] = user
+                return
+
+        self._add_challenges(req)
+
+    async def process_resource_async(
+        self, req, resp, resource, uri_kwargs=None
+    ):
+        """Process resource after routing to it in ASGI application."""
+        if 'user' in req.context:
+            return
+
+        for middleware, identifier in self._identify_all(
+            req, resp, resource, uri_kwargs
+        ):
+            user = middleware.try_storage(
+                identifier, req, resp, resource, uri_kwargs
+            )
+
+            if isawaitable(user):
+                user = await user
+
+            if user is not None:
+                req.context['user'] = user
+                return
+
+        self._add_challenges(req)
+
+    def _add_challenges(self, req):
+        """Add challenges of all wrapped middlewares to request context."""
+        if self.challenges:
+            req.context.setdefault('challenges', list()).extend(
+                self.challenges
+            )
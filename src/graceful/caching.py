@@ -0,0 +1,375 @@
+"""Response caches for generic resources.
+
+Response cache stores encoded response bodies of GET requests so repeated
+requests for the same resource (with the same URI template variables and
+query string parameters) do not need to run resource handlers and
+serialization at all. Cache is enabled per resource class with the
+``response_cache`` class attribute:
+
+.. code-block:: python
+
+    from graceful.caching import InMemoryCache
+    from graceful.resources.generic import ListAPI, RetrieveUpdateAPI
+
+    cache = InMemoryCache(max_size=10000, ttl=30)
+
+    class CatListResource(ListAPI, with_context=True):
+        response_cache = cache
+        cache_namespace = 'cats'
+
+    class CatResource(RetrieveUpdateAPI, with_context=True):
+        response_cache = cache
+        cache_namespace = 'cats'
+
+Successful write requests (POST, PUT, PATCH and DELETE) invalidate all
+entries in the namespace of the resource so in the above example updating
+a cat with PUT request will also invalidate cached cat lists. Responses of
+GET requests that were already being handled when namespace was
+invalidated are never stored because they may contain stale content.
+
+.. versionadded:: 0.7.0
+"""
+from collections import OrderedDict
+from threading import Lock
+import time
+
+
+class CachedResponse:
+    """Encoded response stored in response cache.
+
+    Args:
+        content_type (str): response content type
+        body (bytes): encoded response body
+        etag (str): quoted entity tag of the response (may be None)
+
+    """
+
+    __slots__ = ('content_type', 'body', 'etag')
+
+    def __init__(self, content_type, body, etag=None):
+        """Initialize cached response."""
+        self.content_type = content_type
+        self.body = body
+        self.etag = etag
+
+
+class BaseCache:
+    """Base response cache class for subclassing.
+
+    To create new cache backend subclass :class:`BaseCache` and implement
+    the ``get()``, ``set()`` and ``invalidate()`` methods. Subclasses should
+    count hits and misses with ``self.hits`` and ``self.misses`` counters
+    so they are reported by the ``stats()`` method. Caches can be shared by
+    multiple threads so counters should be updated under a lock.
+
+    Backends that can tell whether namespace was invalidated in the meantime
+    should also implement the ``generation()`` method and accept the
+    ``generation`` argument of ``set()``.
+
+    Args:
+        ttl (float): time (in seconds) after which cached entries expire.
+
+    """
+
+    def __init__(self, ttl=60):
+        """Initialize cache and its statistics."""
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, namespace, key):
+        """Get cached response.
+
+        Args:
+            namespace (str): cache namespace
+            key (str): cache key
+
+        Returns:
+            CachedResponse: cached response or ``None`` on cache miss
+
+        """
+        raise NotImplementedError  # pragma: nocover
+
+    def set(self, namespace, key, response, ttl=None, generation=None):
+        """Store response in cache.
+
+        Args:
+            namespace (str): cache namespace
+            key (str): cache key
+            response (CachedResponse): response to store
+            ttl (float): optional time (in seconds) after which this entry
+                expires. Defaults to the ``ttl`` of the cache.
+            generation: value returned by ``generation()`` before the
+                response was created. Response must not be served from
+                cache if namespace was invalidated since then. ``None``
+                means that response is always stored.
+
+        """
+        raise NotImplementedError  # pragma: nocover
+
+    def generation(self, namespace):
+        """Return token that changes whenever given namespace is invalidated.
+
+        Default implementation returns ``None`` so ``set()`` is never called
+        with the ``generation`` argument.
+
+        Args:
+            namespace (str): cache namespace
+
+        """
+        return None
+
+    def invalidate(self, namespace):
+        """Invalidate all cached responses in given namespace.
+
+        Args:
+            namespace (str): cache namespace
+
+        """
+        raise NotImplementedError  # pragma: nocover
+
+    def stats(self):
+        """Return cache statistics.
+
+        Returns:
+            dict: dictionary with ``hits``, ``misses`` and ``hit_ratio`` keys
+            (and any other backend specific values).
+
+        """
+        lookups = self.hits + self.misses
+
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_ratio': self.hits / lookups if lookups else 0.0,
+        }
+
+
+class InMemoryCache(BaseCache):
+    """In-process response cache with TTL and LRU eviction.
+
+    Cache holds at most ``max_size`` entries. When it is full the least
+    recently used entry is evicted. Cache is thread-safe but it is not shared
+    between processes so invalidation affects only the current process.
+
+    Args:
+        max_size (int): maximum number of cached entries
+        ttl (float): time (in seconds) after which cached entries expire.
+        clock (callable): function returning current time in seconds.
+            Defaults to ``time.monotonic``.
+
+    """
+
+    def __init__(self, max_size=1024, ttl=60, clock=time.monotonic):
+        """Initialize in-memory cache."""
+        super().__init__(ttl)
+        self.max_size = max_size
+        self.clock = clock
+        self.evictions = 0
+
+        self._entries = OrderedDict()
+        # note: keys of entries are indexed by namespace so invalidation
+        #       does not need to scan the whole cache
+        self._namespaces = {}
+        self._generations = {}
+        self._lock = Lock()
+
+    def _remove(self, namespace, key):
+        """Remove entry and its namespace index (must hold the lock)."""
+        del self._entries[namespace, key]
+
+        keys = self._namespaces[namespace]
+        keys.discard(key)
+
+        if not keys:
+            del self._namespaces[namespace]
+
+    def get(self, namespace, key):
+        """Get cached response and mark it as recently used."""
+        with self._lock:
+            try:
+                expires, response = self._entries[namespace, key]
+            except KeyError:
+                self.misses += 1
+                return None
+
+            if expires <= self.clock():
+                self._remove(namespace, key)
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end((namespace, key))
+            self.hits += 1
+            return response
+
+    def set(self, namespace, key, response, ttl=None, generation=None):
+        """Store response and evict least recently used entries if needed.
+
+        Args:
+            namespace (str): cache namespace
+            key (str): cache key
+            response: response to store
+            ttl (float): optional time (in seconds) after which this entry
+                expires. Defaults to the ``ttl`` of the cache.
+            generation (int): optional generation of namespace (see:
+                ``generation()``). Response is not stored if namespace was
+                invalidated since then.
+
+        """
+        if ttl is None:
+            ttl = self.ttl
+
+        with self._lock:
+            if (
+                generation is not None and
+                generation != self._generations.get(namespace, 0)
+            ):
+                return
+
+            self._entries[namespace, key] = (self.clock() + ttl, response)
+            self._entries.move_to_end((namespace, key))
+            self._namespaces.setdefault(namespace, set()).add(key)
+
+            while len(self._entries) > self.max_size:
+                self._remove(*next(iter(self._entries)))
+                self.evictions += 1
+
+    def generation(self, namespace):
+        """Return number of invalidations of given namespace."""
+        with self._lock:
+            return self._generations.get(namespace, 0)
+
+    def delete(self, namespace, key):
+        """Remove single cached entry if it exists.
+
+        Args:
+            namespace (str): cache namespace
+            key (str): cache key
+
+        """
+        with self._lock:
+            if (namespace, key) in self._entries:
+                self._remove(namespace, key)
+
+    def clear(self):
+        """Remove all cached entries."""
+        with self._lock:
+            self._entries.clear()
+            self._namespaces.clear()
+
+    def invalidate(self, namespace):
+        """Remove all cached responses in given namespace."""
+        with self._lock:
+            self._generations[namespace] = (
+                self._generations.get(namespace, 0) + 1
+            )
+
+            for key in self._namespaces.pop(namespace, ()):
+                del self._entries[namespace, key]
+
+    def stats(self):
+        """Return cache statistics including size and number of evictions."""
+        stats = super().stats()
+        stats.update(size=len(self._entries), evictions=self.evictions)
+        return stats
+
+
+class KeyValueCache(BaseCache):
+    """Response cache shared between processes through key-value store.
+
+    Responses are stored under keys matching following template::
+
+        <key_prefix>:<namespace>:<generation>:<key>
+
+    Where ``<generation>`` is a counter stored in the key-value store under
+    the ``<key_prefix>:<namespace>`` key. Invalidation increments this
+    counter so all entries of the namespace become unreachable at once in
+    all processes. Unreachable and expired entries are evicted by the
+    key-value store itself (e.g. with Redis ``allkeys-lru`` eviction policy).
+
+    Args:
+        kv_store: Key-value store client instance (e.g. Redis client object).
+            The ``kv_store`` must provide ``get(key)``,
+            ``set(key, value, ex=None)`` and ``incr(key)`` methods with the
+            semantics of Redis client methods.
+        key_prefix (str): prefix of cache keys.
+        ttl (int): time (in seconds) after which cached entries expire.
+
+    """
+
+    def __init__(self, kv_store, key_prefix='responses', ttl=60):
+        """Initialize key-value store response cache."""
+        super().__init__(ttl)
+        self.kv_store = kv_store
+        self.key_prefix = key_prefix
+        # note: lock guards only statistics, entries are kept consistent
+        #       by the key-value store
+        self._lock = Lock()
+
+    def _get_storage_key(self, namespace, key, generation=None):
+        """Get key of entry in given (or current) generation of namespace."""
+        if generation is None:
+            generation = self.generation(namespace)
+
+        return ':'.join((self.key_prefix, namespace, generation, key))
+
+    def generation(self, namespace):
+        """Return current generation counter of given namespace."""
+        generation = self.kv_store.get(':'.join((self.key_prefix, namespace)))
+
+        if isinstance(generation, bytes):
+            generation = generation.decode()
+
+        return generation or '0'
+
+    def get(self, namespace, key):
+        """Get cached response from key-value store."""
+        stored = self.kv_store.get(self._get_storage_key(namespace, key))
+
+        with self._lock:
+            if stored is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+
+        if stored is None:
+            return None
+
+        content_type, etag, body = stored.split(b'\n', 2)
+
+        return CachedResponse(
+            content_type.decode(), body, etag.decode() or None
+        )
+
+    def set(self, namespace, key, response, ttl=None, generation=None):
+        """Store response in key-value store.
+
+        Response created before namespace was invalidated is stored under
+        its former generation so it is never served.
+
+        Args:
+            namespace (str): cache namespace
+            key (str): cache key
+            response (CachedResponse): response to store
+            ttl (int): optional time (in seconds) after which this entry
+                expires. Defaults to the ``ttl`` of the cache.
+            generation (str): optional generation of namespace (see:
+                ``generation()``).
+
+        """
+        if ttl is None:
+            ttl = self.ttl
+
+        self.kv_store.set(
+            self._get_storage_key(namespace, key, generation),
+            b'\n'.join((
+                response.content_type.encode(),
+                (response.etag or '').encode(),
+                response.body,
+            )),
+            ex=ttl,
+        )
+
+    def invalidate(self, namespace):
+        """Invalidate all responses in namespace by bumping its generation."""
+        self.kv_store.incr(':'.join((self.key_prefix, namespace)))
@@ -0,0 +1,441 @@
+"""Pluggable codecs used to encode and decode resource representations.
+
+Codec is an object that provides ``dumps()``/``loads()`` protocol similar to
+the one of the ``json`` module. Codecs are used by resources to encode
+response bodies and decode request bodies. They can be configured globally
+with :func:`set_default_codec` or per resource class using the
+``codec`` class attribute:
+
+.. code-block:: python
+
+    from graceful import codecs
+    from graceful.resources.generic import ListAPI
+
+    # use standard library json module for all resources
+    codecs.set_default_codec(codecs.JSONCodec())
+
+    class FastListResource(ListAPI, with_context=True):
+        # ... but use orjson for this one
+        codec = codecs.OrjsonCodec()
+
+The default codec is the :class:`JSONCodec` that uses the standard library
+``json`` module. Faster :class:`OrjsonCodec` is never used implicitly because
+its results are not identical (see its documentation) so it has to be
+enabled explicitly.
+
+Additional codecs for other media types (e.g. :class:`MessagePackCodec`) can
+be made available to clients through content negotiation using resource's
+``media_handlers`` class attribute.
+
+.. versionadded:: 0.7.0
+"""
+from codecs import getincrementaldecoder
+import json
+import re
+import sys
+
+try:
+    import orjson
+except ImportError:  # pragma: nocover
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # pragma: nocover
+    msgpack = None
+
+
+class BaseCodec:
+    """Base codec class for subclassing.
+
+    To create new codec subclass :class:`BaseCodec` and implement following
+    methods:
+
+    * ``dumps()``: encodes object to ``str`` or ``bytes`` instance (whatever
+      is cheaper to produce for the codec backend).
+
+    * ``loads()``: decodes object from ``str`` or ``bytes`` instance.
+
+    Codecs may also override ``iterloads()`` in order to decode elements
+    of large arrays incrementally from file-like objects.
+
+    """
+
+    #: Media type of documents produced and accepted by codec.
+    media_type = 'application/json'
+
+    #: Maximum size of single array element decoded with ``iterloads()``.
+    #: Elements are buffered in memory so the limit protects against
+    #: malformed and malicious documents.
+    #:
+    #: .. versionadded:: 0.7.0
+    max_element_size = 16 * 1024 * 1024
+
+    def dumps(self, obj, indent=None):
+        """Encode given object.
+
+        Args:
+            obj: object to encode
+            indent (int): optional output indentation. ``None`` means
+                compact output.
+
+        Returns:
+            str or bytes: encoded document
+
+        """
+        raise NotImplementedError(
+            "{cls}.dumps() method not implemented".format(
+                cls=self.__class__.__name__
+            )
+        )
+
+    def loads(self, data):
+        """Decode object from given document.
+
+        Args:
+            data (bytes or str): encoded document
+
+        Returns:
+            decoded object
+
+        Raises:
+            ValueError: if document could not be decoded
+
+        """
+        raise NotImplementedError(
+            "{cls}.loads() method not implemented".format(
+                cls=self.__class__.__name__
+            )
+        )
+
+    def iterloads(self, stream, chunk_size=64 * 1024):
+        """Decode elements of array document read from file-like object.
+
+        Default implementation reads and decodes whole document at once.
+        Codecs that support incremental decoding yield array elements as soon
+        as they are read from the stream so memory usage is bounded by the
+        size of a single element instead of the size of whole document.
+
+        Args:
+            stream: file-like object with ``read(size)`` method
+            chunk_size (int): size of chunks read from the stream
+
+        Returns:
+            iterator over decoded array elements
+
+        Raises:
+            ValueError: if document could not be decoded, it is not an
+                array or (for incremental decoding) any of its elements
+                exceeds ``max_element_size``
+
+        .. versionadded:: 0.7.0
+        """
+        document = self.loads(stream.read())
+
+        if not isinstance(document, list):
+            raise ValueError("document is not an array")
+
+        return iter(document)
+
+
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+_NUMBER_CHARS = re.compile(r'[0-9.eE+\-]*')
+
+
+def _is_truncated(err, buffer):
+    """Tell if JSON decoding error may be caused by truncated buffer.
+
+    Decoding of value that is cut at the end of buffer fails either with
+    unterminated string or at the very end of buffer (some characters before
+    the end in case of partial escape sequences and literals).
+
+    """
+    return (
+        err.msg.startswith('Unterminated string') or
+        err.pos >= len(buffer) - 6
+    )
+
+
+def _iter_json_array(stream, chunk_size, max_element_size):
+    """Decode elements of JSON array incrementally from file-like object.
+
+    Elements are decoded with ``json.JSONDecoder.raw_decode()`` from text
+    buffer that holds only the part of document that was not consumed yet.
+    Element is accepted only when it is followed by a delimiter (or document
+    ends) because otherwise numbers split between chunks could be decoded
+    only partially.
+
+    If element cannot be decoded because it is not fully read yet, the
+    buffer is at least doubled before the next attempt so the total decoding
+    work stays linear in element size. Syntax errors that are not caused by
+    truncation are raised immediately.
+
+    Args:
+        stream: file-like object with ``read(size)`` method
+        chunk_size (int): size of chunks read from the stream
+        max_element_size (int): maximum size (in characters) of single
+            array element
+
+    Raises:
+        ValueError: if document could not be decoded, it is not an array
+            or any of its elements exceeds ``max_element_size``
+
+    """
+    raw_decode = json.JSONDecoder().raw_decode
+    match_whitespace = _WHITESPACE.match
+    match_number = _NUMBER_CHARS.match
+    decode_text = getincrementaldecoder('utf-8')().decode
+    buffer = ''
+    position = 0
+    eof = False
+
+    def fill(min_size=0):
+        """Read at least one chunk and ``min_size`` unconsumed characters."""
+        nonlocal buffer, position, eof
+        chunks = [buffer[position:]]
+        size = len(chunks[0])
+
+        while not eof:
+            chunk = stream.read(chunk_size)
+            eof = not chunk
+            text = decode_text(
+                chunk if isinstance(chunk, bytes) else chunk.encode('utf-8'),
+                final=eof
+            )
+            chunks.append(text)
+            size += len(text)
+
+            if size >= min_size:
+                break
+
+        # note: join once per fill so buffer is not copied for every chunk
+        buffer = ''.join(chunks)
+        position = 0
+
+    def grow():
+        """Read more data for element that is not complete yet."""
+        unconsumed = len(buffer) - position
+
+        if unconsumed >= max_element_size:
+            raise ValueError(
+                "array element exceeds {} characters".format(max_element_size)
+            )
+
+        fill(min(2 * unconsumed, max_element_size))
+
+    def skip_whitespace():
+        nonlocal position
+        while True:
+            position = match_whitespace(buffer, position).end()
+
+            if position < len(buffer) or eof:
+                return
+
+            fill()
+
+    skip_whitespace()
+    if buffer[position:position + 1] != '[':
+        raise ValueError("document is not an array")
+
+    position += 1
+    skip_whitespace()
+
+    if buffer[position:position + 1] == ']':
+        return
+
+    while True:
+        try:
+            item, end = raw_decode(buffer, position)
+        except json.JSONDecodeError as err:
+            if eof or not _is_truncated(err, buffer):
+                raise
+            grow()
+            continue
+        except RecursionError:
+            raise ValueError("array element is nested too deeply")
+
+        following = match_whitespace(buffer, end).end()
+
+        if not eof and (
+            following == len(buffer) or
+            # note: value may continue in the next chunk (e.g. a number)
+            match_number(buffer, end).end() == len(buffer)
+        ):
+            grow()
+            continue
+
+        position = end
+        yield item
+
+        skip_whitespace()
+        delimiter = buffer[position:position + 1]
+        position += 1
+
+        if delimiter == ']':
+            skip_whitespace()
+
+            if position < len(buffer):
+                raise ValueError("extra data after array")
+
+            return
+        elif delimiter != ',':
+            raise ValueError(
+                "expected ',' or ']' delimiter, got: {!r}".format(delimiter)
+            )
+
+        skip_whitespace()
+
+
+class JSONCodec(BaseCodec):
+    """JSON codec that uses the standard library ``json`` module."""
+
+    def dumps(self, obj, indent=None):
+        """Encode given object to JSON ``str``."""
+        return json.dumps(obj, indent=indent)
+
+    def loads(self, data):
+        """Decode object from JSON ``str`` or ``bytes``."""
+        # compat: json.loads() accepts bytes only since Python 3.6
+        if isinstance(data, bytes) and sys.version_info < (3, 6):
+            data = data.decode('utf-8')  # pragma: nocover
+
+        return json.loads(data)
+
+    def iterloads(self, stream, chunk_size=64 * 1024):
+        """Decode elements of JSON array incrementally from the stream."""
+        return _iter_json_array(stream, chunk_size, self.max_element_size)
+
+
+class OrjsonCodec(BaseCodec):
+    """JSON codec that uses the ``orjson`` package.
+
+    The ``orjson`` package supports only two-space indentation. Whenever
+    different indentation is requested or ``orjson`` is not able to encode
+    given object (e.g. integers that exceed 64-bit range) encoding falls back
+    to the standard library ``json`` module. Documents rejected by ``orjson``
+    (e.g. containing ``NaN`` or ``Infinity``) are decoded with the ``json``
+    module too.
+
+    Note:
+        This codec is not fully consistent with the :class:`JSONCodec` so it
+        is never used by default. Encoded documents are ``bytes`` instead of
+        ``str``, ``NaN`` and infinite floats are encoded as ``null`` and
+        integers that exceed 64-bit range are decoded as (lossy) floats.
+        Use it only if your representations are not affected by these
+        differences.
+
+    Raises:
+        ImportError: if ``orjson`` package is not importable.
+
+    """
+
+    def __init__(self):
+        """Initialize codec and verify that ``orjson`` is available."""
+        if orjson is None:
+            raise ImportError(
+                "{cls} requires the orjson package".format(
+                    cls=self.__class__.__name__
+                )
+            )
+
+    def dumps(self, obj, indent=None):
+        """Encode given object to JSON ``bytes``."""
+        if indent is None:
+            option = orjson.OPT_NON_STR_KEYS
+        elif indent == 2:
+            option = orjson.OPT_NON_STR_KEYS | orjson.OPT_INDENT_2
+        else:
+            return json.dumps(obj, indent=indent)
+
+        try:
+            return orjson.dumps(obj, option=option)
+        except orjson.JSONEncodeError:
+            return json.dumps(obj, indent=indent)
+
+    def loads(self, data):
+        """Decode object from JSON ``str`` or ``bytes``."""
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # note: keep json module semantics for NaN and Infinity values
+            return json.loads(data)
+
+    def iterloads(self, stream, chunk_size=64 * 1024):
+        """Decode elements of JSON array incrementally from the stream."""
+        # note: orjson does not support incremental decoding
+        return _iter_json_array(stream, chunk_size, self.max_element_size)
+
+
+class MessagePackCodec(BaseCodec):
+    """Binary `MessagePack`_ codec that uses the ``msgpack`` package.
+
+    MessagePack documents are usually smaller and cheaper to encode than JSON
+    (especially for numbers) so this codec is well suited for internal
+    service-to-service traffic. Binary output cannot be indented so the
+    ``indent`` argument is ignored.
+
+    Raises:
+        ImportError: if ``msgpack`` package is not importable.
+
+    .. _MessagePack: https://msgpack.org
+
+    """
+
+    media_type = 'application/msgpack'
+
+    def __init__(self):
+        """Initialize codec and verify that ``msgpack`` is available."""
+        if msgpack is None:
+            raise ImportError(
+                "{cls} requires the msgpack package".format(
+                    cls=self.__class__.__name__
+                )
+            )
+
+    def dumps(self, obj, indent=None):
+        """Encode given object to MessagePack ``bytes``."""
+        return msgpack.packb(obj, use_bin_type=True)
+
+    def loads(self, data):
+        """Decode object from MessagePack ``bytes``."""
+        try:
+            return msgpack.unpackb(data, raw=False)
+        except (msgpack.UnpackException, TypeError) as err:
+            # note: keep the ValueError contract of the loads() method
+            raise ValueError(str(err))
+
+    def iterloads(self, stream, chunk_size=64 * 1024):
+        """Decode elements of MessagePack array incrementally."""
+        unpacker = msgpack.Unpacker(
+            stream, raw=False, read_size=chunk_size,
+            # note: default limits depend on read size and are too low
+            #       for large documents
+            max_buffer_size=max(self.max_element_size, chunk_size),
+        )
+
+        try:
+            length = unpacker.read_array_header()
+            for _ in range(length):
+                yield unpacker.unpack()
+
+        except (msgpack.UnpackException, msgpack.OutOfData) as err:
+            raise ValueError(str(err) or "document is not an array")
+
+
+_default_codec = JSONCodec()
+
+
+def get_default_codec():
+    """Return codec used by resources that do not define own codec."""
+    return _default_codec
+
+
+def set_default_codec(codec):
+    """Set codec used by resources that do not define own codec.
+
+    Args:
+        codec (BaseCodec): new global default codec
+
+    """
+    global _default_codec
+    _default_codec = codec
@@ -75,3 +75,61 @@ class ValidationError(ValueError):
         return HTTPInvalidParam(
             str(self), param_name
         )
+
+
+class BulkValidationError(ValueError):
+    """Raised when some items of bulk payload failed validation.
+
+    .. versionadded:: 0.7.0
+    """
+
+    def __init__(self, errors):
+        """Initialize exception instance.
+
+        Args:
+            errors (dict): deserialization or validation errors of payload
+                items keyed by item indices
+
+        """
+        self.errors = errors
+
+    def as_bad_request(self):
+        """Translate this error to falcon's HTTP specific error exception.
+
+        Errors of single items are translated with their ``as_bad_request()``
+        methods and listed in the ``errors`` field of error representation
+        with their indices in the payload (the same way as failed items of
+        ``207 Multi-Status`` bulk creation responses).
+
+        """
+        errors = []
+
+        for index, err in sorted(self.errors.items()):
+            item_error = err.as_bad_request()
+            errors.append({
+                'index': index,
+                'status': item_error.status,
+                'title': item_error.title,
+                'description': item_error.description,
+            })
+
+        return _HTTPBulkBadRequest(
+            title="Representation deserialization failed",
+            description="Invalid items at indices: {}".format(
+                ", ".join(str(index) for index in sorted(self.errors))
+            ),
+            errors=errors,
+        )
+
+
+class _HTTPBulkBadRequest(HTTPBadRequest):
+    """Bad request error with descriptions of failed bulk payload items."""
+
+    def __init__(self, errors, **kwargs):
+        super().__init__(**kwargs)
+        self.errors = errors
+
+    def to_dict(self, obj_type=dict):
+        obj = super().to_dict(obj_type)
+        obj['errors'] = self.errors
+        return obj
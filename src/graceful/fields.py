@@ -1,5 +1,7 @@
+from collections.abc import Mapping
 import inspect
 
+from graceful.errors import DeserializationError, ValidationError
 from graceful.validators import min_validator, max_validator
 
 
@@ -386,3 +388,71 @@ class FloatField(BaseField):
     def from_representation(self, data):
         """Convert representation value to ``float``."""
         return float(data)
+
+
+class SerializerField(BaseField):
+    """Represents nested object described by another serializer.
+
+    Internal value of this field is converted to/from representation with
+    the nested serializer and validated with its ``validate()`` method. Use
+    ``many=True`` to represent list of nested objects.
+
+    Nested objects are serialized with compiled plans of nested serializer
+    so in the default case whole nested document is serialized in one pass
+    without any per-object method dispatch. Accessor strategy for nested
+    objects (mapping keys or object attributes) is resolved once per
+    object type.
+
+    Args:
+        serializer (BaseSerializer): serializer instance for nested objects
+
+    Example:
+
+    .. code-block:: python
+
+        class OwnerSerializer(BaseSerializer):
+            name = StringField("owner name")
+
+        class CatSerializer(BaseSerializer):
+            name = StringField("cat name")
+            owners = SerializerField(
+                "cat owners", serializer=OwnerSerializer(), many=True,
+            )
+
+    .. versionadded:: 0.7.0
+    """
+
+    type = 'object'
+
+    def __init__(self, details, serializer, **kwargs):
+        """Initialize field definition with nested serializer."""
+        super().__init__(details, **kwargs)
+        self.serializer = serializer
+
+    def from_representation(self, data):
+        """Convert nested representation to internal object dictionary."""
+        if not isinstance(data, Mapping):
+            raise ValueError("field should be object")
+
+        try:
+            return self.serializer.from_representation(data)
+        except DeserializationError as err:
+            # note: parent serializer reports field errors as messages
+            raise ValueError(err._get_description())
+
+    def to_representation(self, value):
+        """Convert internal object to nested representation."""
+        return self.serializer.to_representation(value)
+
+    def validate(self, value):
+        """Run field validators and validate nested object dictionary."""
+        super().validate(value)
+
+        try:
+            self.serializer.validate(value)
+        except DeserializationError as err:
+            raise ValidationError(err._get_description())
+
+    def describe(self, **kwargs):
+        """Describe field with the description of nested serializer fields."""
+        return super().describe(fields=self.serializer.describe(), **kwargs)
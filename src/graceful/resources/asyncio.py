@@ -0,0 +1,709 @@
+"""Asynchronous resources for falcon's ASGI application.
+
+This module provides coroutine counterparts of flow mixins from
+:any:`graceful.resources.mixins` and generic resources from
+:any:`graceful.resources.generic`. It is not imported by any other module
+of graceful because it requires Python 3.6 or newer.
+
+.. versionadded:: 0.7.0
+"""
+import asyncio
+from functools import partial
+from inspect import isawaitable
+
+import falcon
+
+from graceful.resources.base import BaseResource
+from graceful.resources.generic import (
+    RetrieveAPI,
+    ListAPI,
+    _bulk_item_error,
+    _merge_item_metas,
+)
+from graceful.resources.mixins import (
+    BaseMixin,
+    RetrieveMixin,
+    ListMixin,
+    UpdateMixin,
+    CreateMixin,
+    DeleteMixin,
+    PaginatedMixin,
+    CursorPaginatedMixin,
+    CreateBulkMixin,
+)
+
+
+async def _resolve(result):
+    """Await handler result if it is awaitable and return its value."""
+    if isawaitable(result):
+        return await result
+
+    return result
+
+
+async def _iter_async(chunks):
+    """Iterate asynchronously over chunks of synchronous iterator."""
+    for chunk in chunks:
+        yield chunk
+
+
+class AsyncBaseMixin(BaseMixin):
+    """Base mixin class for resources served by ASGI applications.
+
+    Asynchronous mixins provide coroutine ``on_*`` responders that can be
+    used with falcon's ASGI application (``falcon.asgi.App``). Method
+    handlers (``retrieve()``, ``list()``, ``create()`` etc.) should be
+    coroutine functions so they can wait for databases and other services
+    without blocking the event loop. Plain functions are still accepted.
+
+    Parameter parsing, content negotiation, conditional requests, response
+    caching and serialization are shared with the synchronous mixins. Only
+    request body is read asynchronously (``await req.stream.read()``) and
+    streamed response bodies are exposed as asynchronous iterators.
+
+    Note:
+        The ``get_etag()`` and ``get_last_modified()`` hooks, response cache
+        backends and serializers are still called synchronously so they
+        should not perform any blocking I/O.
+
+    .. versionadded:: 0.7.0
+    """
+
+    async def handle(self, handler, req, resp, **kwargs):
+        """Handle given resource manipulation flow asynchronously.
+
+        This is coroutine counterpart of :meth:`BaseMixin.handle` that awaits
+        the result of resource manipulation method handler.
+
+        Args:
+             handler (method): resource manipulation method handler.
+             req (falcon.Request): request object instance.
+             resp (falcon.Response): response object instance to be modified.
+             **kwargs: additional keyword arguments retrieved from url
+                 template.
+
+        Returns:
+             Content dictionary (preferably resource representation).
+        """
+        with self._timed(req, resp) as timer:
+            params, cache_entry, answered = self._begin_handling(
+                req, resp, kwargs, timer
+            )
+
+            if answered:
+                return None
+
+            meta, content = await self.require_meta_and_content(
+                self._bind_context(handler, req), params, **kwargs
+            )
+
+            if timer is not None:
+                timer.lap('handler')
+
+            self._finish_handling(
+                req, resp, params, meta, content, cache_entry, timer
+            )
+            return content
+
+    def make_stream_body(self, resp, params, meta, content):
+        """Construct streamed response body as asynchronous iterator.
+
+        Uses :meth:`BaseResource.make_stream_body` and wraps its chunks
+        with asynchronous iterator as required by ASGI applications.
+        """
+        super().make_stream_body(resp, params, meta, content)
+
+        if resp.stream is not None:
+            resp.stream = _iter_async(resp.stream)
+
+    async def require_meta_and_content(self, content_handler, params,
+                                       **kwargs):
+        """Require 'meta' and 'content' dictionaries awaiting the handler.
+
+        Args:
+            content_handler (callable): coroutine function that accepts
+                ``params, meta, **kwargs`` argument and returns dictionary
+                for ``content`` response section
+            params (dict): dictionary of parsed resource parameters
+            kwargs (dict): dictionary of values created from resource url
+                template
+
+        Returns:
+            tuple (meta, content): two-tuple with dictionaries of ``meta`` and
+                ``content`` response sections
+
+        """
+        meta = {
+            'params': params
+        }
+        content = await _resolve(content_handler(params, meta, **kwargs))
+        meta['params'] = params
+        return meta, content
+
+    async def require_representation(self, req):
+        """Require raw representation dictionary reading request body.
+
+        Coroutine counterpart of :meth:`BaseResource.require_representation`.
+
+        Args:
+            req (falcon.asgi.Request): request object
+
+        Returns:
+            dict: raw dictionary of representation supplied in request body
+
+        """
+        codec = self._require_request_codec(req)
+        return codec.loads(await req.stream.read())
+
+    async def require_validated(self, req, partial=False, bulk=False):
+        """Require fully validated internal object dictionary.
+
+        Coroutine counterpart of :meth:`BaseResource.require_validated`.
+
+        Args:
+            req (falcon.asgi.Request): request object
+            partial (bool): set to True if partially complete representation
+                is accepted (e.g. for patching instead of full update).
+            bulk (bool): set to True if request payload represents multiple
+                resources instead of single one.
+
+        Returns:
+            dict: dictionary of fields and values representing internal object.
+
+        """
+        timer = self._get_timer(req)
+
+        if timer is None:
+            return self._validate_payload(
+                await self.require_representation(req), partial, bulk
+            )
+
+        timer.start()
+        payload = await self.require_representation(req)
+        timer.lap('decode')
+        validated = self._validate_payload(payload, partial, bulk)
+        timer.lap('validate')
+        return validated
+
+    async def on_options(self, req, resp, **kwargs):
+        """Respond with JSON formatted resource description on OPTIONS."""
+        super().on_options(req, resp, **kwargs)
+
+
+class AsyncRetrieveMixin(AsyncBaseMixin, RetrieveMixin):
+    """Add default "retrieve flow on GET" to asynchronous resource class.
+
+    .. versionadded:: 0.7.0
+    """
+
+    async def on_get(self, req, resp, handler=None, **kwargs):
+        """Respond on GET HTTP request assuming resource retrieval flow.
+
+        See: :meth:`RetrieveMixin.on_get`.
+        """
+        await self.handle(
+            handler or self.retrieve, req, resp, **kwargs
+        )
+
+
+class AsyncListMixin(AsyncBaseMixin, ListMixin):
+    """Add default "list flow on GET" to asynchronous resource class.
+
+    .. versionadded:: 0.7.0
+    """
+
+    async def on_get(self, req, resp, handler=None, **kwargs):
+        """Respond on GET HTTP request assuming resource list retrieval flow.
+
+        See: :meth:`ListMixin.on_get`.
+        """
+        await self.handle(
+            handler or self.list, req, resp, **kwargs
+        )
+
+
+class AsyncDeleteMixin(AsyncBaseMixin, DeleteMixin):
+    """Add default "delete flow on DELETE" to asynchronous resource class.
+
+    .. versionadded:: 0.7.0
+    """
+
+    async def on_delete(self, req, resp, handler=None, **kwargs):
+        """Respond on DELETE HTTP request assuming resource deletion flow.
+
+        See: :meth:`DeleteMixin.on_delete`.
+        """
+        await self.handle(
+            handler or self.delete, req, resp, **kwargs
+        )
+
+        resp.status = falcon.HTTP_ACCEPTED
+
+
+class AsyncUpdateMixin(AsyncBaseMixin, UpdateMixin):
+    """Add default "update flow on PUT" to asynchronous resource class.
+
+    .. versionadded:: 0.7.0
+    """
+
+    async def on_put(self, req, resp, handler=None, **kwargs):
+        """Respond on PUT HTTP request assuming resource update flow.
+
+        See: :meth:`UpdateMixin.on_put`.
+        """
+        await self.handle(
+            handler or self.update, req, resp, **kwargs
+        )
+        resp.status = falcon.HTTP_ACCEPTED
+
+
+class AsyncCreateMixin(AsyncBaseMixin, CreateMixin):
+    """Add default "creation flow on POST" to asynchronous resource class.
+
+    .. versionadded:: 0.7.0
+    """
+
+    async def on_post(self, req, resp, handler=None, **kwargs):
+        """Respond on POST HTTP request assuming resource creation flow.
+
+        See: :meth:`CreateMixin.on_post`.
+        """
+        obj = await self.handle(
+            handler or self.create, req, resp, **kwargs
+        )
+        try:
+            resp.location = self.get_object_location(obj)
+        except NotImplementedError:
+            pass
+
+        resp.status = falcon.HTTP_CREATED
+
+
+class AsyncCreateBulkMixin(AsyncBaseMixin, CreateBulkMixin):
+    """Add default "bulk creation flow on PATCH" to asynchronous resource.
+
+    .. versionadded:: 0.7.0
+    """
+
+    async def on_patch(self, req, resp, handler=None, **kwargs):
+        """Respond on PATCH HTTP request assuming bulk creation flow.
+
+        See: :meth:`CreateBulkMixin.on_patch`.
+        """
+        await self.handle(
+            handler or self.create_bulk, req, resp, **kwargs
+        )
+
+        resp.status = falcon.HTTP_CREATED
+
+
+class AsyncPaginatedMixin(PaginatedMixin):
+    """Add pagination capabilities to asynchronous resource class.
+
+    Asynchronous counterpart of :class:`PaginatedMixin` that awaits
+    ``count()`` and ``estimate_count()`` handlers so they can be coroutine
+    functions.
+
+    Note:
+        Streamed response bodies can't await count handlers so with
+        ``streaming`` enabled the total is counted before the page of
+        objects is listed and it is never computed from page position.
+
+    .. versionadded:: 0.7.0
+    """
+
+    async def _paginate_async(self, objects, params, meta, **kwargs):
+        """Trim page of listed objects and await total count of results.
+
+        See: :meth:`PaginatedMixin._paginate`.
+        """
+        if not self.total_count:
+            return self._paginate(objects, params, meta, **kwargs)
+
+        if getattr(self, 'streaming', False):
+            await self._add_total_count_meta_async(
+                None, params, meta, **kwargs
+            )
+            # note: total is already in meta so it is not counted again
+            return self._paginate(objects, params, meta, **kwargs)
+
+        objects = list(objects)
+
+        if self.fetch_extra_item:
+            meta['has_more'] = len(objects) > params['page_size']
+            del objects[params['page_size']:]
+
+        await self._add_total_count_meta_async(
+            len(objects), params, meta, **kwargs
+        )
+        self.add_pagination_meta(params, meta)
+        return objects
+
+    async def _add_total_count_meta_async(self, length, params, meta,
+                                          **kwargs):
+        """Add awaited total number of results to meta if it is enabled.
+
+        See: :meth:`PaginatedMixin._add_total_count_meta`.
+        """
+        lookup = self._begin_total_count(length, params, meta, **kwargs)
+
+        if lookup is not None:
+            count, key = lookup
+            self._set_total_count(
+                meta, key, await _resolve(count(params, **kwargs))
+            )
+
+
+async def _resolve_objects(result):
+    """Await listed objects and collect them if they are async iterable."""
+    result = await _resolve(result)
+
+    if hasattr(result, '__aiter__'):
+        return [obj async for obj in result]
+
+    return result
+
+
+class AsyncResource(AsyncRetrieveMixin, BaseResource):
+    """Asynchronous basic retrieval of resource without serialization.
+
+    Coroutine counterpart of :class:`graceful.resources.generic.Resource`.
+    The ``.retrieve()`` handler should be a coroutine function.
+
+    .. versionadded:: 0.7.0
+    """
+
+
+class AsyncListResource(AsyncListMixin, BaseResource):
+    """Asynchronous basic retrieval of resource lists without serialization.
+
+    Coroutine counterpart of
+    :class:`graceful.resources.generic.ListResource`. The ``.list()``
+    handler should be a coroutine function.
+
+    .. versionadded:: 0.7.0
+    """
+
+
+class AsyncRetrieveAPI(AsyncRetrieveMixin, RetrieveAPI):
+    """Asynchronous Generic Retrieve API with resource serialization.
+
+    Coroutine counterpart of :class:`RetrieveAPI` for falcon's ASGI
+    application (see: :class:`AsyncBaseMixin`).
+    The ``.retrieve()`` handler should be a coroutine function.
+
+    Allowed methods:
+
+    * GET: retrieve resource representation (handled with ``.retrieve()``
+      method handler)
+
+    .. versionadded:: 0.7.0
+    """
+
+    async def _retrieve(self, params, meta, **kwargs):
+        obj = await _resolve(self.retrieve(params, meta, **kwargs))
+
+        if 'fields' in params:
+            return self.serializer.to_sparse_representation(
+                obj, params['fields']
+            )
+
+        return self.serializer.to_representation(obj)
+
+    async def on_get(self, req, resp, **kwargs):
+        """Respond on GET requests using ``self.retrieve()`` handler."""
+        return await super().on_get(
+            req, resp, handler=self._retrieve, **kwargs
+        )
+
+
+class AsyncRetrieveUpdateAPI(AsyncUpdateMixin, AsyncRetrieveAPI):
+    """Asynchronous Generic Retrieve/Update API with resource serialization.
+
+    Coroutine counterpart of :class:`RetrieveUpdateAPI`.
+
+    Allowed methods:
+
+    * GET: retrieve resource representation handled with ``.retrieve()``
+      method handler
+    * PUT: update resource with representation provided in request body
+      (handled with ``.update()`` method handler)
+
+    .. versionadded:: 0.7.0
+    """
+
+    async def _update(self, params, meta, **kwargs):
+        return self.serializer.to_representation(
+            await _resolve(self.update(params, meta, **kwargs))
+        )
+
+    async def on_put(self, req, resp, **kwargs):
+        """Respond on PUT requests using ``self.update()`` handler."""
+        with self._timed(req, resp):
+            validated = await self.require_validated(req)
+            return await super().on_put(
+                req, resp,
+                handler=partial(self._update, validated=validated),
+                **kwargs
+            )
+
+
+class AsyncRetrieveUpdateDeleteAPI(AsyncDeleteMixin, AsyncRetrieveUpdateAPI):
+    """Asynchronous Generic Retrieve/Update/Delete API.
+
+    Coroutine counterpart of :class:`RetrieveUpdateDeleteAPI`.
+
+    Allowed methods:
+
+    * GET: retrieve resource representation (handled with ``.retrieve()``
+      method handler)
+    * PUT: update resource with representation provided in request body
+      (handled with ``.update()`` method handler)
+    * DELETE: delete resource (handled with ``.delete()`` method handler)
+
+    .. versionadded:: 0.7.0
+    """
+
+
+class AsyncListAPI(AsyncListMixin, ListAPI):
+    """Asynchronous Generic List API with resource serialization.
+
+    Coroutine counterpart of :class:`ListAPI`. The ``.list()`` handler
+    should be a coroutine function or an asynchronous generator.
+
+    If ``streaming`` is enabled then synchronous iterators returned (or
+    awaited) from ``.list()`` handler are streamed item by item with an
+    asynchronous response body iterator. Objects yielded by asynchronous
+    generators are always collected before serialization.
+
+    Allowed methods:
+
+    * GET: list multiple resource instances representations (handled
+      with ``.list()`` method handler)
+
+    .. versionadded:: 0.7.0
+    """
+
+    async def _list(self, params, meta, **kwargs):
+        return self.serializer.to_representation_many(
+            await _resolve_objects(self.list(params, meta, **kwargs)),
+            lazy=self.streaming,
+            fields=params.get('fields'),
+        )
+
+    async def on_get(self, req, resp, **kwargs):
+        """Respond on GET requests using ``self.list()`` handler."""
+        return await super().on_get(req, resp, handler=self._list, **kwargs)
+
+
+class AsyncListCreateAPI(AsyncCreateMixin, AsyncCreateBulkMixin, AsyncListAPI):
+    """Asynchronous Generic List/Create API with resource serialization.
+
+    Coroutine counterpart of :class:`ListCreateAPI`. Bulk creation payloads
+    are always read and validated as a whole.
+
+    If ``create_bulk_concurrency`` is set then the default
+    ``.create_bulk()`` handler awaits multiple ``.create()`` calls
+    concurrently and reports failed items with ``207 Multi-Status``
+    response just like :class:`ListCreateAPI` does with
+    ``create_bulk_executor``.
+
+    Allowed methods:
+
+    * GET: list multiple resource instances representations (handled
+      with ``.list()`` method handler)
+    * POST: create new resource from representation provided in request body
+      (handled with ``.create()`` method handler)
+    * PATCH: create multiple resources from list of representations provided
+      in request body (handled with ``.create_bulk()`` method handler.
+
+    .. versionadded:: 0.7.0
+    """
+
+    #: Maximum number of ``.create()`` calls awaited concurrently by the
+    #: default ``.create_bulk()`` handler. ``None`` means sequential creation.
+    #:
+    #: .. versionadded:: 0.7.0
+    create_bulk_concurrency = None
+
+    async def _create(self, params, meta, **kwargs):
+        return self.serializer.to_representation(
+            await _resolve(self.create(params, meta, **kwargs))
+        )
+
+    async def _create_bulk(self, params, meta, failed, **kwargs):
+        created = await _resolve(self.create_bulk(params, meta, **kwargs))
+        failed.extend(meta.get('errors', ()))
+
+        if not failed:
+            return self.serializer.to_representation_many(created)
+
+        indices = {error['index'] for error in failed}
+        return [
+            None if index in indices else
+            self.serializer.to_representation(obj)
+            for index, obj in enumerate(created)
+        ]
+
+    async def create_bulk(self, params, meta, **kwargs):
+        """Create items in bulk by awaiting existing ``.create()`` handler.
+
+        If ``create_bulk_concurrency`` is set then items are created
+        concurrently and failed items are reported in ``meta['errors']``.
+
+        .. note::
+            This is default create_bulk implementation that may not be safe
+            to use in production environment depending on your implementation
+            of ``.create()`` method handler.
+        """
+        validated = kwargs.pop('validated')
+
+        if self.create_bulk_concurrency is None:
+            return [
+                await _resolve(self.create(params, meta, validated=item))
+                for item in validated
+            ]
+
+        semaphore = asyncio.Semaphore(self.create_bulk_concurrency)
+        # note: interleaved handlers get their own copies of meta as well
+        metas = [dict(meta) for _ in validated]
+
+        async def create(item, item_meta):
+            async with semaphore:
+                return await _resolve(
+                    self.create(params, item_meta, validated=item)
+                )
+
+        results = await asyncio.gather(
+            *(
+                create(item, item_meta)
+                for item, item_meta in zip(validated, metas)
+            ),
+            return_exceptions=True
+        )
+        _merge_item_metas(meta, metas)
+
+        created = []
+        errors = []
+
+        for index, result in enumerate(results):
+            # note: asyncio.CancelledError is not an Exception since
+            #       Python 3.8
+            if isinstance(result, BaseException):
+                errors.append(_bulk_item_error(index, result))
+                result = None
+
+            created.append(result)
+
+        if errors:
+            meta['errors'] = errors
+
+        return created
+
+    async def on_post(self, req, resp, **kwargs):
+        """Respond on POST requests using ``self.create()`` handler."""
+        with self._timed(req, resp):
+            validated = await self.require_validated(req)
+
+            return await super().on_post(
+                req, resp,
+                handler=partial(self._create, validated=validated),
+                **kwargs
+            )
+
+    async def on_patch(self, req, resp, **kwargs):
+        """Respond on PATCH requests using ``self.create_bulk()`` handler."""
+        failed = []
+
+        with self._timed(req, resp):
+            validated = await self.require_validated(req, bulk=True)
+
+            await super().on_patch(
+                req, resp,
+                handler=partial(
+                    self._create_bulk, validated=validated, failed=failed
+                ),
+                **kwargs
+            )
+
+        if failed:
+            resp.status = falcon.HTTP_MULTI_STATUS
+
+
+class AsyncPaginatedListAPI(AsyncPaginatedMixin, AsyncListAPI):
+    """Asynchronous Generic List API with serialization and pagination.
+
+    Coroutine counterpart of :class:`PaginatedListAPI`.
+
+    Allowed methods:
+
+    * GET: list multiple resource instances representations (handled
+      with ``.list()`` method handler)
+
+    .. versionadded:: 0.7.0
+    """
+
+    async def _list(self, params, meta, **kwargs):
+        return self.serializer.to_representation_many(
+            await self._paginate_async(
+                await _resolve_objects(self.list(params, meta, **kwargs)),
+                params, meta, **kwargs
+            ),
+            lazy=self.streaming,
+            fields=params.get('fields'),
+        )
+
+
+class AsyncPaginatedListCreateAPI(AsyncPaginatedMixin, AsyncListCreateAPI):
+    """Asynchronous Generic List/Create API with pagination.
+
+    Coroutine counterpart of :class:`PaginatedListCreateAPI`.
+
+    Allowed methods:
+
+    * GET: list multiple resource instances representations (handled
+      with ``.list()`` method handler)
+    * POST: create new resource from representation provided in request body
+      (handled with ``.create()`` method handler)
+    * PATCH: create multiple resources from list of representations provided
+      in request body (handled with ``.create_bulk()`` method handler.
+
+    .. versionadded:: 0.7.0
+    """
+
+    async def _list(self, params, meta, **kwargs):
+        return self.serializer.to_representation_many(
+            await self._paginate_async(
+                await _resolve_objects(self.list(params, meta, **kwargs)),
+                params, meta, **kwargs
+            ),
+            lazy=self.streaming,
+            fields=params.get('fields'),
+        )
+
+
+class AsyncCursorPaginatedListAPI(CursorPaginatedMixin, AsyncListAPI):
+    """Asynchronous Generic List API with cursor pagination.
+
+    Coroutine counterpart of
+    :class:`graceful.resources.generic.CursorPaginatedListAPI`.
+
+    Allowed methods:
+
+    * GET: list multiple resource instances representations (handled
+      with ``.list()`` method handler)
+
+    .. versionadded:: 0.7.0
+    """
+
+    async def _list(self, params, meta, **kwargs):
+        # note: cursors are created from internal objects because sort key
+        #       fields do not need to be included in sparse representations
+        return self.serializer.to_representation_many(
+            self._cursor_paginated(
+                await _resolve_objects(self.list(params, meta, **kwargs)),
+                params, meta
+            ),
+            lazy=self.streaming,
+            fields=params.get('fields'),
+        )
@@ -1,14 +1,242 @@
-import json
+import hashlib
 import inspect
 from collections import OrderedDict
+from collections.abc import Iterator
+from contextlib import contextmanager
+from itertools import chain, repeat
 from warnings import warn
 
 from falcon import errors
 import falcon
-from mimeparse import parse_mime_type
+from mimeparse import parse_mime_type, best_match
 
+from graceful.codecs import get_default_codec
 from graceful.parameters import BaseParam, IntParam
-from graceful.errors import DeserializationError, ValidationError
+from graceful.errors import (
+    BulkValidationError, DeserializationError, ValidationError
+)
+from graceful.timing import PhaseTimer, TIMER_CONTEXT_KEY
+
+
+# note: set in request context while the outermost timed block is running
+_TIMING_SCOPE_KEY = 'graceful.timing_scope'
+
+
+def _as_bytes(encoded):
+    """Return encoded document as ``bytes`` instance."""
+    return encoded.encode('utf-8') if isinstance(encoded, str) else encoded
+
+
+def _set_body(resp, encoded):
+    """Set (or clear with ``None``) encoded body of the response.
+
+    Since falcon 3.0 ``resp.body`` is deprecated in favour of ``resp.text``
+    (for ``str``) and ``resp.data`` (for ``bytes``).
+    """
+    if not hasattr(resp, 'text'):
+        # future: remove when falcon<3.0 is no longer supported
+        resp.body = encoded
+    elif isinstance(encoded, str):
+        resp.text, resp.data = encoded, None
+    else:
+        resp.text, resp.data = None, encoded
+
+
+def _get_body(resp):
+    """Return encoded body of the response set with ``_set_body()``."""
+    if not hasattr(resp, 'text'):
+        # future: remove when falcon<3.0 is no longer supported
+        return resp.body
+
+    return resp.text if resp.text is not None else resp.data
+
+
+def _etag_matches(if_none_match, etag):
+    """Tell if ``If-None-Match`` header value matches given entity tag.
+
+    Uses the weak comparison function as required by RFC 7232 for the
+    ``If-None-Match`` header.
+
+    Args:
+        if_none_match: raw value of ``If-None-Match`` header or its value
+            parsed by falcon (list of entity tags since falcon 2.0). Can be
+            None.
+        etag (str): quoted entity tag of current representation
+
+    """
+    if not if_none_match:
+        return False
+
+    if isinstance(if_none_match, str):
+        candidates = if_none_match.split(',')
+    else:
+        # note: falcon>=2.0 parses header to unquoted ETag objects that
+        #       can be serialized back with their dumps() method
+        candidates = [
+            candidate.dumps() if hasattr(candidate, 'dumps') else candidate
+            for candidate in if_none_match
+        ]
+
+    for candidate in candidates:
+        candidate = candidate.strip()
+
+        if candidate.startswith('W/'):
+            candidate = candidate[2:]
+
+        if candidate == '*' or candidate == etag:
+            return True
+
+    return False
+
+
+def _validate_representations(serializer, representations, partial):
+    """Deserialize and validate list of representations.
+
+    This is a module level function so it can be submitted to process pool
+    executors (serializer instance is pickled together with the reference
+    to its class).
+
+    Args:
+        serializer (BaseSerializer): serializer instance
+        representations (list): list of representation dictionaries
+        partial (bool): set to True if partially complete representations
+            are accepted
+
+    Returns:
+        list: list of validated internal object dictionaries
+
+    Raises:
+        DeserializationError: on first invalid representation
+
+    """
+    object_dicts = []
+
+    for representation in representations:
+        object_dict = serializer.from_representation(representation)
+        serializer.validate(object_dict, partial)
+        object_dicts.append(object_dict)
+
+    return object_dicts
+
+
+#: Marker of parameter default value that could not be parsed in advance.
+_UNPARSED = object()
+
+
+def _compile_params_parser(params):
+    """Compile specialised query string parser for given parameters.
+
+    Default values of parameters are parsed in advance, required parameter
+    names are collected into single set and per-parameter converters are
+    pre-bound so the resulting function parses the query string in a single
+    pass over declared parameters.
+
+    Args:
+        params (OrderedDict): resource parameters storage
+
+    Returns:
+        function: function that accepts ``falcon.Request`` object and returns
+        dictionary of parsed parameter values (see:
+        :meth:`BaseResource.require_params`).
+
+    """
+    required = frozenset(
+        name for name, param in params.items() if param.required
+    )
+    entries = []
+
+    for name, param in params.items():
+        if (
+            not param.validators and
+            type(param).validated_value is BaseParam.validated_value
+        ):
+            # note: there is nothing to validate so we can skip one call
+            convert = param.value
+        else:
+            convert = param.validated_value
+
+        default = _UNPARSED
+
+        if param.default:
+            try:
+                default = param.validated_value(param.default)
+            except ValueError:
+                # note: invalid defaults are reported on every request
+                #       exactly like invalid query string values
+                pass
+
+        entries.append(
+            (name, param.many, param.container, convert,
+             param.default, default)
+        )
+
+    entries = tuple(entries)
+
+    def parse(req):
+        query = req.params
+
+        if required:
+            missing = required.difference(query)
+
+            if missing:
+                # note: for client convenience we list all missing params
+                #       that are required instead of single one
+                raise errors.HTTPMissingParam(", ".join(missing))
+
+        parsed = {}
+
+        for name, many, container, convert, raw_default, default in entries:
+            # note: lack of key in output dict means that param was not
+            #       specified and it does not have default value. Using None
+            #       would not be as good because param class can also return
+            #       None from `.value()` method as a valid translated value.
+            value = query.get(name)
+
+            try:
+                if value is not None:
+                    if many:
+                        # note: multiple occurrences of param in query string
+                        #       are already represented as a list
+                        if not isinstance(value, list):
+                            value = [value]
+
+                        try:
+                            values = [convert(item) for item in value]
+                        except ValueError:
+                            # note: falcon's get_param_as_list() compatibility
+                            raise errors.HTTPInvalidParam(
+                                'The value is not formatted correctly.', name
+                            )
+
+                        parsed[name] = container(values)
+                    else:
+                        # note: if many==False and query parameter occurs
+                        #       multiple times in qs then it is
+                        #       **unspecified** which one will be used. See:
+                        # http://falcon.readthedocs.org/en/latest/api/request_and_response.html#falcon.Request.get_param  # noqa
+                        if isinstance(value, list):
+                            value = value[-1]
+
+                        parsed[name] = convert(value)
+
+                elif raw_default:
+                    if default is _UNPARSED:
+                        default = convert(raw_default)
+
+                    parsed[name] = container([default]) if many else default
+
+            except ValidationError as err:
+                # ValidationError allows to easily translate itself to
+                # to falcon's HTTPInvalidParam (Bad Request HTTP response)
+                raise err.as_invalid_param(name)
+
+            except ValueError as err:
+                # Other parsing issues are expected to raise ValueError
+                raise errors.HTTPInvalidParam(str(err), name)
+
+        return parsed
+
+    return parse
 
 
 class MetaResource(type):
@@ -72,6 +300,7 @@ class MetaResource(type):
     def __init__(cls, name, bases, namespace, **kwargs):
         """Perform some additional class object initialization."""
         super().__init__(name, bases, namespace)
+        mcs = type(cls)
 
         try:
             # note: attribute is stored only if with_context keyword
@@ -83,6 +312,12 @@ class MetaResource(type):
         except KeyError:
             pass
 
+        # note: parser is stored as static method because it does not
+        #       operate on resource instances
+        cls._params_parser = staticmethod(
+            _compile_params_parser(getattr(cls, mcs._params_storage_key))
+        )
+
 
 class BaseResource(metaclass=MetaResource):
     """Base resouce class with core param and response functionality.
@@ -122,6 +357,69 @@ class BaseResource(metaclass=MetaResource):
     #: validate resource representations.
     serializer = None
 
+    #: Codec used to encode response bodies and decode request bodies. If not
+    #: set then global default codec is used
+    #: (see: :func:`graceful.codecs.set_default_codec`).
+    #:
+    #: .. versionadded:: 0.7.0
+    codec = None
+
+    #: Additional codecs (see :any:`graceful.codecs`) available to clients
+    #: through content negotiation. Request bodies are decoded with the codec
+    #: matching the ``Content-Type`` header and responses are encoded with
+    #: the codec that best matches the ``Accept`` header. The resource
+    #: ``codec`` is always supported and preferred.
+    #:
+    #: .. versionadded:: 0.7.0
+    media_handlers = ()
+
+    #: Minimal size (in bytes) of chunks written to streamed response
+    #: bodies. See :meth:`make_stream_body`.
+    #:
+    #: .. versionadded:: 0.7.0
+    stream_chunk_size = 64 * 1024
+
+    #: Executor (e.g. ``concurrent.futures.ProcessPoolExecutor`` instance)
+    #: used to deserialize and validate large bulk payloads in parallel.
+    #: Executor is not managed by resource so it can be shared between
+    #: resources. See :meth:`require_validated`.
+    #:
+    #: .. versionadded:: 0.7.0
+    validation_executor = None
+
+    #: Minimal number of items in bulk payload that will be validated with
+    #: the ``validation_executor``. Smaller payloads are validated in the
+    #: current thread because of the inter-process communication overhead.
+    #:
+    #: .. versionadded:: 0.7.0
+    validation_executor_threshold = 1000
+
+    #: Number of payload items in single chunk submitted to the
+    #: ``validation_executor``.
+    #:
+    #: .. versionadded:: 0.7.0
+    validation_chunk_size = 250
+
+    #: Set to ``False`` if resource description depends on anything else
+    #: than the request path and the negotiated media type. Otherwise
+    #: ``OPTIONS`` responses are encoded only once per media type.
+    #: See :meth:`on_options`.
+    #:
+    #: .. versionadded:: 0.7.0
+    cache_description = True
+
+    #: Timing sink (see: :any:`graceful.timing`) that receives durations of
+    #: request handling phases. Timing is disabled by default.
+    #:
+    #: .. versionadded:: 0.7.0
+    timing_sink = None
+
+    #: Set to ``True`` in order to report durations of request handling
+    #: phases to clients in the ``Server-Timing`` response header.
+    #:
+    #: .. versionadded:: 0.7.0
+    server_timing = False
+
     def __new__(cls, *args, **kwargs):
         """Do some sanity checks before resource instance initialization."""
         instance = super().__new__(cls)
@@ -143,6 +441,9 @@ class BaseResource(metaclass=MetaResource):
                 """.format(cls),
                 FutureWarning
             )
+
+        # note: encoded descriptions are cached per codec (see on_options())
+        instance._description_cache = {}
         return instance
 
     @property
@@ -150,8 +451,91 @@ class BaseResource(metaclass=MetaResource):
         """Return dictionary of parameter definition objects."""
         return getattr(self, self.__class__._params_storage_key)
 
+    def get_codec(self):
+        """Return codec used to encode and decode representations.
+
+        Returns:
+            BaseCodec: resource codec or the global default codec.
+
+        .. versionadded:: 0.7.0
+        """
+        return self.codec or get_default_codec()
+
+    def get_media_handlers(self):
+        """Return all codecs supported by the resource.
+
+        Returns:
+            OrderedDict: mapping of media types to codecs. The resource
+            ``codec`` (preferred one) is always the first.
+
+        .. versionadded:: 0.7.0
+        """
+        codec = self.get_codec()
+        handlers = OrderedDict([(codec.media_type, codec)])
+
+        for handler in self.media_handlers:
+            handlers.setdefault(handler.media_type, handler)
+
+        return handlers
+
+    def negotiate_codec(self, req):
+        """Choose codec for response body using request ``Accept`` header.
+
+        If none of supported media types is acceptable for the client then
+        the resource ``codec`` is used anyway.
+
+        Args:
+            req (falcon.Request): request object
+
+        Returns:
+            BaseCodec: codec for response body
+
+        .. versionadded:: 0.7.0
+        """
+        codec = self.get_codec()
+        accept = req.get_header('Accept')
+
+        if not (self.media_handlers and accept):
+            return codec
+
+        handlers = self.get_media_handlers()
+
+        try:
+            # note: on ties best_match() prefers latter media types
+            return handlers.get(
+                best_match(list(reversed(handlers)), accept), codec
+            )
+        except ValueError:
+            return codec
+
+    def negotiate_content_type(self, req, resp):
+        """Set response content type negotiated with the client.
+
+        Response bodies created later with :meth:`make_body` are encoded with
+        the codec of negotiated content type.
+
+        Args:
+            req (falcon.Request): request object
+            resp (falcon.Response): response object
+
+        .. versionadded:: 0.7.0
+        """
+        resp.content_type = self.negotiate_codec(req).media_type
+
+        if self.media_handlers:
+            resp.append_header('Vary', 'Accept')
+
+    def _get_response_codec(self, resp):
+        """Return codec for content type already set on response object."""
+        if self.media_handlers:
+            return self.get_media_handlers().get(
+                resp.content_type, self.get_codec()
+            )
+
+        return self.get_codec()
+
     def make_body(self, resp, params, meta, content):
-        """Construct response body in ``resp`` object using JSON serialization.
+        """Construct response body in ``resp`` object using resource codec.
 
         Args:
             resp (falcon.Response): response object where to include
@@ -165,17 +549,99 @@ class BaseResource(metaclass=MetaResource):
         Returns:
             None
 
+        .. versionchanged:: 0.7.0
+           If ``content`` is an iterator then response body is streamed
+           using the :meth:`make_stream_body` method. If content type was
+           negotiated with :meth:`negotiate_content_type` then body is
+           encoded with the matching codec.
         """
+        if isinstance(content, Iterator):
+            return self.make_stream_body(resp, params, meta, content)
+
         response = {
             'meta': meta,
             'content': content
         }
-        resp.content_type = 'application/json'
-        resp.body = json.dumps(
-            response,
-            indent=params['indent'] or None if 'indent' in params else None
+        codec = self._get_response_codec(resp)
+        resp.content_type = codec.media_type
+        _set_body(
+            resp, codec.dumps(response, indent=self._get_indent(params))
         )
 
+    def make_stream_body(self, resp, params, meta, content):
+        """Construct streamed response body in ``resp`` object using JSON.
+
+        Response is written to ``resp.stream`` as incremental JSON chunks:
+        beginning of the envelope, then content items encoded one by one
+        and finally the 'meta' section. Meta is encoded only after all content
+        items were consumed so it can be populated during iteration. This way
+        peak memory does not depend on the number of streamed items.
+
+        Note:
+            Content items are consumed after response headers are sent so
+            any exception raised during iteration cannot be translated to
+            HTTP error response anymore.
+
+        Note:
+            Only JSON responses can be streamed. If other content type was
+            negotiated then content is consumed and encoded as a whole
+            using :meth:`make_body`.
+
+        Args:
+            resp (falcon.Response): response object where to include
+                serialized body
+            params (dict): dictionary of parsed parameters
+            meta (dict): dictionary of metadata to be included in 'meta'
+                section of response
+            content (iterator): iterator over content items (resource
+                representations) to be included in 'content' section of
+                response
+
+        Returns:
+            None
+
+        .. versionadded:: 0.7.0
+        """
+        codec = self._get_response_codec(resp)
+
+        if codec.media_type != 'application/json':
+            return self.make_body(resp, params, meta, list(content))
+
+        resp.content_type = codec.media_type
+        resp.stream = self._iter_stream_chunks(
+            codec, meta, content, self._get_indent(params)
+        )
+
+    def _iter_stream_chunks(self, codec, meta, content, indent):
+        """Iterate over encoded chunks of streamed JSON response body."""
+        chunk_size = self.stream_chunk_size
+
+        buffer = [b'{"content": [']
+        buffered = 0
+        separator = b''
+
+        for item in content:
+            encoded = _as_bytes(codec.dumps(item, indent=indent))
+            buffer.append(separator)
+            buffer.append(encoded)
+            buffered += len(encoded)
+            separator = b', '
+
+            if buffered >= chunk_size:
+                yield b''.join(buffer)
+                buffer = []
+                buffered = 0
+
+        buffer.append(b'], "meta": ')
+        buffer.append(_as_bytes(codec.dumps(meta, indent=indent)))
+        buffer.append(b'}')
+        yield b''.join(buffer)
+
+    @staticmethod
+    def _get_indent(params):
+        """Get JSON output indentation from parsed parameters."""
+        return params['indent'] or None if 'indent' in params else None
+
     def allowed_methods(self):
         """Return list of allowed HTTP methods on this resource.
 
@@ -243,7 +709,9 @@ class BaseResource(metaclass=MetaResource):
         #       provided in order to make auto-documentation engines simpler
         if req:
             description['path'] = req.path
+            description['media_type'] = self.negotiate_codec(req).media_type
 
+        description['media_types'] = list(self.get_media_handlers())
         description.update(**kwargs)
         return description
 
@@ -263,76 +731,96 @@ class BaseResource(metaclass=MetaResource):
         .. versionchanged:: 0.2.0
            Default ``OPTIONS`` responses include ``Allow`` header with list of
            allowed HTTP methods.
+
+        .. versionchanged:: 0.7.0
+           Description is encoded with the codec negotiated with the client.
+           It is encoded only once per media type (see:
+           ``cache_description``) and served with strong ``ETag`` header.
+           Requests with matching ``If-None-Match`` header are answered
+           with ``304 Not Modified``.
         """
-        resp.set_header('Allow', ', '.join(self.allowed_methods()))
-        resp.body = json.dumps(self.describe(req, resp))
-        resp.content_type = 'application/json'
+        self.negotiate_content_type(req, resp)
+        codec = self._get_response_codec(resp)
 
-    def require_params(self, req):
-        """Require all defined parameters from request query string.
+        if not self.cache_description:
+            resp.set_header('Allow', ', '.join(self.allowed_methods()))
+            _set_body(resp, codec.dumps(self.describe(req, resp)))
+            return
 
-        Raises ``falcon.errors.HTTPMissingParam`` exception if any of required
-        parameters is missing and ``falcon.errors.HTTPInvalidParam`` if any
-        of parameters could not be understood (wrong format).
+        try:
+            allow, prefix, suffix, etag = self._description_cache[codec]
+        except KeyError:
+            allow, prefix, suffix, etag = self._cache_description(
+                req, resp, codec
+            )
+
+        resp.set_header('Allow', allow)
+        resp.etag = etag
+
+        if _etag_matches(req.get_header('If-None-Match'), etag):
+            resp.status = falcon.HTTP_NOT_MODIFIED
+        else:
+            # note: request path is the only part that needs to be encoded
+            _set_body(
+                resp, prefix + _as_bytes(codec.dumps(req.path)) + suffix
+            )
+
+    def _cache_description(self, req, resp, codec):
+        """Encode and cache resource description for given codec.
+
+        Description is encoded with placeholder in place of the request path
+        and split around it so cached parts can be joined with any encoded
+        path later.
 
         Args:
             req (falcon.Request): request object
+            resp (falcon.Response): response object
+            codec (BaseCodec): codec negotiated with the client
+
+        Returns:
+            tuple: ``(allow, prefix, suffix, etag)`` tuple where ``allow`` is
+            the value of ``Allow`` header and ``prefix`` and ``suffix`` are
+            parts of encoded description.
 
         """
-        params = {}
-
-        for name, param in self.params.items():
-            if name not in req.params and param.required:
-                # we could simply raise with this single param or use get_param
-                # with required=True parameter but for client convenience
-                # we prefer to list all missing params that are required
-                missing = set(
-                    p for p in self.params
-                    if self.params[p].required
-                ) - set(req.params.keys())
+        placeholder = '\x00path\x00'
+        description = self.describe(req, resp)
+        description['path'] = placeholder
+
+        encoded = _as_bytes(codec.dumps(description))
+        parts = encoded.split(_as_bytes(codec.dumps(placeholder)))
+
+        if len(parts) != 2:  # pragma: nocover
+            # note: this could happen only if the description already
+            #       contained placeholder so we can't use cache at all
+            raise RuntimeError("Could not cache resource description")
+
+        entry = (
+            ', '.join(self.allowed_methods()),
+            parts[0],
+            parts[1],
+            '"{}"'.format(hashlib.sha1(encoded).hexdigest()),
+        )
 
-                raise errors.HTTPMissingParam(", ".join(missing))
+        self._description_cache[codec] = entry
+        return entry
 
-            elif name in req.params or param.default:
-                # Note: lack of key in req.params means it was not specified
-                # so unless there is default value it will not be included in
-                # output params dict.
-                # This way we have explicit information that param was
-                # not specified. Using None would not be as good because param
-                # class can also return None from `.value()` method as a valid
-                # translated value.
-                try:
-                    if param.many:
-                        # params with "many" enabled need special care
-                        values = req.get_param_as_list(
-                            # note: falcon allows to pass value handler using
-                            #       `transform` param so we do not need to
-                            #       iterate through list manually
-                            name, param.validated_value
-                        ) or [
-                            param.default and
-                            param.validated_value(param.default)
-                        ]
-                        params[name] = param.container(values)
-                    else:
-                        # note that if many==False and query parameter
-                        # occurs multiple times in qs then it is
-                        # **unspecified** which one will be used. See:
-                        # http://falcon.readthedocs.org/en/latest/api/request_and_response.html#falcon.Request.get_param  # noqa
-                        params[name] = param.validated_value(
-                            req.get_param(name, default=param.default)
-                        )
+    def require_params(self, req):
+        """Require all defined parameters from request query string.
 
-                except ValidationError as err:
-                    # ValidationError allows to easily translate itself to
-                    # to falcon's HTTPInvalidParam (Bad Request HTTP response)
-                    raise err.as_invalid_param(name)
+        Raises ``falcon.errors.HTTPMissingParam`` exception if any of required
+        parameters is missing and ``falcon.errors.HTTPInvalidParam`` if any
+        of parameters could not be understood (wrong format).
 
-                except ValueError as err:
-                    # Other parsing issues are expected to raise ValueError
-                    raise errors.HTTPInvalidParam(str(err), name)
+        Args:
+            req (falcon.Request): request object
 
-        return params
+        .. versionchanged:: 0.7.0
+           Query string is parsed with the parser compiled once per resource
+           class. Default values of parameters are parsed only once so
+           parameter classes should return immutable values.
+        """
+        return self._params_parser(req)
 
     def require_meta_and_content(self, content_handler, params, **kwargs):
         """Require 'meta' and 'content' dictionaries using proper hander.
@@ -364,7 +852,9 @@ class BaseResource(metaclass=MetaResource):
         allowed content-encoding handler to decode content body.
 
         Note:
-            Currently only JSON is allowed as content type.
+            Only media types of the resource ``codec`` (JSON by default) and
+            the codecs listed in ``media_handlers`` are allowed as
+            content type.
 
         Args:
             req (falcon.Request): request object
@@ -372,6 +862,23 @@ class BaseResource(metaclass=MetaResource):
         Returns:
             dict: raw dictionary of representation supplied in request body
 
+        """
+        # note: codecs decode directly from bytes so there is no need
+        #       for intermediate copy of decoded request body
+        return self._require_request_codec(req).loads(req.stream.read())
+
+    def _require_request_codec(self, req):
+        """Require codec for the content type of request body.
+
+        Args:
+            req (falcon.Request): request object
+
+        Returns:
+            BaseCodec: codec for the content type of request body
+
+        Raises:
+            falcon.HTTPUnsupportedMediaType: if content type is not supported
+
         """
         try:
             type_, subtype, _ = parse_mime_type(req.content_type)
@@ -383,14 +890,66 @@ class BaseResource(metaclass=MetaResource):
                 )
             )
 
-        if content_type == 'application/json':
-            body = req.stream.read()
-            return json.loads(body.decode('utf-8'))
+        handlers = self.get_media_handlers()
+
+        if content_type in handlers:
+            return handlers[content_type]
         else:
             raise falcon.HTTPUnsupportedMediaType(
-                description="only JSON supported, got: {}".format(content_type)
+                description="only {} supported, got: {}".format(
+                    ", ".join(handlers), content_type
+                )
             )
 
+    def _get_timer(self, req):
+        """Return phase timer of the request or ``None`` if timing is off.
+
+        Timer is created on first use and stored in the request context so
+        phases measured before and during ``handle()`` are reported together.
+
+        """
+        if self.timing_sink is None and not self.server_timing:
+            return None
+
+        timer = req.context.get(TIMER_CONTEXT_KEY)
+
+        if timer is None:
+            timer = req.context[TIMER_CONTEXT_KEY] = PhaseTimer()
+
+        return timer
+
+    @contextmanager
+    def _timed(self, req, resp):
+        """Measure request handling phases within the ``with`` block.
+
+        Yields phase timer of the request (or ``None`` if timing is off).
+        Timings are reported when the outermost timed block exits, also if
+        exception was raised, so error responses get ``Server-Timing``
+        header as well.
+
+        """
+        timer = self._get_timer(req)
+
+        if timer is None or req.context.get(_TIMING_SCOPE_KEY):
+            yield timer
+            return
+
+        req.context[_TIMING_SCOPE_KEY] = True
+
+        try:
+            yield timer
+        finally:
+            req.context[_TIMING_SCOPE_KEY] = False
+            self._report_timings(req, resp, timer)
+
+    def _report_timings(self, req, resp, timer):
+        """Report measured phases to the sink and ``Server-Timing`` header."""
+        if self.timing_sink is not None:
+            self.timing_sink.record(self, req, timer.phases)
+
+        if self.server_timing:
+            resp.set_header('Server-Timing', timer.server_timing())
+
     def require_validated(self, req, partial=False, bulk=False):
         """Require fully validated internal object dictionary.
 
@@ -410,25 +969,66 @@ class BaseResource(metaclass=MetaResource):
             dict: dictionary of fields and values representing internal object.
                 Each value is a result of ``field.from_representation`` call.
 
+        Note:
+            If ``validation_executor`` is set then bulk payloads with at least
+            ``validation_executor_threshold`` items are split into chunks of
+            ``validation_chunk_size`` items that are deserialized and
+            validated in parallel. Results are merged in payload order and
+            the error of first invalid item is reported just like during
+            validation in the current thread.
+
+        .. versionchanged:: 0.7.0
+           Decoding and validation are measured as the ``decode`` and
+           ``validate`` phases if timing is enabled (see: ``timing_sink``).
         """
-        representations = [
-            self.require_representation(req)
-        ] if not bulk else self.require_representation(req)
+        timer = self._get_timer(req)
+
+        if timer is None:
+            return self._validate_payload(
+                self.require_representation(req), partial, bulk
+            )
+
+        timer.start()
+        payload = self.require_representation(req)
+        timer.lap('decode')
+        validated = self._validate_payload(payload, partial, bulk)
+        timer.lap('validate')
+        return validated
+
+    def _validate_payload(self, payload, partial=False, bulk=False):
+        """Validate decoded request payload and translate errors to HTTP 400.
+
+        Args:
+            payload: raw representation (or list of representations if
+                ``bulk`` is True) decoded from request body
+            partial (bool): set to True if partially complete representation
+                is accepted
+            bulk (bool): set to True if payload represents multiple resources
+
+        Returns:
+            dict: internal object dictionary (or list of them on ``bulk``)
+
+        """
+        representations = [payload] if not bulk else payload
 
         if bulk and not isinstance(representations, list):
             raise ValidationError(
                 "Request payload should represent a list of resources."
             ).as_bad_request()
 
-        object_dicts = []
-
         try:
-            for representation in representations:
-                object_dict = self.serializer.from_representation(
-                    representation
+            if (
+                bulk and
+                self.validation_executor is not None and
+                len(representations) >= self.validation_executor_threshold
+            ):
+                object_dicts = self._validate_in_executor(
+                    representations, partial
+                )
+            else:
+                object_dicts = _validate_representations(
+                    self.serializer, representations, partial
                 )
-                self.serializer.validate(object_dict, partial)
-                object_dicts.append(object_dict)
 
         except DeserializationError as err:
             # when working on Resource we know that we can finally raise
@@ -441,3 +1041,110 @@ class BaseResource(metaclass=MetaResource):
             raise err.as_bad_request()
 
         return object_dicts if bulk else object_dicts[0]
+
+    def _validate_in_executor(self, representations, partial):
+        """Validate representations in chunks using ``validation_executor``.
+
+        Args:
+            representations (list): list of representation dictionaries
+            partial (bool): set to True if partially complete representations
+                are accepted
+
+        Returns:
+            list: list of validated internal object dictionaries in order of
+            representations
+
+        """
+        size = self.validation_chunk_size
+        chunks = [
+            representations[start:start + size]
+            for start in range(0, len(representations), size)
+        ]
+        # note: map() yields results in order of submitted chunks so errors
+        #       are raised in the same order as on sequential validation
+        results = self.validation_executor.map(
+            _validate_representations,
+            repeat(self.serializer), chunks, repeat(partial),
+        )
+        return list(chain.from_iterable(results))
+
+    def require_validated_batches(self, req, partial=False, batch_size=100):
+        """Require validated internal objects decoded incrementally in batches.
+
+        This is the streaming counterpart of ``require_validated(req,
+        bulk=True)``. Elements of the array payload are decoded from the
+        request stream one by one (see: :meth:`BaseCodec.iterloads`) and are
+        validated as soon as they are decoded. So memory usage is bounded by
+        the batch size instead of the size of whole request payload.
+
+        Content type is checked immediately but the payload is decoded only
+        when returned iterator is consumed. Validation errors of all items
+        are collected together with item indices and reported with single
+        ``falcon.HTTPBadRequest`` exception raised from the iterator after
+        whole payload is read (see:
+        :meth:`graceful.errors.BulkValidationError.as_bad_request`). No more
+        batches are yielded after first invalid item so any changes made with
+        already yielded batches should be reverted (e.g. with storage
+        transaction) when iteration fails.
+
+        Args:
+            req (falcon.Request): request object
+            partial (bool): set to True if partially complete representations
+                are accepted.
+            batch_size (int): maximum number of object dictionaries in single
+                batch.
+
+        Returns:
+            iterator over lists of validated internal object dictionaries
+
+        .. versionadded:: 0.7.0
+        """
+        codec = self._require_request_codec(req)
+        return self._iter_validated_batches(
+            codec.iterloads(req.stream, self.stream_chunk_size),
+            partial, batch_size
+        )
+
+    def _iter_validated_batches(self, representations, partial, batch_size):
+        """Iterate over batches of validated internal object dictionaries."""
+        batch = []
+        failed = {}
+
+        try:
+            for index, representation in enumerate(representations):
+                try:
+                    if not isinstance(representation, dict):
+                        raise ValidationError("item should be object")
+
+                    object_dict = self.serializer.from_representation(
+                        representation
+                    )
+                    self.serializer.validate(object_dict, partial)
+
+                except (DeserializationError, ValidationError) as err:
+                    failed[index] = err
+                    continue
+
+                if failed:
+                    # note: request will fail anyway so we only need to
+                    #       collect errors of remaining items
+                    continue
+
+                batch.append(object_dict)
+
+                if len(batch) >= batch_size:
+                    yield batch
+                    batch = []
+
+        except ValueError as err:
+            raise falcon.HTTPBadRequest(
+                title="Malformed request payload",
+                description="Request payload should represent a list of "
+                            "resources: {}".format(err)
+            )
+
+        if failed:
+            raise BulkValidationError(failed).as_bad_request()
+
+        if batch:
+            yield batch
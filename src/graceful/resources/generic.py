@@ -1,5 +1,10 @@
 from functools import partial
+from itertools import chain
+import logging
 
+import falcon
+
+from graceful.errors import DeserializationError, ValidationError
 from graceful.resources.base import BaseResource
 from graceful.resources.mixins import (
     RetrieveMixin,
@@ -8,10 +13,66 @@ from graceful.resources.mixins import (
     CreateMixin,
     DeleteMixin,
     PaginatedMixin,
-    CreateBulkMixin
+    CursorPaginatedMixin,
+    CreateBulkMixin,
+    SparseFieldsetMixin,
 )
 
 
+logger = logging.getLogger(__name__)
+
+
+def _bulk_item_error(index, err):
+    """Describe failure of single item creation in multi-status response.
+
+    Unexpected errors (anything but HTTP and validation errors) are logged
+    with their tracebacks and reported as ``500 Internal Server Error``.
+
+    Args:
+        index (int): index of item in bulk creation payload
+        err (BaseException): exception raised by creation handler
+
+    Returns:
+        dict: error description with ``index``, ``status``, ``title`` and
+        ``description`` keys
+
+    """
+    if isinstance(err, (DeserializationError, ValidationError)):
+        err = err.as_bad_request()
+
+    if isinstance(err, falcon.HTTPError):
+        status, title, description = err.status, err.title, err.description
+    else:
+        # note: errors are converted outside of except blocks (e.g. results
+        #       of asyncio.gather) so traceback is taken from the exception
+        logger.error(
+            "Unexpected error while creating item %d in bulk", index,
+            exc_info=(type(err), err, err.__traceback__),
+        )
+        # note: details of unexpected errors are never exposed to clients
+        status, title, description = falcon.HTTP_500, falcon.HTTP_500, None
+
+    return {
+        'index': index,
+        'status': status,
+        'title': title,
+        'description': description,
+    }
+
+
+def _merge_item_metas(meta, metas):
+    """Merge meta dictionaries of concurrently created items.
+
+    Args:
+        meta (dict): meta dictionary of the whole response
+        metas (list): copies of ``meta`` passed to item creation handlers
+            (in payload order so values of later items take precedence)
+
+    """
+    for item_meta in metas:
+        meta.update(item_meta)
+
+
 class Resource(RetrieveMixin, BaseResource):
     """Basic retrieval of resource instance lists without serialization.
 
@@ -58,7 +119,7 @@ class ListResource(ListMixin, BaseResource):
     """
 
 
-class RetrieveAPI(RetrieveMixin, BaseResource):
+class RetrieveAPI(RetrieveMixin, SparseFieldsetMixin, BaseResource):
     """Generic Retrieve API with resource serialization.
 
     Generic resource that uses serializer for resource description,
@@ -69,6 +130,10 @@ class RetrieveAPI(RetrieveMixin, BaseResource):
     * GET: retrieve resource representation (handled with ``.retrieve()``
       method handler)
 
+    Representation can be narrowed down to the subset of fields using
+    the ``fields`` query string parameter (see:
+    :class:`graceful.resources.mixins.SparseFieldsetMixin`).
+
     """
 
     serializer = None
@@ -83,9 +148,14 @@ class RetrieveAPI(RetrieveMixin, BaseResource):
         )
 
     def _retrieve(self, params, meta, **kwargs):
-        return self.serializer.to_representation(
-            self.retrieve(params, meta, **kwargs)
-        )
+        obj = self.retrieve(params, meta, **kwargs)
+
+        if 'fields' in params:
+            return self.serializer.to_sparse_representation(
+                obj, params['fields']
+            )
+
+        return self.serializer.to_representation(obj)
 
     def on_get(self, req, resp, **kwargs):
         """Respond on GET requests using ``self.retrieve()`` handler."""
@@ -116,12 +186,13 @@ class RetrieveUpdateAPI(UpdateMixin, RetrieveAPI):
 
     def on_put(self, req, resp, **kwargs):
         """Respond on PUT requests using ``self.update()`` handler."""
-        validated = self.require_validated(req)
-        return super().on_put(
-            req, resp,
-            handler=partial(self._update, validated=validated),
-            **kwargs
-        )
+        with self._timed(req, resp):
+            validated = self.require_validated(req)
+            return super().on_put(
+                req, resp,
+                handler=partial(self._update, validated=validated),
+                **kwargs
+            )
 
 
 class RetrieveUpdateDeleteAPI(DeleteMixin, RetrieveUpdateAPI):
@@ -141,7 +212,7 @@ class RetrieveUpdateDeleteAPI(DeleteMixin, RetrieveUpdateAPI):
     """
 
 
-class ListAPI(ListMixin, BaseResource):
+class ListAPI(ListMixin, SparseFieldsetMixin, BaseResource):
     """Generic List API with resource serialization.
 
     Generic resource that uses serializer for resource description,
@@ -152,13 +223,30 @@ class ListAPI(ListMixin, BaseResource):
     * GET: list multiple resource instances representations (handled
       with ``.list()`` method handler)
 
+    If ``streaming`` is enabled then ``.list()`` handler may return any
+    iterator (e.g. a generator over database cursor) and response body will
+    be streamed item by item. In streaming mode the ``meta`` dictionary is
+    encoded after all items are listed so the handler can still populate it
+    during iteration.
+
+    Representations can be narrowed down to the subset of fields using
+    the ``fields`` query string parameter (see:
+    :class:`graceful.resources.mixins.SparseFieldsetMixin`).
+
     """
 
+    #: Set to ``True`` in order to stream list responses with bounded memory
+    #: usage. See :meth:`BaseResource.make_stream_body`.
+    #:
+    #: .. versionadded:: 0.7.0
+    streaming = False
+
     def _list(self, params, meta, **kwargs):
-        return [
-            self.serializer.to_representation(obj)
-            for obj in self.list(params, meta, **kwargs)
-        ]
+        return self.serializer.to_representation_many(
+            self.list(params, meta, **kwargs),
+            lazy=self.streaming,
+            fields=params.get('fields'),
+        )
 
     def describe(self, req=None, resp=None, **kwargs):
         """Extend default endpoint description with serializer description."""
@@ -189,52 +277,173 @@ class ListCreateAPI(CreateMixin, CreateBulkMixin, ListAPI):
     * PATCH: create multiple resources from list of representations provided
       in request body (handled with ``.create_bulk()`` method handler.
 
+    If ``bulk_streaming`` is enabled then PATCH request payload is decoded
+    and validated incrementally and ``.create_bulk()`` handler receives
+    iterator over batches (lists) of validated items as ``validated``
+    argument instead of the list of all items. See
+    :meth:`BaseResource.require_validated_batches`. The default
+    ``.create_bulk()`` handler reads and validates the whole payload before
+    creating any item so invalid payloads never leave partially created
+    items.
+
+    If ``create_bulk_executor`` is set then the default ``.create_bulk()``
+    handler calls ``.create()`` for multiple items concurrently. Failures
+    of single items do not abort the whole request. They are reported in
+    ``meta['errors']`` list and the response has ``207 Multi-Status`` status
+    code. Content of the response keeps the order of payload items and
+    contains ``None`` in place of each item that could not be created.
+    Custom ``.create_bulk()`` handlers can report failures the same way.
+
     """
 
+    #: Executor (e.g. ``concurrent.futures.ThreadPoolExecutor``) used by the
+    #: default ``.create_bulk()`` handler to call ``.create()`` for multiple
+    #: items concurrently. Number of executor workers bounds the number of
+    #: concurrent ``.create()`` calls so ``.create()`` handler and storage
+    #: must be thread-safe. ``None`` means sequential creation.
+    #:
+    #: .. versionadded:: 0.7.0
+    create_bulk_executor = None
+
+    #: Set to ``True`` in order to decode and validate bulk creation
+    #: payloads incrementally with bounded memory usage.
+    #:
+    #: .. versionadded:: 0.7.0
+    bulk_streaming = False
+
+    #: Maximum number of validated items in single batch passed to the
+    #: ``.create_bulk()`` handler when ``bulk_streaming`` is enabled.
+    #:
+    #: .. versionadded:: 0.7.0
+    bulk_batch_size = 100
+
     def _create(self, params, meta, **kwargs):
         return self.serializer.to_representation(
             self.create(params, meta, **kwargs)
         )
 
-    def _create_bulk(self, params, meta, **kwargs):
+    def _create_bulk(self, params, meta, failed, **kwargs):
+        created = self.create_bulk(params, meta, **kwargs)
+        failed.extend(meta.get('errors', ()))
+
+        if not failed:
+            return self.serializer.to_representation_many(created)
+
+        indices = {error['index'] for error in failed}
         return [
+            None if index in indices else
             self.serializer.to_representation(obj)
-            for obj in self.create_bulk(params, meta, **kwargs)
+            for index, obj in enumerate(created)
         ]
 
     def create_bulk(self, params, meta, **kwargs):
         """Create items in bulk by reusing existing ``.create()`` handler.
 
+        If ``create_bulk_executor`` is set then items are created
+        concurrently and failed items are reported in ``meta['errors']``.
+
+        If ``bulk_streaming`` is enabled then all batches are validated
+        before the first item is created so request with any invalid item
+        fails with ``400 Bad Request`` without creating anything.
+
         .. note::
             This is default create_bulk implementation that may not be safe
             to use in production environment depending on your implementation
             of ``.create()`` method handler.
         """
         validated = kwargs.pop('validated')
+
+        if self.bulk_streaming:
+            # note: .create() is not transactional so the whole stream is
+            #       validated first and items of invalid payloads are never
+            #       partially created
+            validated = list(validated)
+        else:
+            validated = [validated]
+
+        if self.create_bulk_executor is not None:
+            return self._create_concurrently(params, meta, validated)
+
         return [
             self.create(params, meta, validated=item)
-            for item in validated
+            for item in chain.from_iterable(validated)
         ]
 
+    def _create_concurrently(self, params, meta, batches):
+        """Create items of batches concurrently with the bulk executor.
+
+        Args:
+            params (dict): dictionary of parsed parameters
+            meta (dict): dictionary of meta values attached to response
+            batches (iterable): iterable over lists of validated items
+
+        Returns:
+            list: created objects in payload order (``None`` for failed items)
+
+        """
+        created = []
+        errors = []
+
+        for batch in batches:
+            # note: every worker gets its own copy of meta so it is never
+            #       mutated concurrently
+            metas = [dict(meta) for _ in batch]
+            # note: futures are submitted per batch so number of pending
+            #       futures is bounded by the batch size
+            futures = [
+                self.create_bulk_executor.submit(
+                    self.create, params, item_meta, validated=item
+                )
+                for item, item_meta in zip(batch, metas)
+            ]
+
+            for future in futures:
+                try:
+                    created.append(future.result())
+                except Exception as err:
+                    errors.append(_bulk_item_error(len(created), err))
+                    created.append(None)
+
+            _merge_item_metas(meta, metas)
+
+        if errors:
+            meta['errors'] = errors
+
+        return created
+
     def on_post(self, req, resp, **kwargs):
         """Respond on POST requests using ``self.create()`` handler."""
-        validated = self.require_validated(req)
+        with self._timed(req, resp):
+            validated = self.require_validated(req)
 
-        return super().on_post(
-            req, resp,
-            handler=partial(self._create, validated=validated),
-            **kwargs
-        )
+            return super().on_post(
+                req, resp,
+                handler=partial(self._create, validated=validated),
+                **kwargs
+            )
 
     def on_patch(self, req, resp, **kwargs):
         """Respond on PATCH requests using ``self.create_bulk()`` handler."""
-        validated = self.require_validated(req, bulk=True)
+        failed = []
 
-        return super().on_patch(
-            req, resp,
-            handler=partial(self._create_bulk, validated=validated),
-            **kwargs
-        )
+        with self._timed(req, resp):
+            if self.bulk_streaming:
+                validated = self.require_validated_batches(
+                    req, batch_size=self.bulk_batch_size
+                )
+            else:
+                validated = self.require_validated(req, bulk=True)
+
+            super().on_patch(
+                req, resp,
+                handler=partial(
+                    self._create_bulk, validated=validated, failed=failed
+                ),
+                **kwargs
+            )
+
+        if failed:
+            resp.status = falcon.HTTP_MULTI_STATUS
 
 
 class PaginatedListAPI(PaginatedMixin, ListAPI):
@@ -253,10 +462,15 @@ class PaginatedListAPI(PaginatedMixin, ListAPI):
     """
 
     def _list(self, params, meta, **kwargs):
-        objects = super()._list(params, meta, **kwargs)
-        # note: we need to populate meta after objects are retrieved
-        self.add_pagination_meta(params, meta)
-        return objects
+        # note: page is trimmed before serialization so the overflow object
+        #       (see: fetch_extra_item) is never serialized
+        return self.serializer.to_representation_many(
+            self._paginate(
+                self.list(params, meta, **kwargs), params, meta, **kwargs
+            ),
+            lazy=self.streaming,
+            fields=params.get('fields'),
+        )
 
 
 class PaginatedListCreateAPI(PaginatedMixin, ListCreateAPI):
@@ -277,9 +491,45 @@ class PaginatedListCreateAPI(PaginatedMixin, ListCreateAPI):
     """
 
     def _list(self, params, meta, **kwargs):
-        objects = super()._list(
-            params, meta, **kwargs
+        # note: page is trimmed before serialization so the overflow object
+        #       (see: fetch_extra_item) is never serialized
+        return self.serializer.to_representation_many(
+            self._paginate(
+                self.list(params, meta, **kwargs), params, meta, **kwargs
+            ),
+            lazy=self.streaming,
+            fields=params.get('fields'),
+        )
+
+
+class CursorPaginatedListAPI(CursorPaginatedMixin, ListAPI):
+    """Generic List API with resource serialization and cursor pagination.
+
+    Generic resource that uses serializer for resource description,
+    serialization and validation.
+
+    Adds keyset (cursor) pagination to list of resources (see:
+    :class:`graceful.resources.mixins.CursorPaginatedMixin`). The ``list()``
+    handler receives decoded sort key of the cursor in ``params['cursor']``
+    and should return single page of objects. Cursors of the next and
+    previous pages are created from the sort keys of the first and the last
+    of returned objects.
+
+    Allowed methods:
+
+    * GET: list multiple resource instances representations (handled
+      with ``.list()`` method handler)
+
+    .. versionadded:: 0.7.0
+    """
+
+    def _list(self, params, meta, **kwargs):
+        # note: cursors are created from internal objects because sort key
+        #       fields do not need to be included in sparse representations
+        return self.serializer.to_representation_many(
+            self._cursor_paginated(
+                self.list(params, meta, **kwargs), params, meta
+            ),
+            lazy=self.streaming,
+            fields=params.get('fields'),
         )
-        # note: we need to populate meta after objects are retrieved
-        self.add_pagination_meta(params, meta)
-        return objects
@@ -1,12 +1,145 @@
+from collections.abc import Mapping
 from functools import partial
+import hashlib
+from itertools import islice
+import json
 
 import falcon
-from graceful.parameters import IntParam
-from graceful.resources.base import BaseResource
+from falcon import errors
+from graceful import signing
+from graceful.caching import CachedResponse, InMemoryCache
+from graceful.parameters import IntParam, StringParam
+from graceful.resources.base import (
+    BaseResource, _as_bytes, _etag_matches, _get_body, _set_body
+)
+
+
+_NOTHING = object()
 
 
 class BaseMixin:
-    """Base mixin class."""
+    """Base mixin class.
+
+    GET and HEAD requests handled by ``handle()`` support conditional
+    requests. Resource can implement cheap ``get_etag()`` and/or
+    ``get_last_modified()`` hooks that are called before the content handler
+    so requests for unchanged resources are answered with
+    ``304 Not Modified`` without running handler and serialization at all.
+    If resource does not provide entity tag then it can be optionally
+    computed from the encoded response body (see: ``hash_etags``).
+
+    Encoded responses of GET requests can be cached with the
+    ``response_cache`` (see: :any:`graceful.caching`). Cache keys are built
+    from the URI template variables, parsed parameters, negotiated content
+    type and the value returned by the ``get_cache_vary_key()`` hook (the
+    authenticated user on resources with context). Successful requests with
+    any other method invalidate all cached responses in the
+    ``cache_namespace`` of resource.
+
+    If ``timing_sink`` or ``server_timing`` is set (see:
+    :any:`graceful.timing`) then ``handle()`` measures following phases:
+
+    * ``params``: parsing of query string parameters.
+    * ``precondition``: content negotiation, conditional request evaluation
+      and response cache lookup.
+    * ``handler``: content handler (including conversion of objects to
+      representations in generic resources).
+    * ``render``: encoding of response body with ``make_body()`` (streamed
+      bodies are encoded later while they are sent).
+    * ``finalize``: computing entity tag and storing or invalidating cached
+      responses.
+
+    """
+
+    #: Response cache instance (see: :any:`graceful.caching`) used to cache
+    #: encoded responses of GET requests. Caching is disabled by default.
+    #:
+    #: .. versionadded:: 0.7.0
+    response_cache = None
+
+    #: Namespace of cached responses. Resources that represent the same data
+    #: (e.g. list and single item resources of the same collection) should
+    #: share namespace so writes invalidate cached responses of all of them.
+    #: Defaults to qualified name of resource class.
+    #:
+    #: .. versionadded:: 0.7.0
+    cache_namespace = None
+
+    #: Set to ``True`` in order to compute entity tags of GET responses as
+    #: hashes of encoded response bodies when ``get_etag()`` hook does not
+    #: return entity tag. Disabled by default because it costs hashing of
+    #: every response body while it only saves bandwidth (handler and
+    #: serialization still run on every request).
+    #:
+    #: .. versionadded:: 0.7.0
+    hash_etags = False
+
+    def get_etag(self, params, **kwargs):
+        """Return entity tag of current resource state for conditional GET.
+
+        This hook is called before the content handler so it should be cheap
+        (e.g. use row version or modification timestamp of resource). Default
+        implementation returns ``None`` which means that entity tag is not
+        known in advance.
+
+        Args:
+            params (dict): dictionary of parsed parameters
+            **kwargs: dictionary of values retrieved from route url template
+                by falcon (and ``context`` on resources with context).
+
+        Returns:
+            str: unquoted entity tag or ``None``
+
+        .. versionadded:: 0.7.0
+        """
+        return None
+
+    def get_last_modified(self, params, **kwargs):
+        """Return last modification time of resource for conditional GET.
+
+        This hook is called before the content handler so it should be cheap.
+        Default implementation returns ``None`` which means that modification
+        time is not known.
+
+        Args:
+            params (dict): dictionary of parsed parameters
+            **kwargs: dictionary of values retrieved from route url template
+                by falcon (and ``context`` on resources with context).
+
+        Returns:
+            datetime.datetime: naive UTC datetime or ``None``
+
+        .. versionadded:: 0.7.0
+        """
+        return None
+
+    def get_cache_vary_key(self, params, **kwargs):
+        """Return value that varies cached responses besides request URI.
+
+        Responses cached with ``response_cache`` are shared by all requests
+        with the same URI template variables, parameters and content type.
+        Resources that return different content depending on the request
+        context must return here everything the content depends on. Default
+        implementation returns the authenticated user (``context['user']``)
+        on resources with context and ``None`` otherwise.
+
+        Returned value becomes a part of the cache key through its
+        ``repr()`` so it must be unique for every distinct value (e.g. a
+        dict, string or tuple of user identifiers). Responses are not
+        cached at all if the value uses default ``object.__repr__()``
+        because it could be reused by different objects.
+
+        Args:
+            params (dict): dictionary of parsed parameters
+            **kwargs: dictionary of values retrieved from route url template
+                by falcon (and ``context`` on resources with context).
+
+        .. versionadded:: 0.7.0
+        """
+        if 'context' in kwargs:
+            return kwargs['context'].get('user')
+
+        return None
 
     def handle(self, handler, req, resp, **kwargs):
         """Handle given resource manipulation flow in consistent manner.
@@ -20,7 +153,12 @@ class BaseMixin:
         2. Use ``self.require_meta_and_content()`` method to construct ``meta``
            and ``content`` dictionaries that will be later used to create
            serialized response body.
-        3. Construct serialized response body using ``self.body()`` method.
+        3. Construct serialized response body using ``self.body()`` method
+           with content type negotiated using
+           ``self.negotiate_content_type()`` method.
+
+        GET and HEAD requests are additionally evaluated as conditional
+        requests (see: ``get_etag()`` and ``get_last_modified()``).
 
         Args:
              handler (method): resource manipulation method handler.
@@ -32,17 +170,279 @@ class BaseMixin:
         Returns:
              Content dictionary (preferably resource representation).
         """
+        with self._timed(req, resp) as timer:
+            params, cache_entry, answered = self._begin_handling(
+                req, resp, kwargs, timer
+            )
+
+            if answered:
+                return None
+
+            meta, content = self.require_meta_and_content(
+                self._bind_context(handler, req), params, **kwargs
+            )
+
+            if timer is not None:
+                timer.lap('handler')
+
+            self._finish_handling(
+                req, resp, params, meta, content, cache_entry, timer
+            )
+            return content
+
+    def _begin_handling(self, req, resp, kwargs, timer=None):
+        """Run the part of handling flow that precedes content handler.
+
+        Args:
+            req (falcon.Request): request object instance.
+            resp (falcon.Response): response object instance to be modified.
+            kwargs (dict): dictionary of values retrieved from route url
+                template
+            timer (PhaseTimer): timer of the request or ``None`` if timing
+                is disabled.
+
+        Returns:
+            tuple: three-tuple of parsed ``params``, response cache entry
+            (see: :meth:`_check_preconditions`) and flag telling if request
+            was already answered (not modified or from cache).
+
+        """
+        if timer is None:
+            params = self.require_params(req)
+            return (params,) + self._check_preconditions(
+                req, resp, params, kwargs
+            )
+
+        timer.start()
         params = self.require_params(req)
+        timer.lap('params')
+        cache_entry, answered = self._check_preconditions(
+            req, resp, params, kwargs
+        )
+        timer.lap('precondition')
+
+        return params, cache_entry, answered
+
+    def _check_preconditions(self, req, resp, params, kwargs):
+        """Negotiate content type and try to answer request without handler.
+
+        Returns:
+            tuple: two-tuple of response cache entry and flag telling if
+            request was already answered (not modified or from cache).
+            Cache entry is either ``None`` or two-tuple of cache key and
+            generation of cache namespace captured before handling request.
+
+        """
+        conditional = req.method in ('GET', 'HEAD')
+
+        self.negotiate_content_type(req, resp)
+
+        if conditional and self._not_modified(req, resp, params, **kwargs):
+            resp.status = falcon.HTTP_NOT_MODIFIED
+            return None, True
 
+        cache_key = None
+        if conditional and self.response_cache is not None:
+            cache_key = self._get_cache_key(req, resp, params, kwargs)
+
+        if cache_key is None:
+            return None, False
+
+        # note: generation is captured before content handler is called so
+        #       content of requests that run concurrently with invalidating
+        #       writes is never stored in cache
+        cache_entry = (
+            cache_key,
+            self.response_cache.generation(self._get_cache_namespace()),
+        )
+
+        if self._respond_from_cache(req, resp, cache_key):
+            return cache_entry, True
+
+        return cache_entry, False
+
+    def _bind_context(self, handler, req):
+        """Bind request context to handler if resource accepts context."""
         # future: remove in 1.x
         if getattr(self, '_with_context', False):
-            handler = partial(handler, context=req.context)
+            return partial(handler, context=req.context)
 
-        meta, content = self.require_meta_and_content(
-            handler, params, **kwargs
-        )
+        return handler
+
+    def _finish_handling(
+        self, req, resp, params, meta, content, cache_entry, timer=None
+    ):
+        """Run the part of handling flow that follows content handler."""
         self.make_body(resp, params, meta, content)
-        return content
+
+        if timer is not None:
+            timer.lap('render')
+
+        if req.method in ('GET', 'HEAD'):
+            self._finish_conditional(req, resp, cache_entry)
+        elif self.response_cache is not None:
+            self.response_cache.invalidate(self._get_cache_namespace())
+
+        if timer is not None:
+            timer.lap('finalize')
+
+    def _get_cache_namespace(self):
+        """Return namespace of cached responses of this resource."""
+        return self.cache_namespace or "{}.{}".format(
+            self.__class__.__module__, self.__class__.__qualname__
+        )
+
+    def _get_cache_key(self, req, resp, params, kwargs):
+        """Return response cache key for given request parameters.
+
+        Args:
+            req (falcon.Request): request object
+            resp (falcon.Response): response object with negotiated
+                content type
+            params (dict): dictionary of parsed parameters
+            kwargs (dict): dictionary of values retrieved from route url
+                template
+
+        Returns:
+            str: cache key or ``None`` if response must not be cached.
+
+        """
+        hook_kwargs = dict(kwargs)
+        # future: remove in 1.x
+        if getattr(self, '_with_context', False):
+            hook_kwargs['context'] = req.context
+
+        vary = self.get_cache_vary_key(params, **hook_kwargs)
+
+        if type(vary).__repr__ is object.__repr__:
+            # note: default repr contains only object id that can be reused
+            #       by other object (e.g. user) after this one is released
+            return None
+
+        return hashlib.sha1(repr((
+            resp.content_type,
+            sorted(kwargs.items()),
+            sorted(params.items()),
+            vary,
+        )).encode()).hexdigest()
+
+    def _respond_from_cache(self, req, resp, cache_key):
+        """Respond with cached response if one is available.
+
+        Cached response is considered stale if ``get_etag()`` hook already
+        provided entity tag that is different from the cached one.
+
+        Returns:
+            bool: True if response was taken from cache
+
+        """
+        cached = self.response_cache.get(
+            self._get_cache_namespace(), cache_key
+        )
+
+        if cached is None or (
+            resp.etag is not None and resp.etag != cached.etag
+        ):
+            return False
+
+        resp.content_type = cached.content_type
+
+        if cached.etag is not None:
+            resp.etag = cached.etag
+
+        if cached.etag is not None and _etag_matches(
+            req.get_header('If-None-Match'), cached.etag
+        ):
+            resp.status = falcon.HTTP_NOT_MODIFIED
+        else:
+            _set_body(resp, cached.body)
+
+        return True
+
+    def _finish_conditional(self, req, resp, cache_entry):
+        """Set entity tag of GET response and store it in response cache.
+
+        Entity tag is computed from encoded response body if it wasn't
+        provided by the ``get_etag()`` hook and ``hash_etags`` is enabled.
+        Response is not stored if cache namespace was invalidated after
+        the ``cache_entry`` generation was captured.
+
+        """
+        body = _get_body(resp)
+
+        if body is None:
+            # note: streamed response bodies are not known in advance
+            return
+
+        body = _as_bytes(body)
+
+        if resp.etag is None and self.hash_etags:
+            resp.etag = '"{}"'.format(hashlib.sha1(body).hexdigest())
+
+        if cache_entry is not None:
+            cache_key, generation = cache_entry
+            cached = CachedResponse(resp.content_type, body, resp.etag)
+
+            if generation is None:
+                self.response_cache.set(
+                    self._get_cache_namespace(), cache_key, cached
+                )
+            else:
+                self.response_cache.set(
+                    self._get_cache_namespace(), cache_key, cached,
+                    generation=generation,
+                )
+
+        if resp.etag is not None and _etag_matches(
+            req.get_header('If-None-Match'), resp.etag
+        ):
+            resp.status = falcon.HTTP_NOT_MODIFIED
+            _set_body(resp, None)
+
+    def _not_modified(self, req, resp, params, **kwargs):
+        """Evaluate conditional request using entity tag and time hooks.
+
+        Sets ``ETag`` and ``Last-Modified`` response headers if they are
+        provided by resource hooks.
+
+        Returns:
+            bool: True if resource was not modified since the version that
+            client already holds.
+
+        """
+        # future: remove in 1.x
+        if getattr(self, '_with_context', False):
+            kwargs['context'] = req.context
+
+        etag = self.get_etag(params, **kwargs)
+        last_modified = self.get_last_modified(params, **kwargs)
+
+        if etag is not None:
+            if self.media_handlers:
+                # note: representations in different media types must have
+                #       different strong entity tags
+                etag = "{}/{}".format(etag, resp.content_type)
+            resp.etag = '"{}"'.format(etag)
+
+        if last_modified is not None:
+            resp.last_modified = last_modified
+
+        # note: If-Modified-Since must be ignored if If-None-Match is present
+        #       (see RFC 7232 section 6)
+        # note: req.if_none_match is parsed differently depending on falcon
+        #       version so raw header value is used instead
+        if_none_match = req.get_header('If-None-Match')
+
+        if if_none_match is not None:
+            return etag is not None and _etag_matches(
+                if_none_match, resp.etag
+            )
+
+        return (
+            last_modified is not None and
+            req.if_modified_since is not None and
+            last_modified.replace(microsecond=0) <= req.if_modified_since
+        )
 
 
 class RetrieveMixin(BaseMixin):
@@ -381,6 +781,20 @@ class PaginatedMixin(BaseResource):
 
                 # ...
 
+    Paginated generic resources (see:
+    :class:`graceful.resources.generic.PaginatedListAPI`) can also decide
+    if there are more results without additional queries. If
+    ``fetch_extra_item`` is enabled then ``list()`` handler should return
+    up to ``page_size + 1`` objects. The overflow object is trimmed from
+    response and only used to set ``meta['has_more']``.
+
+    Total number of results can be included in ``meta['total']`` using the
+    ``total_count`` attribute and ``count()`` (or ``estimate_count()``)
+    handler. Counts are cached per filter parameters for
+    ``total_count_ttl`` seconds. Cached counts vary by the value of the
+    ``get_cache_vary_key()`` hook (the authenticated user on resources with
+    context) the same way cached responses do.
+
     """
 
     page_size = IntParam(
@@ -393,6 +807,70 @@ class PaginatedMixin(BaseResource):
         default='0',
     )
 
+    #: Set to ``True`` if ``list()`` handler returns up to ``page_size + 1``
+    #: objects so ``meta['has_more']`` can be set without additional queries.
+    #:
+    #: .. versionadded:: 0.7.0
+    fetch_extra_item = False
+
+    #: Include total number of results in ``meta['total']``. Allowed values
+    #: are ``None`` (disabled), ``'exact'`` (counted with ``count()``
+    #: handler) and ``'approximate'`` (estimated with ``estimate_count()``
+    #: handler and marked with ``meta['total_approximate']``).
+    #:
+    #: .. versionadded:: 0.7.0
+    total_count = None
+
+    #: Time (in seconds) for which total counts are cached per filter
+    #: parameters and vary key (see: ``get_cache_vary_key()``). ``None``
+    #: disables caching of counts.
+    #:
+    #: .. versionadded:: 0.7.0
+    total_count_ttl = None
+
+    #: Maximum number of total counts cached by single resource instance.
+    #:
+    #: .. versionadded:: 0.7.0
+    total_count_cache_size = 1024
+
+    #: Parameters that do not filter results so they are not a part of
+    #: total count cache keys.
+    #:
+    #: .. versionadded:: 0.7.0
+    total_count_ignored_params = ('page', 'page_size', 'fields', 'indent')
+
+    def count(self, params, **kwargs):
+        """Count all results matching the request parameters.
+
+        Args:
+            params (dict): dictionary of parsed parameters
+            **kwargs: dictionary of values retrieved from route url template
+
+        Returns:
+            int: exact total number of results
+
+        .. versionadded:: 0.7.0
+        """
+        raise NotImplementedError("count method not implemented")
+
+    def estimate_count(self, params, **kwargs):
+        """Estimate number of results matching the request parameters.
+
+        Estimates should be considerably cheaper than exact counts (e.g.
+        based on query planner statistics). Default implementation falls
+        back to the exact ``count()``.
+
+        Args:
+            params (dict): dictionary of parsed parameters
+            **kwargs: dictionary of values retrieved from route url template
+
+        Returns:
+            int: approximate total number of results
+
+        .. versionadded:: 0.7.0
+        """
+        return self.count(params, **kwargs)
+
     def add_pagination_meta(self, params, meta):
         """Extend default meta dictionary value with pagination hints.
 
@@ -416,3 +894,470 @@ class PaginatedMixin(BaseResource):
         meta['next'] = "page={0}&page_size={1}".format(
             params['page'] + 1, params['page_size']
         ) if meta.get('has_more', True) else None
+
+    def _paginate(self, objects, params, meta, **kwargs):
+        """Trim page of listed objects and add pagination meta.
+
+        Args:
+            objects (iterable): objects returned by ``list()`` handler
+            params (dict): dictionary of decoded parameter values
+            meta (dict): dictionary of meta values attached to response
+            **kwargs: dictionary of values retrieved from route url template
+
+        Returns:
+            iterable: objects of the requested page
+
+        """
+        if getattr(self, 'streaming', False):
+            return self._paginated_stream(objects, params, meta, **kwargs)
+
+        if self.fetch_extra_item or self.total_count:
+            objects = list(objects)
+
+        if self.fetch_extra_item:
+            meta['has_more'] = len(objects) > params['page_size']
+            del objects[params['page_size']:]
+
+        # note: we need to populate meta after objects are retrieved
+        if self.total_count:
+            self._add_total_count_meta(len(objects), params, meta, **kwargs)
+
+        self.add_pagination_meta(params, meta)
+        return objects
+
+    def _paginated_stream(self, objects, params, meta, **kwargs):
+        """Yield streamed objects and add pagination meta when exhausted.
+
+        Streamed responses have their meta encoded after all content items
+        so pagination hints can be added only when ``objects`` iterator is
+        consumed (list handler may still modify meta during iteration).
+
+        Args:
+            objects (iterator): iterator over streamed content items
+            params (dict): dictionary of decoded parameter values
+            meta (dict): dictionary of meta values attached to response
+            **kwargs: dictionary of values retrieved from route url template
+        """
+        objects = iter(objects)
+        length = 0
+
+        for obj in (
+            islice(objects, params['page_size'])
+            if self.fetch_extra_item else objects
+        ):
+            length += 1
+            yield obj
+
+        if self.fetch_extra_item:
+            # note: overflow object is pulled only to tell if it exists
+            meta['has_more'] = next(objects, _NOTHING) is not _NOTHING
+
+        self._add_total_count_meta(length, params, meta, **kwargs)
+        self.add_pagination_meta(params, meta)
+
+    def _add_total_count_meta(self, length, params, meta, **kwargs):
+        """Add total number of results to meta if it is enabled.
+
+        Count handler is not called at all if it is known that there are no
+        more results because the total can be computed from page position.
+
+        Args:
+            length (int): number of objects on current page
+            params (dict): dictionary of decoded parameter values
+            meta (dict): dictionary of meta values attached to response
+            **kwargs: dictionary of values retrieved from route url template
+        """
+        lookup = self._begin_total_count(length, params, meta, **kwargs)
+
+        if lookup is not None:
+            count, key = lookup
+            self._set_total_count(meta, key, count(params, **kwargs))
+
+    def _begin_total_count(self, length, params, meta, **kwargs):
+        """Add total that is known without calling count handler.
+
+        Args:
+            length (int): number of objects on current page or ``None`` if
+                it is not known yet
+            params (dict): dictionary of decoded parameter values
+            meta (dict): dictionary of meta values attached to response
+            **kwargs: dictionary of values retrieved from route url template
+
+        Returns:
+            tuple: two-tuple of count handler that needs to be called and key
+            of the count cache (``None`` if count must not be cached) or
+            ``None`` if total is already included in meta (or disabled).
+
+        """
+        if not self.total_count or 'total' in meta:
+            return None
+
+        if (
+            length is not None and
+            meta.get('has_more') is False and
+            (length or not params['page'])
+        ):
+            meta['total'] = params['page'] * params['page_size'] + length
+            return None
+
+        if self.total_count == 'approximate':
+            meta['total_approximate'] = True
+            count = self.estimate_count
+        else:
+            count = self.count
+
+        # note: counts of context-aware resources may depend on the user
+        #       just like cached responses do (see: get_cache_vary_key)
+        get_vary_key = getattr(self, 'get_cache_vary_key', None)
+        vary = get_vary_key(params, **kwargs) if get_vary_key else None
+
+        if (
+            self.total_count_ttl is None or
+            # note: default repr contains only object id that can be reused
+            #       by other object (e.g. user) after this one is released
+            type(vary).__repr__ is object.__repr__
+        ):
+            return count, None
+
+        key = repr((
+            self.total_count,
+            sorted(
+                item for item in params.items()
+                if item[0] not in self.total_count_ignored_params
+            ),
+            sorted(
+                item for item in kwargs.items() if item[0] != 'context'
+            ),
+            vary,
+        ))
+
+        total = self._get_total_count_cache().get(None, key)
+
+        if total is None:
+            return count, key
+
+        meta['total'] = total
+        return None
+
+    def _set_total_count(self, meta, key, total):
+        """Add counted total to meta and store it in the count cache."""
+        if key is not None:
+            self._get_total_count_cache().set(None, key, total)
+
+        meta['total'] = total
+
+    def _get_total_count_cache(self):
+        """Return count cache of this resource instance."""
+        cache = self.__dict__.get('_total_count_cache')
+
+        if cache is None:
+            cache = self._total_count_cache = InMemoryCache(
+                max_size=self.total_count_cache_size,
+                ttl=self.total_count_ttl,
+            )
+
+        return cache
+
+
+class SparseFieldsetMixin(BaseResource):
+    """Add sparse fieldsets capabilities to serialized resource.
+
+    This class provides additional ``fields`` parameter that allows client
+    to request only subset of serializer fields in resource representation
+    (e.g. ``?fields=id,name``). Requested field names are validated against
+    readable fields of resource serializer and are available to method
+    handlers as ``params['fields']`` list. Handlers can use this list to
+    narrow down storage queries:
+
+    .. code-block:: python
+
+        from graceful.resources.generic import ListAPI
+
+        class SomeResource(ListAPI):
+            serializer = SomeSerializer()
+
+            def list(self, params, meta):
+                # note: all readable sources are returned if fields
+                #       parameter was not specified
+                columns = self.serializer.get_sources(params.get('fields'))
+                # ...
+
+    .. versionadded:: 0.7.0
+    """
+
+    fields = StringParam(
+        details="""Comma separated list of fields to include in resource
+        representation. All fields are included by default""",
+        many=True,
+    )
+
+    def require_params(self, req):
+        """Require all defined parameters and validate requested fields.
+
+        Raises ``falcon.errors.HTTPInvalidParam`` if any of requested fields
+        is not a readable field of resource serializer.
+
+        Args:
+            req (falcon.Request): request object
+
+        """
+        params = super().require_params(req)
+        serializer = getattr(self, 'serializer', None)
+
+        if 'fields' in params:
+            # note: only falcon<2.0 splits comma separated query string
+            #       values on its own
+            params['fields'] = [
+                name
+                for value in params['fields']
+                for name in value.split(',')
+                if name
+            ]
+
+        if 'fields' in params and serializer is not None:
+            requested = set(params['fields'])
+            readable = [
+                name for name, field in serializer.fields.items()
+                if not field.write_only
+            ]
+            unknown = requested.difference(readable)
+
+            if unknown:
+                raise errors.HTTPInvalidParam(
+                    "Unknown fields: {}".format(", ".join(sorted(unknown))),
+                    'fields'
+                )
+
+            # note: keep order of field definition and drop duplicates
+            params['fields'] = [
+                name for name in readable if name in requested
+            ]
+
+        return params
+
+
+class CursorPaginatedMixin(BaseResource):
+    """Add keyset (cursor) pagination capabilities to resource.
+
+    Contrary to :class:`PaginatedMixin` pages are not identified by their
+    offset but by the sort key of the last (or first) item of the previously
+    seen page. This allows ``list()`` handlers to use efficient keyset
+    queries (e.g. ``WHERE id > :key ORDER BY id LIMIT :page_size``) so the
+    cost of retrieving single page does not depend on its depth.
+
+    Cursors are opaque Base64 strings signed with the ``cursor_secret`` so
+    clients cannot forge them. Valid cursor is decoded into ``params``
+    dictionary:
+
+    * ``params['cursor']``: list of sort key values of the item that
+      page should start after (or end before).
+    * ``params['cursor_direction']``: ``'next'`` if page should contain items
+      following the cursor key or ``'prev'`` if it should contain items
+      preceding the cursor key (in the same order as on other pages).
+
+    Both keys are missing on the first page request.
+
+    Example usage:
+
+    .. code-block:: python
+
+        from graceful.resources.mixins import CursorPaginatedMixin
+        from graceful.resources.generic import ListResource
+
+        class SomeResource(CursorPaginatedMixin, ListResource):
+            cursor_secret = b'some secret'
+            cursor_fields = ('created_at', 'id')
+
+            def list(self, params, meta):
+                objects = query_page(
+                    params.get('cursor'), params.get('cursor_direction'),
+                    limit=params['page_size'] + 1,
+                )
+                meta['has_more'] = len(objects) > params['page_size']
+                objects = objects[:params['page_size']]
+                self.add_cursor_pagination_meta(
+                    params, meta, objects[0], objects[-1]
+                )
+                return objects
+
+    .. versionadded:: 0.7.0
+    """
+
+    page_size = IntParam(
+        details="""Specifies number of result entries in single response""",
+        default='10'
+    )
+    cursor = StringParam(
+        details="""Opaque cursor of the results page. Cursors of next and
+        previous pages are included in response meta section. Omit this
+        parameter to retrieve the first page""",
+    )
+
+    #: Secret key (bytes) used to sign cursors. It must be set and shared by
+    #: all processes that serve the resource.
+    cursor_secret = None
+
+    #: Names of keys/attributes of listed objects that make the sort key of
+    #: the list (see: :meth:`get_cursor_key`).
+    cursor_fields = ('id',)
+
+    def get_cursor_key(self, obj):
+        """Return sort key of listed object that is encoded in cursors.
+
+        Default implementation returns values of ``cursor_fields`` keys (for
+        mappings) or attributes (for other objects). Values must be
+        JSON-serializable.
+
+        Args:
+            obj: listed object (internal object or its representation)
+
+        Returns:
+            list: list of sort key values
+
+        """
+        if isinstance(obj, Mapping):
+            return [obj[name] for name in self.cursor_fields]
+
+        return [getattr(obj, name) for name in self.cursor_fields]
+
+    def _require_cursor_secret(self):
+        """Return secret used to sign cursors."""
+        if not self.cursor_secret:
+            raise RuntimeError(
+                "{cls}.cursor_secret is not set".format(
+                    cls=self.__class__.__name__
+                )
+            )
+
+        return self.cursor_secret
+
+    def encode_cursor(self, key, direction='next'):
+        """Encode and sign cursor for given sort key.
+
+        Args:
+            key (list): sort key values
+            direction (str): ``'next'`` or ``'prev'``
+
+        Returns:
+            str: URL-safe cursor string
+
+        """
+        payload = json.dumps(
+            [direction, key], separators=(',', ':')
+        ).encode('utf-8')
+
+        return '.'.join(
+            signing.b64encode(part) for part in (
+                payload, signing.sign(self._require_cursor_secret(), payload)
+            )
+        )
+
+    def decode_cursor(self, cursor):
+        """Verify and decode cursor.
+
+        Args:
+            cursor (str): cursor string created with :meth:`encode_cursor`
+
+        Returns:
+            tuple: two-tuple of ``(key, direction)``
+
+        Raises:
+            ValueError: if cursor is malformed or its signature is invalid
+
+        """
+        # note: binascii.Error raised on invalid base64 is a ValueError
+        try:
+            payload, signature = (
+                signing.b64decode(part) for part in cursor.split('.')
+            )
+        except ValueError:
+            raise ValueError("Malformed cursor")
+
+        if not signing.verify(
+            self._require_cursor_secret(), payload, signature
+        ):
+            raise ValueError("Invalid cursor signature")
+
+        direction, key = json.loads(payload.decode('utf-8'))
+        return key, direction
+
+    def require_params(self, req):
+        """Require all defined parameters and decode pagination cursor.
+
+        Raises ``falcon.errors.HTTPInvalidParam`` if cursor is malformed
+        or was not signed with ``cursor_secret``.
+
+        Args:
+            req (falcon.Request): request object
+
+        """
+        params = super().require_params(req)
+
+        if 'cursor' in params:
+            try:
+                params['cursor'], params['cursor_direction'] = (
+                    self.decode_cursor(params['cursor'])
+                )
+            except ValueError as err:
+                raise errors.HTTPInvalidParam(str(err), 'cursor')
+
+        return params
+
+    def add_cursor_pagination_meta(self, params, meta, first, last):
+        """Extend default meta dictionary value with cursor pagination hints.
+
+        Links to next and previous pages are provided as query strings with
+        encoded cursors. Use ``meta['has_more']`` in order to tell if there
+        are more results in the direction of pagination.
+
+        Note:
+            This method handler attaches values to ``meta`` dictionary without
+            changing it's reference. This means that you should never replace
+            ``meta`` dictionary with any other dict instance but simply modify
+            its content.
+
+        Args:
+            params (dict): dictionary of decoded parameter values
+            meta (dict): dictionary of meta values attached to response
+            first: first object of the page (``None`` if page is empty)
+            last: last object of the page (``None`` if page is empty)
+
+        """
+        direction = params.get('cursor_direction')
+        has_more = meta.get('has_more', True)
+
+        meta['page_size'] = params['page_size']
+        meta['next'] = meta['prev'] = None
+
+        if first is None:
+            return
+
+        if direction == 'prev' or has_more:
+            meta['next'] = "cursor={0}&page_size={1}".format(
+                self.encode_cursor(self.get_cursor_key(last), 'next'),
+                params['page_size'],
+            )
+
+        if direction == 'next' or (direction == 'prev' and has_more):
+            meta['prev'] = "cursor={0}&page_size={1}".format(
+                self.encode_cursor(self.get_cursor_key(first), 'prev'),
+                params['page_size'],
+            )
+
+    def _cursor_paginated(self, objects, params, meta):
+        """Yield listed objects and add cursor pagination meta when exhausted.
+
+        Args:
+            objects (iterable): listed objects
+            params (dict): dictionary of decoded parameter values
+            meta (dict): dictionary of meta values attached to response
+        """
+        first = last = None
+
+        for obj in objects:
+            if first is None:
+                first = obj
+            last = obj
+            yield obj
+
+        self.add_cursor_pagination_meta(params, meta, first, last)
@@ -1,8 +1,9 @@
 from collections import OrderedDict
 from collections.abc import Mapping, MutableMapping
+from functools import lru_cache
 
 from graceful.errors import DeserializationError
-from graceful.fields import BaseField
+from graceful.fields import BaseField, SerializerField
 
 
 def _source(name, field):
@@ -17,6 +18,188 @@ def _source(name, field):
         return field.source or name
 
 
+def _get_object_attribute(obj, attr):
+    """Get attribute of plain (non-mapping) object or ``None``."""
+    return getattr(obj, attr, None)
+
+
+@lru_cache(maxsize=256)
+def _resolve_accessor(type_):
+    """Resolve default attribute accessor for objects of given type.
+
+    Returned accessor is a function that accepts ``(obj, attr)`` arguments
+    and behaves exactly like the default ``BaseSerializer.get_attribute()``
+    for non-wildcard attributes of objects of given type.
+
+    Args:
+        type_ (type): concrete type of serialized objects
+
+    Returns:
+        function: attribute accessor function
+
+    """
+    if issubclass(type_, Mapping):
+        # note: this is unbound method so it is called as get(obj, attr)
+        return type_.get
+
+    return _get_object_attribute
+
+
+def _get_converter(field):
+    """Return function converting field values in compiled plans.
+
+    Nested serializer fields are converted directly with the compiled plan
+    of nested serializer (see: ``BaseSerializer._nested_converter()``).
+    """
+    if isinstance(field, SerializerField):
+        return field.serializer._nested_converter()
+
+    return field.to_representation
+
+
+def _compile_to_representation(fields, default_accessors):
+    """Compile specialised ``to_representation()`` plan for given fields.
+
+    Write-only fields are filtered out, sources are resolved and field
+    converters are pre-bound once so the resulting function only needs
+    to loop over a flat tuple of field entries.
+
+    Args:
+        fields (OrderedDict): serializer fields storage
+        default_accessors (bool): set to True if serializer class does not
+            override the ``get_attribute()`` method. Then wildcard sources
+            can be resolved without calling the accessor.
+
+    Returns:
+        function: function that accepts ``(obj, get)`` arguments where
+        ``get`` is the ``(obj, attr)`` accessor resolved for given object
+        and returns representation dictionary.
+
+    """
+    readable = tuple(
+        (
+            name,
+            field.source or name,
+            # note: wildcard can be short-circuited only if we know what
+            #       the get_attribute() would do with it
+            default_accessors and field.source == '*',
+            field.many,
+            _get_converter(field),
+        )
+        for name, field in fields.items()
+        if not field.write_only
+    )
+
+    def to_representation(obj, get):
+        representation = {}
+
+        for name, source, wildcard, many, convert in readable:
+            attribute = obj if wildcard else get(obj, source)
+
+            if attribute is None:
+                representation[name] = [] if many else None
+            elif many:
+                representation[name] = [convert(item) for item in attribute]
+            else:
+                representation[name] = convert(attribute)
+
+        return representation
+
+    return to_representation
+
+
+@lru_cache(maxsize=128)
+def _compile_sparse_to_representation(cls, fields):
+    """Compile and cache ``to_representation()`` plan for subset of fields.
+
+    Args:
+        cls: serializer class
+        fields (frozenset): names of fields to include in representation
+
+    Returns:
+        function: compiled plan (see :func:`_compile_to_representation`)
+
+    """
+    return _compile_to_representation(
+        OrderedDict(
+            (name, field)
+            for name, field in getattr(cls, cls._fields_storage_key).items()
+            if name in fields
+        ),
+        cls._default_accessors,
+    )
+
+
+def _narrow(representation, fields):
+    """Narrow representation dictionary to given set of field names."""
+    return {
+        name: value
+        for name, value in representation.items()
+        if name in fields
+    }
+
+
+def _compile_from_representation(fields):
+    """Compile specialised ``from_representation()`` plan for given fields.
+
+    Args:
+        fields (OrderedDict): serializer fields storage
+
+    Returns:
+        function: function that accepts ``(serializer, representation)``
+        arguments and returns internal object dictionary.
+
+    """
+    writable = tuple(
+        (
+            name,
+            _source(name, field),
+            field.many,
+            field.allow_null,
+            field.from_representation,
+        )
+        for name, field in fields.items()
+    )
+
+    def from_representation(serializer, representation):
+        object_dict = {}
+        failed = {}
+
+        for name, source, many, allow_null, convert in writable:
+            if name not in representation:
+                continue
+
+            value = representation[name]
+
+            try:
+                if many:
+                    # note: we cannot check for any sequence or iterable
+                    #       because of strings and nested dicts.
+                    if not isinstance(value, (list, tuple)):
+                        raise ValueError("field should be sequence")
+
+                    object_dict[source] = [
+                        convert(single_value)
+                        if not allow_null or single_value is not None
+                        else None
+                        for single_value in value
+                    ]
+                elif allow_null:
+                    object_dict[source] = convert(value) if value else None
+                else:
+                    object_dict[source] = convert(value)
+
+            except ValueError as err:
+                failed[name] = str(err)
+
+        if failed:
+            serializer._raise_failed(object_dict, failed)
+
+        return object_dict
+
+    return from_representation
+
+
 class MetaSerializer(type):
     """Metaclass for handling serialization with field objects."""
 
@@ -65,6 +248,51 @@ class MetaSerializer(type):
 
         return OrderedDict(fields)
 
+    @classmethod
+    def _uses_default(mcs, cls, method_name):
+        """Tell if serializer class uses default implementation of a method.
+
+        Default implementation is the one defined by the root serializer class
+        (the one that is not derived from any other serializer class).
+
+        Args:
+            cls: created serializer class
+            method_name (str): name of the method to check
+
+        """
+        owner = next(
+            klass for klass in cls.__mro__ if method_name in vars(klass)
+        )
+        return isinstance(owner, mcs) and not any(
+            isinstance(base, mcs) for base in owner.__bases__
+        )
+
+    @classmethod
+    def _index_sources(mcs, cls, fields):
+        """Store source indexes used by serializer class for validation.
+
+        Indexes are computed once per serializer class so validation does
+        not need to rebuild them for every validated object.
+
+        Args:
+            cls: created serializer class
+            fields (OrderedDict): serializer fields storage
+
+        """
+        cls._sources = OrderedDict(
+            (_source(name, field), field) for name, field in fields.items()
+        )
+        cls._sources_to_field_names = {
+            _source(name, field): name for name, field in fields.items()
+        }
+        # note: sources that are not read-only are at the same time the
+        #       only allowed and the only required ones on full validation
+        cls._writable_sources_ordered = tuple(
+            source for source, field in cls._sources.items()
+            if not field.read_only
+        )
+        cls._writable_sources = frozenset(cls._writable_sources_ordered)
+
     def __new__(mcs, name, bases, namespace):
         """Create new class object instance and alter its namespace."""
         namespace[mcs._fields_storage_key] = mcs._get_fields(bases, namespace)
@@ -74,6 +302,24 @@ class MetaSerializer(type):
             mcs, name, bases, dict(namespace)
         )
 
+    def __init__(cls, name, bases, namespace):
+        """Compile serialization plans for newly created serializer class."""
+        super().__init__(name, bases, namespace)
+        mcs = type(cls)
+        fields = getattr(cls, cls._fields_storage_key)
+
+        cls._default_accessors = mcs._uses_default(cls, 'get_attribute')
+        cls._default_to_representation = mcs._uses_default(
+            cls, 'to_representation'
+        )
+        # note: plans are stored as static methods because they do not
+        #       operate on serializer instances
+        cls._to_representation_plan = staticmethod(
+            _compile_to_representation(fields, cls._default_accessors)
+        )
+        cls._from_representation_plan = _compile_from_representation(fields)
+        mcs._index_sources(cls, fields)
+
 
 class BaseSerializer(metaclass=MetaSerializer):
     """Base serializer class for describing internal object serialization.
@@ -91,8 +337,21 @@ class BaseSerializer(metaclass=MetaSerializer):
             age = IntField("cat age in years")
             height = FloatField("cat height in cm")
 
+    Serialization is by default performed with plans compiled once per
+    serializer class by its metaclass. These plans have fields pre-filtered
+    and their sources and converters pre-bound so no per-field
+    interpretation is needed when serializing objects. Set the
+    ``compiled`` class attribute to ``False`` in order to use generic
+    field-by-field serialization instead (e.g. for comparison).
+
     """
 
+    #: Set to ``False`` to use generic field-by-field serialization instead
+    #: of compiled per-class plans.
+    #:
+    #: .. versionadded:: 0.7.0
+    compiled = True
+
     @property
     def fields(self):
         """Return dictionary of field definition objects of this serializer."""
@@ -115,6 +374,167 @@ class BaseSerializer(metaclass=MetaSerializer):
             dict: representation dictionary
 
         """
+        if self.compiled:
+            return self._to_representation_plan(obj, self._get_accessor(obj))
+
+        return self._to_representation_generic(obj)
+
+    def to_sparse_representation(self, obj, fields):
+        """Convert internal object into representation with subset of fields.
+
+        Only fields with given names are included in representation so
+        values of other fields are not even retrieved from the object.
+        Plans for specific subsets of fields are compiled on first use and
+        cached. If serializer class overrides ``to_representation()`` then
+        full representation is narrowed down instead.
+
+        Args:
+            obj (object): internal object that needs to be represented
+            fields (iterable): names of fields to include in representation
+
+        Returns:
+            dict: representation dictionary
+
+        .. versionadded:: 0.7.0
+        """
+        fields = frozenset(fields)
+
+        if self.compiled and self._default_to_representation:
+            plan = _compile_sparse_to_representation(type(self), fields)
+            return plan(obj, self._get_accessor(obj))
+
+        return _narrow(self.to_representation(obj), fields)
+
+    def to_representation_many(self, objs, lazy=False, fields=None):
+        """Convert multiple internal object instances into representations.
+
+        This is a batch counterpart of ``to_representation()``. Attribute
+        accessor strategy (mapping keys or object attributes) is resolved only
+        once for every concrete type of objects and not for every object and
+        field. If serializer class overrides ``to_representation()`` then
+        it is simply called for every object.
+
+        Args:
+            objs (iterable): internal object instances that need to be
+                represented
+            lazy (bool): set to True to return an iterator that converts
+                objects only when it is consumed (e.g. when streaming
+                response body).
+            fields (iterable): optional names of fields to include in
+                representations (see: :meth:`to_sparse_representation`).
+                All fields are included by default.
+
+        Returns:
+            list: list of representation dictionaries (or iterator over them
+            if ``lazy`` is set to True).
+
+        .. versionadded:: 0.7.0
+        """
+        representations = self._iter_representations(
+            objs, None if fields is None else frozenset(fields)
+        )
+        return representations if lazy else list(representations)
+
+    def _iter_representations(self, objs, fields=None):
+        """Iterate over representations of multiple internal objects."""
+        if not (self.compiled and self._default_to_representation):
+            for obj in objs:
+                representation = self.to_representation(obj)
+                yield (
+                    representation if fields is None
+                    else _narrow(representation, fields)
+                )
+            return
+
+        if fields is None:
+            plan = self._to_representation_plan
+        else:
+            plan = _compile_sparse_to_representation(type(self), fields)
+
+        if not self._default_accessors:
+            get = self.get_attribute
+            for obj in objs:
+                yield plan(obj, get)
+            return
+
+        last_type = get = None
+
+        for obj in objs:
+            if type(obj) is not last_type:
+                last_type = type(obj)
+                get = _resolve_accessor(last_type)
+
+            yield plan(obj, get)
+
+    def get_sources(self, fields=None):
+        """Return sources of readable fields.
+
+        This is useful for narrowing down storage queries (e.g. list of
+        columns to fetch from database) to what is really needed to create
+        sparse representations. Note that ``'*'`` source means that whole
+        object is needed to represent the field.
+
+        Args:
+            fields (iterable): optional names of fields. Defaults to all
+                readable (not write-only) fields.
+
+        Returns:
+            list: list of object keys/attributes in order of field definition.
+
+        .. versionadded:: 0.7.0
+        """
+        return [
+            field.source or name
+            for name, field in self.fields.items()
+            if not field.write_only and (fields is None or name in fields)
+        ]
+
+    def _nested_converter(self):
+        """Return function converting nested objects in parent's plans.
+
+        Returned function calls compiled plan of this serializer directly.
+        Accessor for nested objects is resolved only when type of converted
+        object changes so lists of homogeneous nested objects are converted
+        without repeated accessor resolution.
+
+        Returns:
+            function: function that accepts internal object and returns
+            its representation.
+
+        """
+        if not (self.compiled and self._default_to_representation):
+            return self.to_representation
+
+        plan = self._to_representation_plan
+
+        if not self._default_accessors:
+            get_attribute = self.get_attribute
+            return lambda obj: plan(obj, get_attribute)
+
+        # note: type and accessor are stored as a single tuple so
+        #       concurrent conversions can never see them inconsistent
+        cache = [(None, None)]
+
+        def convert(obj):
+            last_type, get = cache[0]
+
+            if type(obj) is not last_type:
+                get = _resolve_accessor(type(obj))
+                cache[0] = (type(obj), get)
+
+            return plan(obj, get)
+
+        return convert
+
+    def _get_accessor(self, obj):
+        """Return ``(obj, attr)`` accessor function for given object."""
+        if self._default_accessors:
+            return _resolve_accessor(type(obj))
+
+        return self.get_attribute
+
+    def _to_representation_generic(self, obj):
+        """Convert internal object to representation without compiled plan."""
         representation = {}
 
         for name, field in self.fields.items():
@@ -163,6 +583,13 @@ class BaseSerializer(metaclass=MetaSerializer):
                 as well.
 
         """
+        if self.compiled:
+            return self._from_representation_plan(representation)
+
+        return self._from_representation_generic(representation)
+
+    def _from_representation_generic(self, representation):
+        """Convert representation to internal object without compiled plan."""
         object_dict = {}
         failed = {}
 
@@ -204,19 +631,32 @@ class BaseSerializer(metaclass=MetaSerializer):
                 failed[name] = str(err)
 
         if failed:
-            # if failed to parse we eagerly perform validation so full
-            # information about what is wrong will be returned
-            try:
-                self.validate(object_dict)
-                # note: this exception can be reached with partial==True
-                # since do not support partial updates yet this has 'no cover'
-                raise DeserializationError()  # pragma: no cover
-            except DeserializationError as err:
-                err.failed = failed
-                raise
+            self._raise_failed(object_dict, failed)
 
         return object_dict
 
+    def _raise_failed(self, object_dict, failed):
+        """Raise deserialization error for representation that failed to parse.
+
+        Args:
+            object_dict (dict): partially deserialized internal object
+            failed (dict): dictionary of field parsing error messages
+
+        Raises:
+            DeserializationError: always
+
+        """
+        # if failed to parse we eagerly perform validation so full
+        # information about what is wrong will be returned
+        try:
+            self.validate(object_dict)
+            # note: this exception can be reached with partial==True
+            # since do not support partial updates yet this has 'no cover'
+            raise DeserializationError()  # pragma: no cover
+        except DeserializationError as err:
+            err.failed = failed
+            raise
+
     def validate(self, object_dict, partial=False):
         """Validate given internal object returned by ``to_representation()``.
 
@@ -234,31 +674,42 @@ class BaseSerializer(metaclass=MetaSerializer):
             DeserializationError:
 
         """
-        # we are working on object_dict not an representation so there
-        # is a need to annotate sources differently
-        sources = {
-            _source(name, field): field
-            for name, field in self.fields.items()
-        }
+        # note: indexes of sources are computed once per serializer class
+        #       because we are working on object_dict not a representation
+        #       so there is a need to annotate sources differently
+        sources = self._sources
+        writable = self._writable_sources
 
         # note: we are checking for all mising and invalid fields so we can
         # return exception with all fields that are missing and should
         # exist instead of single one
-        missing = [
-            name for name, field in sources.items()
-            if all((not partial, name not in object_dict, not field.read_only))
-        ]
+        missing = []
+        if not partial:
+            missing_sources = writable.difference(object_dict)
+
+            if missing_sources:
+                missing = [
+                    name for name in self._writable_sources_ordered
+                    if name in missing_sources
+                ]
 
-        forbidden = [
-            name for name in object_dict
-            if any((name not in sources, sources[name].read_only))
-        ]
+        forbidden = []
+        forbidden_sources = object_dict.keys() - writable
+
+        if forbidden_sources:
+            forbidden = [
+                name for name in object_dict if name in forbidden_sources
+            ]
 
         invalid = {}
         for name, value in object_dict.items():
             try:
                 field = sources[name]
+            except KeyError:
+                # note: unknown sources are already reported as forbidden
+                continue
 
+            try:
                 if field.many:
                     for single_value in value:
                         field.validate(single_value)
@@ -268,17 +719,14 @@ class BaseSerializer(metaclass=MetaSerializer):
             except ValueError as err:
                 invalid[name] = str(err)
 
-        if any([missing, forbidden, invalid]):
+        if missing or forbidden or invalid:
             # note: We have validated internal object instance but need to
             #       inform the user about problems with his representation.
             #       This is why we have to do this dirty transformation.
             # note: This will be removed in 1.0.0 where we change how
             #       validation works and where we remove star-like fields.
             # refs: #42 (https://github.com/swistakm/graceful/issues/42)
-            sources_to_field_names = {
-                _source(name, field): name
-                for name, field in self.fields.items()
-            }
+            sources_to_field_names = self._sources_to_field_names
 
             def _(names):
                 if isinstance(names, list):
@@ -0,0 +1,72 @@
+"""Helpers for signing opaque values passed through clients.
+
+Signed values (e.g. :any:`SignedToken` bearer tokens or pagination cursors
+of :any:`CursorPaginatedMixin`) consist of URL-safe base64 encoded parts
+(without padding) and are signed with HMAC-SHA256.
+
+.. versionadded:: 0.7.0
+"""
+import base64
+import hashlib
+import hmac
+
+
+def b64encode(data):
+    """Encode bytes with URL-safe base64 without padding.
+
+    Args:
+        data (bytes): data to encode
+
+    Returns:
+        str: encoded data
+
+    """
+    return base64.urlsafe_b64encode(data).rstrip(b'=').decode('ascii')
+
+
+def b64decode(data):
+    """Decode URL-safe base64 string with stripped padding.
+
+    Args:
+        data (str): data encoded with :func:`b64encode`
+
+    Returns:
+        bytes: decoded data
+
+    Raises:
+        ValueError: if data is not valid base64 (``binascii.Error`` is
+            a subclass of ``ValueError``)
+
+    """
+    return base64.urlsafe_b64decode(data + '=' * (-len(data) % 4))
+
+
+def sign(key, payload):
+    """Return raw HMAC-SHA256 signature of the payload.
+
+    Args:
+        key (bytes): secret signing key
+        payload (bytes): signed data
+
+    Returns:
+        bytes: signature
+
+    """
+    return hmac.new(key, payload, hashlib.sha256).digest()
+
+
+def verify(key, payload, signature):
+    """Tell if signature of the payload is valid.
+
+    Signatures are compared in constant time.
+
+    Args:
+        key (bytes): secret signing key
+        payload (bytes): signed data
+        signature (bytes): signature created with :func:`sign`
+
+    Returns:
+        bool: True if signature is valid
+
+    """
+    return hmac.compare_digest(sign(key, payload), signature)
@@ -0,0 +1,222 @@
+"""In-memory fakes of external services for testing and benchmarking.
+
+Key-value store fakes implement the subset of the Redis client API that is
+used by graceful's key-value backends (see:
+:class:`graceful.authentication.KeyValueUserStorage` and
+:class:`graceful.caching.KeyValueCache`) so they can be tested and
+benchmarked without a real Redis server:
+
+.. code-block:: python
+
+    from graceful.authentication import KeyValueUserStorage
+    from graceful.testing import InMemoryKeyValueStore
+
+    kv_store = InMemoryKeyValueStore(latency=0.0005)
+    storage = KeyValueUserStorage(kv_store)
+
+    # ... run the benchmark
+    print(kv_store.round_trips)
+
+.. versionadded:: 0.7.0
+"""
+import asyncio
+from threading import Lock
+import time
+
+
+def _as_bytes(value):
+    """Convert stored value to bytes just like Redis clients do."""
+    if isinstance(value, bytes):
+        return value
+
+    return str(value).encode()
+
+
+class _BaseInMemoryKeyValueStore:
+    """Data and commands shared by in-memory key-value store fakes.
+
+    Args:
+        latency (float): simulated round trip time in seconds.
+        clock (callable): function returning current time in seconds used
+            for key expiry. Defaults to ``time.monotonic``.
+
+    """
+
+    def __init__(self, latency=0, clock=time.monotonic):
+        """Initialize empty store."""
+        self.latency = latency
+        self.clock = clock
+        self.round_trips = 0
+
+        self._data = {}
+        self._lock = Lock()
+
+    def _get(self, key):
+        """Get value of key that did not expire."""
+        try:
+            value, expires = self._data[key]
+        except KeyError:
+            return None
+
+        if expires is not None and expires <= self.clock():
+            del self._data[key]
+            return None
+
+        return value
+
+    def _set(self, key, value, ex=None):
+        self._data[key] = (
+            _as_bytes(value), None if ex is None else self.clock() + ex
+        )
+        return True
+
+    def _incr(self, key):
+        value = int(self._get(key) or 0) + 1
+        self._data[key] = (_as_bytes(value), None)
+        return value
+
+    def _delete(self, *keys):
+        return sum(self._data.pop(key, None) is not None for key in keys)
+
+    def _mget(self, keys):
+        return [self._get(key) for key in keys]
+
+    def _execute(self, method, *args, **kwargs):
+        """Execute single command atomically."""
+        with self._lock:
+            return getattr(self, '_' + method)(*args, **kwargs)
+
+
+class InMemoryKeyValueStore(_BaseInMemoryKeyValueStore):
+    """Thread-safe in-memory fake of Redis-like key-value store client.
+
+    Values are stored as bytes. Every method call (and every executed
+    pipeline) counts as a single round trip to the store and optionally
+    sleeps for ``latency`` seconds to simulate the network.
+
+    Args:
+        latency (float): simulated round trip time in seconds.
+        clock (callable): function returning current time in seconds used
+            for key expiry. Defaults to ``time.monotonic``.
+
+    """
+
+    def _round_trip(self):
+        """Count round trip and simulate network latency."""
+        self.round_trips += 1
+
+        if self.latency:
+            time.sleep(self.latency)
+
+    def get(self, key):
+        """Get value of key or ``None`` if it does not exist."""
+        self._round_trip()
+        return self._execute('get', key)
+
+    def mget(self, keys):
+        """Get values of multiple keys in single round trip."""
+        self._round_trip()
+        return self._execute('mget', keys)
+
+    def set(self, key, value, ex=None):
+        """Set value of key that optionally expires after ``ex`` seconds."""
+        self._round_trip()
+        return self._execute('set', key, value, ex)
+
+    def incr(self, key):
+        """Increment integer value of key and return the new value."""
+        self._round_trip()
+        return self._execute('incr', key)
+
+    def delete(self, *keys):
+        """Delete keys and return the number of deleted keys."""
+        self._round_trip()
+        return self._execute('delete', *keys)
+
+    def pipeline(self, transaction=True):
+        """Return pipeline that executes buffered commands at once."""
+        return InMemoryPipeline(self)
+
+
+class InMemoryPipeline:
+    """Pipeline of :class:`InMemoryKeyValueStore` commands.
+
+    Commands are buffered and executed atomically in single round trip
+    by the ``execute()`` method that returns the list of their results.
+
+    Args:
+        kv_store (InMemoryKeyValueStore): store to execute commands on.
+
+    """
+
+    def __init__(self, kv_store):
+        """Initialize empty pipeline."""
+        self.kv_store = kv_store
+        self.commands = []
+
+    def __getattr__(self, method):
+        """Return function that buffers given command."""
+        if method not in ('get', 'set', 'incr', 'delete'):
+            raise AttributeError(method)
+
+        def command(*args, **kwargs):
+            self.commands.append((method, args, kwargs))
+            return self
+
+        return command
+
+    def execute(self):
+        """Execute all buffered commands and return their results."""
+        commands, self.commands = self.commands, []
+        self.kv_store._round_trip()
+
+        with self.kv_store._lock:
+            return [
+                getattr(self.kv_store, '_' + method)(*args, **kwargs)
+                for method, args, kwargs in commands
+            ]
+
+
+class AsyncInMemoryKeyValueStore(_BaseInMemoryKeyValueStore):
+    """Asyncio fake of Redis-like key-value store client.
+
+    Provides the same commands as :class:`InMemoryKeyValueStore` (except
+    pipelines) as coroutines (like ``redis.asyncio`` client) and simulates
+    latency with ``asyncio.sleep()``.
+
+    Args:
+        latency (float): simulated round trip time in seconds.
+        clock (callable): function returning current time in seconds used
+            for key expiry. Defaults to ``time.monotonic``.
+
+    """
+
+    async def _round_trip(self):
+        """Count round trip and simulate network latency."""
+        self.round_trips += 1
+        await asyncio.sleep(self.latency)
+
+    async def get(self, key):
+        """Get value of key or ``None`` if it does not exist."""
+        await self._round_trip()
+        return self._execute('get', key)
+
+    async def mget(self, keys):
+        """Get values of multiple keys in single round trip."""
+        await self._round_trip()
+        return self._execute('mget', keys)
+
+    async def set(self, key, value, ex=None):
+        """Set value of key that optionally expires after ``ex`` seconds."""
+        await self._round_trip()
+        return self._execute('set', key, value, ex)
+
+    async def incr(self, key):
+        """Increment integer value of key and return the new value."""
+        await self._round_trip()
+        return self._execute('incr', key)
+
+    async def delete(self, *keys):
+        """Delete keys and return the number of deleted keys."""
+        await self._round_trip()
+        return self._execute('delete', *keys)
@@ -0,0 +1,240 @@
+"""Per-phase timing of resource request handling.
+
+Resources can measure how long each phase of request handling takes
+(parameter parsing, content handler, body encoding etc.) and report these
+timings to a timing sink. Timing is enabled per resource class with the
+``timing_sink`` and/or ``server_timing`` class attributes:
+
+.. code-block:: python
+
+    from graceful.resources.generic import ListAPI
+    from graceful.timing import InMemoryTimingAggregator
+
+    timings = InMemoryTimingAggregator()
+
+    class CatListResource(ListAPI, with_context=True):
+        timing_sink = timings
+        # note: also report timings to clients in Server-Timing header
+        server_timing = True
+
+    # ... later (e.g. in some diagnostic endpoint)
+    print(timings.stats())
+
+Phases are measured with high resolution ``time.perf_counter()`` clock and
+reported in the order they were measured as ``(phase, seconds)`` tuples.
+Resource handlers that accept the request context (see
+:ref:`guide-context-aware-resources`) can measure their own phases using
+the :class:`PhaseTimer` instance stored under the ``'graceful.timer'`` key
+(see: :data:`TIMER_CONTEXT_KEY`) of the context. Timings are reported even
+if request handling fails with an exception.
+
+.. versionadded:: 0.7.0
+"""
+from contextlib import contextmanager
+import logging
+from threading import Lock
+import time
+
+
+#: Key of the request context under which the :class:`PhaseTimer` of the
+#: request is stored. It is namespaced so it does not collide with context
+#: values set by the application.
+TIMER_CONTEXT_KEY = 'graceful.timer'
+
+
+class PhaseTimer:
+    """Timer that measures consecutive phases of single request handling.
+
+    Args:
+        clock (callable): function returning current time in seconds.
+            Defaults to ``time.perf_counter``.
+
+    """
+
+    __slots__ = ('clock', 'phases', '_mark')
+
+    def __init__(self, clock=time.perf_counter):
+        """Initialize timer without any measured phases."""
+        self.clock = clock
+        #: list of ``(phase, seconds)`` tuples in measurement order
+        self.phases = []
+        self._mark = clock()
+
+    def start(self):
+        """Mark the beginning of the next phase."""
+        self._mark = self.clock()
+
+    def lap(self, phase):
+        """Record duration of the phase that just ended.
+
+        The phase is measured since the last ``start()`` or ``lap()`` call.
+
+        Args:
+            phase (str): name of the phase
+
+        """
+        now = self.clock()
+        self.phases.append((phase, now - self._mark))
+        self._mark = now
+
+    @contextmanager
+    def measure(self, phase):
+        """Measure phase that lasts for the duration of ``with`` block.
+
+        Measured phases may be nested within other phases (e.g. database
+        queries made by the content handler).
+
+        Args:
+            phase (str): name of the phase
+
+        """
+        started = self.clock()
+
+        try:
+            yield
+        finally:
+            self.phases.append((phase, self.clock() - started))
+
+    def server_timing(self):
+        """Return measured phases as ``Server-Timing`` header value.
+
+        Durations are expressed in milliseconds as required by the
+        `Server Timing`_ specification.
+
+        .. _Server Timing: https://www.w3.org/TR/server-timing/
+        """
+        return ', '.join(
+            '{};dur={:.3f}'.format(phase, seconds * 1000)
+            for phase, seconds in self.phases
+        )
+
+
+class BaseTimingSink:
+    """Base timing sink class for subclassing.
+
+    To create new timing sink subclass :class:`BaseTimingSink` and implement
+    the ``record()`` method. Sinks are shared by all requests so they must be
+    thread-safe.
+
+    """
+
+    def record(self, resource, req, phases):
+        """Record timings of single handled request.
+
+        Args:
+            resource (object): resource instance that handled the request
+            req (falcon.Request): request object
+            phases (list): list of ``(phase, seconds)`` tuples
+
+        """
+        raise NotImplementedError  # pragma: nocover
+
+
+class CallbackTimingSink(BaseTimingSink):
+    """Timing sink that passes timings to any callable.
+
+    Args:
+        callback (callable): function accepting the same arguments as the
+            :meth:`BaseTimingSink.record` method (e.g. function that sends
+            timings to statsd).
+
+    """
+
+    def __init__(self, callback):
+        """Initialize callback timing sink."""
+        self.callback = callback
+
+    def record(self, resource, req, phases):
+        """Pass timings to the callback."""
+        self.callback(resource, req, phases)
+
+
+class LoggingTimingSink(BaseTimingSink):
+    """Timing sink that logs timings of every request.
+
+    Log records have following form::
+
+        GET /v1/cats CatListResource params=0.021ms handler=1.377ms ...
+
+    Args:
+        logger (logging.Logger): logger instance. Defaults to the
+            ``graceful.timing`` logger.
+        level (int): level of log records. Defaults to ``logging.DEBUG``.
+
+    """
+
+    def __init__(self, logger=None, level=logging.DEBUG):
+        """Initialize logging timing sink."""
+        self.logger = logger or logging.getLogger(__name__)
+        self.level = level
+
+    def record(self, resource, req, phases):
+        """Log timings if logger is enabled for configured level."""
+        if not self.logger.isEnabledFor(self.level):
+            return
+
+        self.logger.log(
+            self.level, "%s %s %s %s",
+            req.method, req.path, resource.__class__.__name__,
+            ' '.join(
+                '{}={:.3f}ms'.format(phase, seconds * 1000)
+                for phase, seconds in phases
+            ),
+        )
+
+
+class InMemoryTimingAggregator(BaseTimingSink):
+    """Thread-safe timing sink that aggregates timings in process memory.
+
+    Timings are aggregated per resource class and phase so the aggregator
+    uses constant memory regardless of the number of handled requests.
+
+    """
+
+    def __init__(self):
+        """Initialize empty aggregator."""
+        self._totals = {}
+        self._lock = Lock()
+
+    def record(self, resource, req, phases):
+        """Add timings of the request to aggregated values."""
+        name = resource.__class__.__qualname__
+
+        with self._lock:
+            for phase, seconds in phases:
+                try:
+                    count, total, maximum = self._totals[name, phase]
+                except KeyError:
+                    count, total, maximum = 0, 0.0, 0.0
+
+                self._totals[name, phase] = (
+                    count + 1, total + seconds, max(maximum, seconds)
+                )
+
+    def stats(self):
+        """Return aggregated timings.
+
+        Returns:
+            dict: dictionary of resource class names mapped to dictionaries
+            of phases with ``count``, ``total``, ``mean`` and ``max`` keys
+            (all times in seconds).
+
+        """
+        with self._lock:
+            totals = dict(self._totals)
+
+        stats = {}
+        for (name, phase), (count, total, maximum) in totals.items():
+            stats.setdefault(name, {})[phase] = {
+                'count': count,
+                'total': total,
+                'mean': total / count,
+                'max': maximum,
+            }
+
+        return stats
+
+    def reset(self):
+        """Remove all aggregated timings."""
+        with self._lock:
+            self._totals.clear()
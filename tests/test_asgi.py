@@ -0,0 +1,195 @@
+import asyncio
+import warnings
+
+import pytest
+
+import falcon
+from falcon import testing
+
+from graceful import authentication
+from graceful import testing as graceful_testing
+from graceful.caching import InMemoryCache
+from graceful.fields import IntField, RawField
+from graceful.resources.asyncio import (
+    AsyncListCreateAPI,
+    AsyncRetrieveUpdateDeleteAPI,
+)
+from graceful.serializers import BaseSerializer
+
+falcon_asgi = pytest.importorskip('falcon.asgi')
+
+from falcon.util.deprecation import DeprecatedWarning  # noqa
+
+
+class CatSerializer(BaseSerializer):
+    name = RawField("name of a cat")
+    lives = IntField("lives left", min_value=0, max_value=9)
+
+
+class CatResource(AsyncRetrieveUpdateDeleteAPI, with_context=True):
+    serializer = CatSerializer()
+
+    def __init__(self, storage):
+        self.storage = storage
+
+    def get_etag(self, params, context, cat_id, **kwargs):
+        return str(self.storage[int(cat_id)]['lives'])
+
+    async def retrieve(self, params, meta, context, cat_id, **kwargs):
+        await asyncio.sleep(0)
+        return self.storage[int(cat_id)]
+
+    async def update(self, params, meta, validated, context, cat_id,
+                     **kwargs):
+        self.storage[int(cat_id)] = validated
+        return validated
+
+    async def delete(self, params, meta, context, cat_id, **kwargs):
+        self.storage[int(cat_id)] = None
+
+
+class CatListResource(AsyncListCreateAPI, with_context=True):
+    serializer = CatSerializer()
+    hash_etags = True
+    response_cache = InMemoryCache()
+
+    def __init__(self, storage):
+        self.storage = storage
+
+    async def list(self, params, meta, context, **kwargs):
+        return list(self.storage)
+
+    async def create(self, params, meta, validated, context, **kwargs):
+        self.storage.append(validated)
+        return validated
+
+
+class StreamedCatListResource(CatListResource):
+    streaming = True
+    response_cache = None
+
+    async def list(self, params, meta, context, **kwargs):
+        return iter(self.storage)
+
+
+class UserResource:
+    async def on_get(self, req, resp):
+        resp.media = {'user': req.context.get('user')}
+
+
+@pytest.fixture
+def client():
+    storage = [{'name': 'molly', 'lives': 9}, {'name': 'tom', 'lives': 3}]
+
+    app = falcon_asgi.App()
+    app.add_route('/cats/', CatListResource(storage))
+    app.add_route('/streamed/', StreamedCatListResource(storage))
+    app.add_route('/cats/{cat_id}', CatResource(storage))
+
+    with warnings.catch_warnings():
+        # note: resp.body is deprecated since falcon 3.0
+        warnings.simplefilter('error', DeprecatedWarning)
+        yield testing.TestClient(app)
+
+
+def test_asgi_retrieve_update_delete(client):
+    result = client.simulate_get('/cats/0')
+    assert result.status == falcon.HTTP_OK
+    assert result.json['content'] == {'name': 'molly', 'lives': 9}
+
+    result = client.simulate_put(
+        '/cats/0', json={'name': 'molly', 'lives': 8}
+    )
+    assert result.status == falcon.HTTP_ACCEPTED
+    assert result.json['content'] == {'name': 'molly', 'lives': 8}
+
+    result = client.simulate_put('/cats/0', json={'name': 'molly'})
+    assert result.status == falcon.HTTP_BAD_REQUEST
+
+    result = client.simulate_delete('/cats/1')
+    assert result.status == falcon.HTTP_ACCEPTED
+
+
+def test_asgi_conditional_get(client):
+    result = client.simulate_get('/cats/0')
+    etag = result.headers['ETag']
+    assert etag == '"9"'
+
+    result = client.simulate_get('/cats/0', headers={'If-None-Match': etag})
+    assert result.status == falcon.HTTP_NOT_MODIFIED
+    assert result.content == b''
+
+    result = client.simulate_get(
+        '/cats/0', headers={'If-None-Match': '"other", W/' + etag}
+    )
+    assert result.status == falcon.HTTP_NOT_MODIFIED
+
+    result = client.simulate_get(
+        '/cats/0', headers={'If-None-Match': '"other"'}
+    )
+    assert result.status == falcon.HTTP_OK
+
+
+def test_asgi_response_cache(client):
+    first = client.simulate_get('/cats/')
+    assert len(first.json['content']) == 2
+
+    cached = client.simulate_get('/cats/')
+    assert cached.content == first.content
+    assert cached.headers['ETag'] == first.headers['ETag']
+
+    result = client.simulate_get(
+        '/cats/', headers={'If-None-Match': first.headers['ETag']}
+    )
+    assert result.status == falcon.HTTP_NOT_MODIFIED
+
+    client.simulate_post('/cats/', json={'name': 'felix', 'lives': 7})
+    result = client.simulate_get('/cats/')
+    assert len(result.json['content']) == 3
+
+
+def test_asgi_streaming(client):
+    result = client.simulate_get('/streamed/')
+    assert result.status == falcon.HTTP_OK
+    assert result.json['content'] == [
+        {'name': 'molly', 'lives': 9}, {'name': 'tom', 'lives': 3}
+    ]
+
+
+def test_asgi_options(client):
+    result = client.simulate_options('/cats/')
+    assert result.status == falcon.HTTP_OK
+    assert result.json['path'] == '/cats/'
+
+    result = client.simulate_options(
+        '/cats/', headers={'If-None-Match': result.headers['ETag']}
+    )
+    assert result.status == falcon.HTTP_NOT_MODIFIED
+
+
+def test_asgi_cached_async_user_storage():
+    kv_store = graceful_testing.AsyncInMemoryKeyValueStore()
+    storage = authentication.CachedUserStorage(
+        authentication.AsyncKeyValueUserStorage(kv_store)
+    )
+    token = authentication.Token(storage)
+    asyncio.get_event_loop().run_until_complete(
+        storage.register(token, 'foo', {'username': 'foo'})
+    )
+
+    app = falcon_asgi.App(middleware=[token])
+    app.add_route('/', UserResource())
+    client = testing.TestClient(app)
+
+    for _ in range(3):
+        for header, user in (
+            ('Token foo', {'username': 'foo'}), ('Token bar', None)
+        ):
+            result = client.simulate_get(
+                '/', headers={'Authorization': header}
+            )
+            assert result.json['user'] == user
+
+    # note: register and the first lookup of each identifier
+    assert kv_store.round_trips == 3
+    assert storage.stats()['hits'] == 4
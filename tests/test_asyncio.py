@@ -0,0 +1,364 @@
+import asyncio
+import json
+
+import pytest
+
+from falcon.errors import HTTPBadRequest
+import falcon
+from falcon.testing import create_environ
+
+from graceful.resources.base import _get_body
+from graceful.resources.asyncio import (
+    AsyncResource,
+    AsyncListResource,
+    AsyncCursorPaginatedListAPI,
+    AsyncRetrieveUpdateAPI,
+    AsyncRetrieveUpdateDeleteAPI,
+    AsyncListCreateAPI,
+    AsyncPaginatedListAPI,
+)
+
+from .test_generic import ExampleSerializer, StoredResource
+from .test_timing import TimedResource, _request, _phases
+
+
+class AsyncStream:
+    """Request body stream with the interface of ASGI request stream."""
+
+    def __init__(self, data):
+        self.data = data
+
+    async def read(self):
+        return self.data
+
+
+def _run_async(responder, method='GET', body=None, query_string='', **kwargs):
+    """Run asynchronous responder with falcon request and response."""
+    req = falcon.Request(create_environ(
+        method=method, query_string=query_string,
+        headers={'Content-Type': 'application/json'},
+    ))
+    req.stream = AsyncStream(json.dumps(body).encode())
+    resp = falcon.Response()
+
+    loop = asyncio.get_event_loop()
+    loop.run_until_complete(responder(req, resp, **kwargs))
+
+    if resp.stream is not None:
+        return resp, json.loads(
+            b''.join(loop.run_until_complete(_collect(resp.stream)))
+        )
+
+    return resp, json.loads(resp.body) if resp.body else None
+
+
+async def _collect(stream):
+    return [chunk async for chunk in stream]
+
+
+class ExampleAsyncRetrieveUpdateDeleteAPI(
+    AsyncRetrieveUpdateDeleteAPI, StoredResource
+):
+    serializer = ExampleSerializer()
+    hash_etags = True
+
+    async def retrieve(self, params, meta, index, **kwargs):
+        await asyncio.sleep(0)
+        return self.storage[index]
+
+    async def update(self, params, meta, index, validated, **kwargs):
+        self.storage[index] = validated
+        return validated
+
+    async def delete(self, params, meta, index, **kwargs):
+        del self.storage[index]
+
+
+class ExampleAsyncListCreateAPI(AsyncListCreateAPI, StoredResource):
+    serializer = ExampleSerializer()
+
+    async def list(self, params, meta, **kwargs):
+        for obj in self.storage:
+            await asyncio.sleep(0)
+            yield obj
+
+    async def create(self, params, meta, validated, **kwargs):
+        self.storage.append(validated)
+        return validated
+
+
+class ExampleAsyncPaginatedListAPI(AsyncPaginatedListAPI, StoredResource):
+    serializer = ExampleSerializer()
+    fetch_extra_item = True
+
+    async def list(self, params, meta, **kwargs):
+        start = params['page_size'] * params['page']
+        return self.storage[start:start + params['page_size'] + 1]
+
+
+def test_async_retrieve_update_delete():
+    storage = [{"writable": "foo", "readonly": "bar"}]
+    resource = ExampleAsyncRetrieveUpdateDeleteAPI(storage)
+
+    resp, body = _run_async(resource.on_get, index=0)
+    assert body['content']['readonly'] == 'bar'
+    assert resp.etag
+
+    resp, body = _run_async(
+        resource.on_get, query_string='fields=writable', index=0
+    )
+    assert body['content'] == {'writable': 'foo'}
+
+    resp, body = _run_async(
+        resource.on_put, 'PUT',
+        {"writable": "baz", "nullable": None, "unsigned": 1}, index=0
+    )
+    assert resp.status == falcon.HTTP_ACCEPTED
+    assert body['content']['writable'] == 'baz'
+    assert storage[0]['writable'] == 'baz'
+
+    with pytest.raises(HTTPBadRequest):
+        _run_async(
+            resource.on_put, 'PUT',
+            {"writable": "baz", "nullable": None, "unsigned": -1},
+            index=0
+        )
+
+    resp, body = _run_async(resource.on_delete, 'DELETE', index=0)
+    assert resp.status == falcon.HTTP_ACCEPTED
+    assert storage == []
+
+    with pytest.raises(IndexError):
+        _run_async(resource.on_get, index=0)
+
+    resp, body = _run_async(resource.on_options, 'OPTIONS')
+    assert body['type'] == 'object'
+
+
+def test_async_list_create():
+    storage = []
+    resource = ExampleAsyncListCreateAPI(storage)
+
+    resp, body = _run_async(
+        resource.on_post, 'POST',
+        {"writable": "foo", "nullable": None, "unsigned": 1}
+    )
+    assert resp.status == falcon.HTTP_CREATED
+    assert body['content']['writable'] == 'foo'
+
+    resp, body = _run_async(
+        resource.on_patch, 'PATCH',
+        [
+            {"writable": "bar", "nullable": None, "unsigned": 2},
+            {"writable": "baz", "nullable": 1, "unsigned": 3},
+        ]
+    )
+    assert resp.status == falcon.HTTP_CREATED
+    assert len(body['content']) == 2
+
+    with pytest.raises(HTTPBadRequest):
+        _run_async(resource.on_patch, 'PATCH', {"writable": "bar"})
+
+    resp, body = _run_async(resource.on_get)
+    assert [item['writable'] for item in body['content']] == [
+        'foo', 'bar', 'baz'
+    ]
+
+
+def test_async_concurrent_create_bulk():
+    class ConcurrentListCreateAPI(ExampleAsyncListCreateAPI):
+        create_bulk_concurrency = 2
+        running = maximum = 0
+
+        async def create(self, params, meta, validated, **kwargs):
+            self.running += 1
+            self.maximum = max(self.maximum, self.running)
+            await asyncio.sleep(0.01 * (5 - validated['unsigned']))
+            self.running -= 1
+
+            if validated['unsigned'] == 3:
+                raise falcon.HTTPConflict()
+
+            return validated
+
+    resource = ConcurrentListCreateAPI()
+    resp, body = _run_async(resource.on_patch, 'PATCH', [
+        {"writable": str(index), "nullable": None, "unsigned": index}
+        for index in range(5)
+    ])
+
+    assert resp.status == falcon.HTTP_MULTI_STATUS
+    assert resource.maximum == 2
+    assert [item and item['writable'] for item in body['content']] == [
+        '0', '1', '2', None, '4'
+    ]
+    assert [error['index'] for error in body['meta']['errors']] == [3]
+
+
+def test_async_concurrent_create_bulk_cancelled_and_meta():
+    class ConcurrentListCreateAPI(ExampleAsyncListCreateAPI):
+        create_bulk_concurrency = 2
+
+        async def create(self, params, meta, validated, **kwargs):
+            await asyncio.sleep(0)
+            meta.setdefault('created', []).append(validated['unsigned'])
+
+            if validated['unsigned'] == 1:
+                raise asyncio.CancelledError()
+
+            return validated
+
+    resource = ConcurrentListCreateAPI()
+    resp, body = _run_async(resource.on_patch, 'PATCH', [
+        {"writable": str(index), "nullable": None, "unsigned": index}
+        for index in range(3)
+    ])
+
+    assert resp.status == falcon.HTTP_MULTI_STATUS
+    assert [item and item['writable'] for item in body['content']] == [
+        '0', None, '2'
+    ]
+    assert [error['index'] for error in body['meta']['errors']] == [1]
+    # note: every item works on its own copy of meta
+    assert body['meta']['created'] == [2]
+
+
+def test_async_paginated_list():
+    storage = [{"writable": str(index)} for index in range(5)]
+    resource = ExampleAsyncPaginatedListAPI(storage)
+
+    resp, body = _run_async(resource.on_get, query_string='page_size=3')
+    assert len(body['content']) == 3
+    assert body['meta']['next'] == "page=1&page_size=3"
+
+    resp, body = _run_async(
+        resource.on_get, query_string='page=1&page_size=3'
+    )
+    assert len(body['content']) == 2
+    assert body['meta']['next'] is None
+
+
+class ExampleAsyncCountedListAPI(ExampleAsyncPaginatedListAPI):
+    total_count = 'exact'
+    total_count_ttl = 60
+    counted = 0
+
+    async def count(self, params, **kwargs):
+        await asyncio.sleep(0)
+        self.counted += 1
+        return len(self.storage)
+
+
+@pytest.mark.parametrize('streaming', [False, True])
+def test_async_paginated_list_total_count(streaming):
+    class CountedListAPI(ExampleAsyncCountedListAPI):
+        pass
+
+    CountedListAPI.streaming = streaming
+    storage = [{"writable": str(index)} for index in range(5)]
+    resource = CountedListAPI(storage)
+
+    for _ in range(2):
+        resp, body = _run_async(resource.on_get, query_string='page_size=2')
+        assert body['meta']['total'] == 5
+
+    # note: totals are cached per filter parameters
+    assert resource.counted == 1
+
+    resource.total_count = 'approximate'
+    resp, body = _run_async(resource.on_get, query_string='page_size=2')
+    assert body['meta']['total'] == 5
+    assert body['meta']['total_approximate'] is True
+    assert resource.counted == 2
+
+
+def test_async_paginated_list_total_from_last_page():
+    resource = ExampleAsyncCountedListAPI(
+        [{"writable": str(index)} for index in range(5)]
+    )
+
+    resp, body = _run_async(
+        resource.on_get, query_string='page=1&page_size=3'
+    )
+    assert body['meta']['total'] == 5
+    assert resource.counted == 0
+
+
+def test_async_cursor_paginated_list():
+    class CursorListAPI(AsyncCursorPaginatedListAPI, StoredResource):
+        serializer = ExampleSerializer()
+        cursor_secret = b'secret'
+        cursor_fields = ('readonly',)
+
+        async def list(self, params, meta, **kwargs):
+            key = params.get('cursor', [None])[0]
+            after = [
+                obj for obj in self.storage
+                if key is None or obj['readonly'] > key
+            ]
+            meta['has_more'] = len(after) > params['page_size']
+            return after[:params['page_size']]
+
+    resource = CursorListAPI([
+        {"writable": "foo", "readonly": str(index)} for index in range(5)
+    ])
+
+    resp, body = _run_async(resource.on_get, query_string='page_size=3')
+    assert [item['readonly'] for item in body['content']] == ['0', '1', '2']
+
+    resp, body = _run_async(
+        resource.on_get, query_string='page_size=3&' + body['meta']['next']
+    )
+    assert [item['readonly'] for item in body['content']] == ['3', '4']
+
+
+def test_async_resources_without_serialization():
+    class ExampleResource(AsyncResource):
+        async def retrieve(self, params, meta, **kwargs):
+            return {'sample': 'resource'}
+
+    class ExampleListResource(AsyncListResource):
+        async def list(self, params, meta, **kwargs):
+            return [{'sample': 'resource'}]
+
+    resp, body = _run_async(ExampleResource().on_get)
+    assert body['content'] == {'sample': 'resource'}
+
+    resp, body = _run_async(ExampleListResource().on_get)
+    assert body['content'] == [{'sample': 'resource'}]
+
+
+def test_async_list_streaming():
+    class StreamingListAPI(ExampleAsyncPaginatedListAPI):
+        streaming = True
+
+    storage = [{"writable": str(index)} for index in range(5)]
+    resource = StreamingListAPI(storage)
+
+    resp, body = _run_async(resource.on_get, query_string='page_size=3')
+    assert resp.stream is not None
+    assert [item['writable'] for item in body['content']] == ['0', '1', '2']
+    assert body['meta']['has_more'] is True
+    assert body['meta']['next'] == "page=1&page_size=3"
+
+
+class AsyncTimedResource(AsyncRetrieveUpdateAPI, TimedResource):
+    async def retrieve(self, params, meta, context, **kwargs):
+        return super().retrieve(params, meta, context, **kwargs)
+
+
+def test_async_resource_timing():
+    resource = AsyncTimedResource()
+    loop = asyncio.get_event_loop()
+
+    req, resp = _request()
+    loop.run_until_complete(resource.on_get(req, resp))
+    assert _phases(resp) == [
+        'params', 'precondition', 'db', 'handler', 'render', 'finalize'
+    ]
+
+    req, resp = _request('PUT')
+    req.stream = AsyncStream(b'{"name": "bar"}')
+    loop.run_until_complete(resource.on_put(req, resp))
+    assert json.loads(_get_body(resp))['content'] == {'name': 'bar'}
+    assert _phases(resp)[:2] == ['decode', 'validate']
@@ -1,15 +1,21 @@
 # -*- coding: utf-8 -*-
+import asyncio
 import base64
+from concurrent.futures import ThreadPoolExecutor
 import pytest
 import hashlib
+import threading
+import time
 
 from falcon.testing import TestBase
-from falcon import API
+from falcon import API, Request, Response
 from falcon import status_codes
+from falcon.testing import TestClient, create_environ
 
 from graceful.resources.base import BaseResource
 from graceful import authentication
 from graceful import authorization
+from graceful import testing
 
 
 @authorization.authentication_required
@@ -85,6 +91,8 @@ class AuthTestsMixin:
     ident_keys = ['password']
     auth_storage = ExampleKVUserStorage()
     auth_middleware = [authentication.Anonymous(user)]
+    # note: middleware used to register user (defaults to the first one)
+    register_with = None
 
     def get_authorized_headers(self):
         raise NotImplementedError
@@ -105,7 +113,7 @@ class AuthTestsMixin:
         identity = [self.user[key] for key in self.ident_keys]
 
         self.auth_storage.register(
-            self.auth_middleware[0],
+            self.register_with or self.auth_middleware[0],
             identity[0] if len(identity) == 1 else identity,
             self.user
         )
@@ -200,6 +208,22 @@ class TokenAuthTestCase(AuthTestsMixin, TestBase):
         return {"Authorization": "Token Token Token"}
 
 
+class SignedTokenAuthTestCase(AuthTestsMixin, TestBase):
+    auth_middleware = [authentication.SignedToken({'key': b'secret'})]
+    ident_keys = ['token']
+
+    def get_authorized_headers(self):
+        token = self.auth_middleware[0].issue(self.user, ttl=60)
+        return {"Authorization": "Bearer " + token}
+
+    def get_unauthorized_headers(self):
+        forged = authentication.SignedToken({'key': b'forged'}).issue({})
+        return {"Authorization": "Bearer " + forged}
+
+    def get_invalid_headers(self):
+        return {"Authorization": "Bearer Bearer Bearer"}
+
+
 class XAPIKeyAuthTestCase(AuthTestsMixin, TestBase):
     auth_middleware = [authentication.XAPIKey(AuthTestsMixin.auth_storage)]
     ident_keys = ['token']
@@ -288,6 +312,61 @@ class IPRangeXForwardedForAuthTestCase(AuthTestsMixin, TestBase):
         raise self.SkipTest
 
 
+class CompiledIPRangeXForwardedForAuthTestCase(
+    IPRangeXForwardedForAuthTestCase
+):
+    class IPRangeWhitelistStorage(authentication.IPRangeWhitelistStorage):
+        def register(self, identified_with, identity, user):
+            self.ip_range.reload(*identity)
+            self.user = user
+
+        def clear(self):
+            self.ip_range.reload()
+            self.user = None
+
+    auth_storage = IPRangeWhitelistStorage(authentication.IPWhitelist(), None)
+    auth_middleware = [
+        authentication.XForwardedFor(auth_storage)
+    ]
+
+
+def test_ip_whitelist_membership():
+    whitelist = authentication.IPWhitelist(
+        '10.0.0.0/24', '10.0.1.0/24', '10.0.0.128/25', '192.168.1.1',
+        '2001:db8::/32', '2001:db8:1::1/64',
+    )
+
+    assert [str(network) for network in whitelist] == [
+        '10.0.0.0/23', '192.168.1.1/32', '2001:db8::/32',
+    ]
+
+    for address in (
+        '10.0.0.0', '10.0.1.255', '192.168.1.1', '2001:db8:ffff::1',
+        '::ffff:10.0.0.1',
+    ):
+        assert address in whitelist
+
+    for address in (
+        '9.255.255.255', '10.0.2.0', '192.168.1.2', '2001:db9::',
+        '0.0.0.0', '::', None, 'not an address', '10.0.0.0/24',
+    ):
+        assert address not in whitelist
+
+
+def test_ip_whitelist_reload():
+    whitelist = authentication.IPWhitelist('127.0.0.1')
+
+    with pytest.raises(ValueError):
+        whitelist.reload('127.0.0.2', '10.0.0.0/33')
+
+    assert '127.0.0.1' in whitelist
+
+    whitelist.reload('10.0.0.0/8')
+    assert '127.0.0.1' not in whitelist
+    assert '10.1.2.3' in whitelist
+    assert repr(whitelist) == "IPWhitelist('10.0.0.0/8')"
+
+
 class MultipleAuthTestCase(AuthTestsMixin, TestBase):
     auth_middleware = [
         authentication.Token(AuthTestsMixin.auth_storage),
@@ -306,3 +385,521 @@ class MultipleAuthTestCase(AuthTestsMixin, TestBase):
 
     def get_authorized_headers(self):
         return {"Authorization": "Token " + self.user['password']}
+
+
+class CompositeAuthTestCase(TokenAuthTestCase):
+    register_with = authentication.Token(AuthTestsMixin.auth_storage)
+    auth_middleware = [
+        authentication.CompositeAuthentication(
+            authentication.Basic(AuthTestsMixin.auth_storage),
+            register_with,
+            authentication.XAPIKey(AuthTestsMixin.auth_storage),
+        )
+    ]
+
+
+class CountingToken(authentication.Token):
+    def identify_authorization(self, auth, *args):
+        self.calls = getattr(self, 'calls', 0) + 1
+        return super().identify_authorization(auth, *args)
+
+
+def _composite_request(headers):
+    req = Request(create_environ(headers=headers))
+    return req, Response()
+
+
+def test_composite_auth_dispatch():
+    storage = ExampleKVUserStorage()
+    user = {'username': 'foo'}
+    token = CountingToken(storage)
+    basic = authentication.Basic(storage)
+    api_key = authentication.XAPIKey(storage)
+    composite = authentication.CompositeAuthentication(basic, token, api_key)
+    storage.register(token, 'secret', user)
+    storage.register(api_key, 'secret', user)
+
+    assert composite.challenges == [basic.challenge, 'Token', 'X-Api-Key']
+
+    req, resp = _composite_request({'Authorization': 'Token secret'})
+    composite.process_resource(req, resp, None, {})
+    assert req.context['user'] == user
+    assert token.calls == 1
+    assert 'challenges' not in req.context
+
+    # note: unknown scheme falls back to header-based middlewares only
+    req, resp = _composite_request({
+        'Authorization': 'Bearer secret', 'X-Api-Key': 'secret'
+    })
+    composite.process_resource(req, resp, None, {})
+    assert req.context['user'] == user
+    assert token.calls == 1
+
+    req, resp = _composite_request({'Authorization': 'Basic Zm9vOmJhcg=='})
+    composite.process_resource(req, resp, None, {})
+    assert 'user' not in req.context
+    assert req.context['challenges'] == composite.challenges
+    assert token.calls == 1
+
+    # note: challenges are the same as with separate middlewares
+    req, resp = _composite_request({})
+    for middleware in (basic, token, api_key):
+        middleware.process_resource(req, resp, None, {})
+    assert req.context['challenges'] == composite.challenges
+
+
+def test_composite_auth_async():
+    storage = authentication.AsyncKeyValueUserStorage(
+        testing.AsyncInMemoryKeyValueStore()
+    )
+    token = authentication.Token(storage)
+    composite = authentication.CompositeAuthentication(
+        authentication.Anonymous(None), token,
+    )
+    loop = asyncio.get_event_loop()
+    loop.run_until_complete(
+        storage.register(token, 'secret', {'username': 'foo'})
+    )
+
+    req, resp = _composite_request({'Authorization': 'Token secret'})
+    loop.run_until_complete(
+        composite.process_resource_async(req, resp, None, {})
+    )
+    assert req.context['user'] == {'username': 'foo'}
+
+    req, resp = _composite_request({'Authorization': 'Token invalid'})
+    loop.run_until_complete(
+        composite.process_resource_async(req, resp, None, {})
+    )
+    assert 'user' not in req.context
+    assert req.context['challenges'] == ['Token']
+
+
+def test_signed_token_verification():
+    now = [1000.0]
+    middleware = authentication.SignedToken(
+        {'key': b'secret'}, clock=lambda: now[0]
+    )
+    token = middleware.issue({'username': 'foo'}, ttl=10)
+    key_id, claims, signature = token.split('.')
+
+    assert middleware.verify(token) == {'username': 'foo', 'exp': 1010}
+    assert middleware.verification_cache.stats()['size'] == 1
+
+    for invalid in (
+        'foo', '..', token + '.', 'other.' + claims + '.' + signature,
+        key_id + '.' + claims + '.' + signature[:-2],
+        key_id + '.' + claims[:-2] + '.' + signature,
+        key_id + '.' + claims + '.' + 'zażółć',
+    ):
+        assert middleware.verify(invalid) is None
+
+    # note: tokens with invalid signature are never cached
+    assert middleware.verification_cache.stats()['size'] == 1
+
+    now[0] = 1010
+    assert middleware.verify(token) is None
+
+    uncached = authentication.SignedToken({'key': b'secret'}, cache_size=0)
+    assert uncached.verification_cache is None
+    assert uncached.verify(uncached.issue({'foo': 'bar'})) == {'foo': 'bar'}
+
+
+@pytest.mark.parametrize('expires', [
+    'never', '2000', True, [2000], {'at': 2000}, float('nan'),
+])
+def test_signed_token_invalid_expiry(expires):
+    middleware = authentication.SignedToken(
+        {'key': b'secret'}, clock=lambda: 1000.0
+    )
+    token = middleware.issue({'username': 'foo', 'exp': expires})
+
+    assert middleware.verify(token) is None
+
+    req = Request(create_environ(
+        headers={'Authorization': 'Bearer ' + token}
+    ))
+    middleware.process_resource(req, Response(), None, {})
+    assert 'user' not in req.context
+
+
+def test_signed_token_key_rotation():
+    middleware = authentication.SignedToken({'old': b'old secret'})
+    old_token = middleware.issue({'username': 'foo'})
+
+    with pytest.raises(ValueError):
+        middleware.update_keys({'old': b'old secret', 'new': b'new secret'})
+
+    with pytest.raises(ValueError):
+        middleware.update_keys({'with.dot': b'secret'})
+
+    middleware.update_keys(
+        {'old': b'old secret', 'new': b'new secret'}, signing_key_id='new'
+    )
+    new_token = middleware.issue({'username': 'bar'})
+
+    assert new_token.startswith('new.')
+    assert middleware.verify(old_token) == {'username': 'foo'}
+    assert middleware.verify(new_token) == {'username': 'bar'}
+
+    middleware.update_keys({'new': b'new secret'})
+    assert middleware.verify(old_token) is None
+    assert middleware.verify(new_token) == {'username': 'bar'}
+
+
+class CountingKVUserStorage(ExampleKVUserStorage):
+    lookups = 0
+
+    def get_user(self, *args, **kwargs):
+        self.lookups += 1
+        return super().get_user(*args, **kwargs)
+
+
+def test_cached_user_storage():
+    now = [0]
+    backend = CountingKVUserStorage()
+    storage = authentication.CachedUserStorage(
+        backend, ttl=10, negative_ttl=1, clock=lambda: now[0]
+    )
+    token = authentication.Token(storage)
+    storage.register(token, 'valid', {'username': 'foo'})
+
+    def get_user(identifier):
+        return storage.get_user(token, identifier, None, None, None, None)
+
+    for _ in range(3):
+        assert get_user('valid') == {'username': 'foo'}
+        assert get_user('invalid') is None
+
+    assert backend.lookups == 2
+    assert storage.stats()['hits'] == 4
+    assert storage.stats()['misses'] == 2
+
+    # note: negative entries expire sooner
+    now[0] = 5
+    assert get_user('invalid') is None
+    assert get_user('valid') == {'username': 'foo'}
+    assert backend.lookups == 3
+
+    storage.register(token, 'invalid', {'username': 'bar'})
+    assert get_user('invalid') == {'username': 'bar'}
+    assert backend.lookups == 4
+
+
+def test_cached_user_storage_hashes_identifiers():
+    storage = authentication.CachedUserStorage(
+        authentication.DummyUserStorage({'username': 'foo'}),
+    )
+    basic = authentication.Basic(storage)
+
+    assert storage.get_user(
+        basic, ('foo', 'secretP4ssw0rd'), None, None, None, None
+    ) == {'username': 'foo'}
+    assert not any(
+        'secretP4ssw0rd' in key for _, key in storage.cache._entries
+    )
+
+
+class ExampleCachedUserStorage(authentication.CachedUserStorage):
+    def clear(self):
+        self.user_storage.clear()
+        self.cache.invalidate('Basic')
+
+
+class CachedBasicAuthTestCase(BasicAuthTestCase):
+    auth_storage = ExampleCachedUserStorage(AuthTestsMixin.auth_storage)
+    auth_middleware = [authentication.Basic(auth_storage)]
+
+
+class PipelineOnlyKVStore:
+    """Key-value store without mget() that supports only pipelines."""
+
+    def __init__(self):
+        self.kv_store = testing.InMemoryKeyValueStore()
+        self.set = self.kv_store.set
+        self.pipeline = self.kv_store.pipeline
+
+    @property
+    def round_trips(self):
+        return self.kv_store.round_trips
+
+
+@pytest.mark.parametrize('kv_store', [
+    testing.InMemoryKeyValueStore(),
+    PipelineOnlyKVStore(),
+    ExampleKVUserStorage.SimpleKVStore(),
+])
+def test_kv_storage_get_users_many(kv_store):
+    storage = authentication.KeyValueUserStorage(kv_store)
+    token = authentication.Token(storage)
+
+    storage.register(token, 'foo', {'username': 'foo'})
+    storage.register(token, 'bar', {'username': 'bar'})
+    round_trips = getattr(kv_store, 'round_trips', 0)
+
+    assert storage.get_users_many(token, ['bar', 'baz', 'foo']) == [
+        {'username': 'bar'}, None, {'username': 'foo'}
+    ]
+    assert storage.get_users_many(token, []) == []
+
+    if hasattr(kv_store, 'round_trips'):
+        assert kv_store.round_trips == round_trips + 1
+
+
+def test_in_memory_kv_store_expiry():
+    now = [0]
+    kv_store = testing.InMemoryKeyValueStore(clock=lambda: now[0])
+
+    kv_store.set('foo', 'bar', ex=10)
+    assert kv_store.incr('counter') == 1
+    assert kv_store.incr('counter') == 2
+    assert kv_store.mget(['foo', 'counter', 'baz']) == [b'bar', b'2', None]
+
+    now[0] = 10
+    assert kv_store.get('foo') is None
+    assert kv_store.delete('counter', 'foo') == 1
+
+
+def test_pooled_kv_storage_bounds_clients():
+    created = []
+    busy = []
+    peak = []
+    kv_store = testing.InMemoryKeyValueStore()
+    lock = threading.Lock()
+
+    class SlowClient:
+        def __init__(self):
+            created.append(self)
+
+        def get(self, key):
+            with lock:
+                busy.append(self)
+                peak.append(len(busy))
+            time.sleep(0.01)
+            with lock:
+                busy.remove(self)
+            return kv_store.get(key)
+
+        def set(self, key, value):
+            return kv_store.set(key, value)
+
+    storage = authentication.PooledKeyValueUserStorage(SlowClient, pool_size=3)
+    token = authentication.Token(storage)
+    storage.register(token, 'foo', {'username': 'foo'})
+
+    with ThreadPoolExecutor(8) as executor:
+        users = list(executor.map(
+            lambda _: storage.get_user(token, 'foo', None, None, None, None),
+            range(16)
+        ))
+
+    assert users == [{'username': 'foo'}] * 16
+    assert len(created) <= 3
+    assert max(peak) <= 3
+
+
+def test_pooled_kv_storage_discards_failed_clients():
+    created = []
+    kv_store = testing.InMemoryKeyValueStore()
+
+    class FlakyClient:
+        def __init__(self):
+            self.broken = False
+            created.append(self)
+
+        def get(self, key):
+            if self.broken:
+                raise ConnectionError()
+            return kv_store.get(key)
+
+        def set(self, key, value):
+            return kv_store.set(key, value)
+
+    storage = authentication.PooledKeyValueUserStorage(
+        FlakyClient, pool_size=1
+    )
+    token = authentication.Token(storage)
+    storage.register(token, 'foo', {'username': 'foo'})
+    created[0].broken = True
+
+    with pytest.raises(ConnectionError):
+        storage.get_user(token, 'foo', None, None, None, None)
+
+    # note: failed client is not reused and its pool slot is released
+    assert storage.get_user(token, 'foo', None, None, None, None) == {
+        'username': 'foo'
+    }
+    assert len(created) == 2
+
+
+def test_async_kv_storage_collapses_lookups():
+    kv_store = testing.AsyncInMemoryKeyValueStore()
+    storage = authentication.AsyncKeyValueUserStorage(kv_store)
+    token = authentication.Token(storage)
+
+    async def scenario():
+        await storage.register(token, 'foo', {'username': 'foo'})
+        users = await asyncio.gather(*(
+            storage.get_user(token, identifier, None, None, None, None)
+            for identifier in ('foo', 'bar', 'foo', 'foo')
+        ))
+        many = await storage.get_users_many(token, ['bar', 'foo'])
+        return users, many
+
+    users, many = asyncio.get_event_loop().run_until_complete(scenario())
+
+    assert users == [{'username': 'foo'}, None] + [{'username': 'foo'}] * 2
+    assert users[0] is not users[2]
+    assert many == [None, {'username': 'foo'}]
+    # note: register, single collapsed lookup and get_users_many
+    assert kv_store.round_trips == 3
+
+
+def test_async_kv_storage_lookup_outlives_cancelled_waiters():
+    class BrokenKeyValueStore(testing.AsyncInMemoryKeyValueStore):
+        async def mget(self, keys):
+            await self._round_trip()
+            raise ConnectionError("connection lost")
+
+    storage = authentication.AsyncKeyValueUserStorage(
+        BrokenKeyValueStore(latency=0.01)
+    )
+    token = authentication.Token(storage)
+    loop = asyncio.get_event_loop()
+    errors = []
+
+    async def scenario():
+        waiters = [
+            asyncio.ensure_future(
+                storage.get_user(token, identifier, None, None, None, None)
+            )
+            for identifier in ('foo', 'bar')
+        ]
+        await asyncio.sleep(0)
+        lookup = storage._lookup
+
+        for waiter in waiters:
+            waiter.cancel()
+
+        await asyncio.gather(*waiters, return_exceptions=True)
+        # note: lookup is still referenced by the storage after all its
+        #       waiters are gone
+        assert storage._lookup is lookup
+        await asyncio.wait([lookup])
+
+    loop.set_exception_handler(lambda loop, context: errors.append(context))
+
+    try:
+        loop.run_until_complete(scenario())
+    finally:
+        loop.set_exception_handler(None)
+
+    assert storage._lookup is None
+    assert storage.kv_store.round_trips == 1
+    assert errors == []
+
+
+def test_async_middleware_awaits_storage():
+    storage = authentication.AsyncKeyValueUserStorage(
+        testing.AsyncInMemoryKeyValueStore(), collapse_lookups=False
+    )
+    token = authentication.Token(storage)
+    loop = asyncio.get_event_loop()
+    loop.run_until_complete(
+        storage.register(token, 'foo', {'username': 'foo'})
+    )
+
+    for header, user in (
+        ('Token foo', {'username': 'foo'}), ('Token bar', None)
+    ):
+        req = Request(create_environ(headers={'Authorization': header}))
+        loop.run_until_complete(
+            token.process_resource_async(req, Response(), None, {})
+        )
+        assert req.context.get('user') == user
+
+
+def test_sync_middleware_rejects_async_storage():
+    storage = authentication.AsyncKeyValueUserStorage(
+        testing.AsyncInMemoryKeyValueStore(), collapse_lookups=False
+    )
+    token = authentication.Token(storage)
+    composite = authentication.CompositeAuthentication(token)
+    asyncio.get_event_loop().run_until_complete(
+        storage.register(token, 'foo', {'username': 'foo'})
+    )
+
+    for middleware in (token, composite):
+        app = API(middleware=[middleware])
+        app.add_route('/', ExampleResource())
+        client = TestClient(app)
+
+        # note: awaitables of asynchronous storage can't be awaited in WSGI
+        #       application so requests are never authenticated
+        for header in ('Token bogus', 'Token foo'):
+            with pytest.warns(RuntimeWarning):
+                result = client.simulate_get(
+                    '/', headers={'Authorization': header}
+                )
+            assert result.status == status_codes.HTTP_UNAUTHORIZED
+
+
+def _basic_request(username, password):
+    return Request(create_environ(headers={
+        'Authorization': 'Basic ' + base64.b64encode(
+            ':'.join((username, password)).encode()
+        ).decode()
+    }))
+
+
+def test_basic_verification_cache():
+    storage = CountingKVUserStorage()
+    basic = authentication.Basic(storage, verification_cache_ttl=30)
+    storage.register(basic, ['foo', 'secret'], {'username': 'foo'})
+
+    for username, password, user in [
+        ('foo', 'secret', {'username': 'foo'}),
+        ('foo', 'wrong', None),
+    ] * 3:
+        req = _basic_request(username, password)
+        basic.process_resource(req, Response(), None, {})
+        assert req.context.get('user') == user
+
+    # note: failed verifications are never cached
+    assert storage.lookups == 4
+    assert not any(
+        'secret' in key for _, key in basic.verification_cache._entries
+    )
+
+    basic.flush_verification_cache('bar')
+    basic.process_resource(_basic_request('foo', 'secret'), Response(), None)
+    assert storage.lookups == 4
+
+    basic.flush_verification_cache('foo')
+    basic.process_resource(_basic_request('foo', 'secret'), Response(), None)
+    assert storage.lookups == 5
+
+    basic.flush_verification_cache()
+    basic.process_resource(_basic_request('foo', 'secret'), Response(), None)
+    assert storage.lookups == 6
+
+
+def test_basic_verification_cache_async_storage():
+    kv_store = testing.AsyncInMemoryKeyValueStore()
+    storage = authentication.AsyncKeyValueUserStorage(kv_store)
+    basic = authentication.Basic(storage, verification_cache_ttl=30)
+    loop = asyncio.get_event_loop()
+
+    loop.run_until_complete(
+        storage.register(basic, ('foo', 'secret'), {'username': 'foo'})
+    )
+
+    for _ in range(3):
+        req = _basic_request('foo', 'secret')
+        loop.run_until_complete(
+            basic.process_resource_async(req, Response(), None)
+        )
+        assert req.context['user'] == {'username': 'foo'}
+
+    # note: register and the first lookup
+    assert kv_store.round_trips == 2
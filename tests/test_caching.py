@@ -0,0 +1,330 @@
+from concurrent.futures import ThreadPoolExecutor
+import json
+
+import pytest
+
+from falcon import Request, Response
+from falcon.testing import create_environ
+import falcon
+
+from graceful.caching import CachedResponse, InMemoryCache, KeyValueCache
+from graceful.resources.base import BaseResource, _as_bytes, _get_body
+from graceful.fields import IntField
+from graceful.resources import mixins
+from graceful.resources.generic import PaginatedListAPI
+from graceful.serializers import BaseSerializer
+
+
+class SimpleKVStore(dict):
+    """Minimal Redis-like key-value store (without expiry)."""
+
+    def __init__(self):
+        super().__init__()
+        self.expiries = {}
+
+    def set(self, key, value, ex=None):
+        self[key] = value
+        self.expiries[key] = ex
+
+    def incr(self, key):
+        self[key] = str(int(self.get(key) or 0) + 1).encode()
+
+
+class ItemSerializer(BaseSerializer):
+    id = IntField("item identifier")
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0
+
+    def __call__(self):
+        return self.now
+
+
+def response(body):
+    return CachedResponse('application/json', body, '"etag"')
+
+
+@pytest.fixture(params=['memory', 'kv'])
+def cache(request):
+    if request.param == 'memory':
+        return InMemoryCache()
+    else:
+        return KeyValueCache(SimpleKVStore())
+
+
+def test_cache_get_set_invalidate(cache):
+    assert cache.get('ns', 'key') is None
+
+    cache.set('ns', 'key', response(b'{"foo": "bar"}'))
+    cache.set('other', 'key', response(b'{}'))
+
+    cached = cache.get('ns', 'key')
+    assert cached.body == b'{"foo": "bar"}'
+    assert cached.content_type == 'application/json'
+    assert cached.etag == '"etag"'
+
+    cache.invalidate('ns')
+
+    assert cache.get('ns', 'key') is None
+    assert cache.get('other', 'key').body == b'{}'
+
+    assert cache.stats()['hits'] == 2
+    assert cache.stats()['misses'] == 2
+    assert cache.stats()['hit_ratio'] == 0.5
+
+
+def test_cache_set_with_custom_ttl(cache):
+    cache.set('ns', 'key', response(b'{}'), ttl=5)
+    cache.set('ns', 'default', response(b'{}'))
+
+    assert cache.get('ns', 'key').body == b'{}'
+
+    if isinstance(cache, KeyValueCache):
+        assert sorted(cache.kv_store.expiries.values()) == [5, cache.ttl]
+    else:
+        assert cache._entries['ns', 'key'][0] < (
+            cache._entries['ns', 'default'][0]
+        )
+
+
+def test_cache_counts_concurrent_lookups(cache):
+    cache.set('ns', 'key', response(b'{}'))
+
+    def lookup(key):
+        for _ in range(100):
+            cache.get('ns', key)
+
+    with ThreadPoolExecutor(8) as executor:
+        list(executor.map(lookup, ['key', 'missing'] * 8))
+
+    assert cache.stats()['hits'] == 800
+    assert cache.stats()['misses'] == 800
+
+
+def test_cache_skips_stale_generation(cache):
+    generation = cache.generation('ns')
+    cache.invalidate('ns')
+
+    # note: response created before invalidation is never served
+    cache.set('ns', 'key', response(b'stale'), generation=generation)
+    assert cache.get('ns', 'key') is None
+
+    cache.set(
+        'ns', 'key', response(b'fresh'), generation=cache.generation('ns')
+    )
+    assert cache.get('ns', 'key').body == b'fresh'
+
+
+def test_in_memory_cache_namespace_index():
+    cache = InMemoryCache(max_size=3)
+
+    cache.set('ns', 'first', response(b'1'))
+    cache.set('other', 'first', response(b'1'))
+    cache.set('ns', 'second', response(b'2'))
+    cache.delete('ns', 'second')
+    cache.set('ns', 'third', response(b'3'))
+    # note: evicts least recently used entry of 'ns' namespace
+    cache.set('other', 'second', response(b'2'))
+
+    assert cache._namespaces == {
+        'ns': {'third'}, 'other': {'first', 'second'}
+    }
+
+    cache.invalidate('other')
+    assert cache._namespaces == {'ns': {'third'}}
+    assert list(cache._entries) == [('ns', 'third')]
+
+
+def test_in_memory_cache_ttl():
+    clock = Clock()
+    cache = InMemoryCache(ttl=10, clock=clock)
+
+    cache.set('ns', 'key', response(b'{}'))
+    clock.now = 9
+    assert cache.get('ns', 'key') is not None
+
+    clock.now = 10
+    assert cache.get('ns', 'key') is None
+    assert cache.stats()['size'] == 0
+
+
+def test_in_memory_cache_lru_eviction():
+    cache = InMemoryCache(max_size=2)
+
+    cache.set('ns', 'first', response(b'1'))
+    cache.set('ns', 'second', response(b'2'))
+    # note: first is now the most recently used entry
+    cache.get('ns', 'first')
+    cache.set('ns', 'third', response(b'3'))
+
+    assert cache.get('ns', 'second') is None
+    assert cache.get('ns', 'first').body == b'1'
+    assert cache.get('ns', 'third').body == b'3'
+    assert cache.stats()['evictions'] == 1
+    assert cache.stats()['size'] == 2
+
+
+class CachedResource(
+    mixins.RetrieveMixin, mixins.UpdateMixin, BaseResource,
+    with_context=False,
+):
+    cache_namespace = 'items'
+    hash_etags = True
+
+    def __init__(self, cache):
+        self.response_cache = cache
+        self.retrieved = 0
+
+    def retrieve(self, params, meta, **kwargs):
+        self.retrieved += 1
+        return {'retrieved': self.retrieved, 'kwargs': kwargs}
+
+    def update(self, params, meta, **kwargs):
+        return {}
+
+
+def _request(resource, method='GET', query_string='', **kwargs):
+    req = Request(create_environ(
+        method=method, query_string=query_string, headers=kwargs.pop(
+            'headers', {}
+        )
+    ))
+    resp = Response()
+    getattr(resource, 'on_' + method.lower())(req, resp, **kwargs)
+    return resp
+
+
+def test_resource_response_cache(cache):
+    resource = CachedResource(cache)
+
+    first = _request(resource, index=1)
+    assert json.loads(_get_body(first))['content']['retrieved'] == 1
+
+    # note: handler is not called on cache hit
+    cached = _request(resource, index=1)
+    assert resource.retrieved == 1
+    # note: cached bodies are always stored as bytes
+    assert _as_bytes(_get_body(cached)) == _as_bytes(_get_body(first))
+    assert cached.etag == first.etag
+    assert cached.content_type == first.content_type
+
+    # note: different uri variables and params have separate cache entries
+    _request(resource, index=2)
+    _request(resource, query_string='indent=2', index=1)
+    assert resource.retrieved == 3
+
+    resp = _request(resource, headers={'If-None-Match': first.etag}, index=1)
+    assert resp.status == falcon.HTTP_NOT_MODIFIED
+    assert resource.retrieved == 3
+
+    # note: writes invalidate whole namespace
+    _request(resource, method='PUT', index=2)
+    resp = _request(resource, index=1)
+    assert json.loads(_get_body(resp))['content']['retrieved'] == 4
+
+
+def test_resource_response_cache_invalidated_during_handling(cache):
+    class RacingResource(CachedResource):
+        def retrieve(self, params, meta, **kwargs):
+            # note: simulates write request that completes while this
+            #       request is still being handled
+            self.response_cache.invalidate(self.cache_namespace)
+            return super().retrieve(params, meta, **kwargs)
+
+    resource = RacingResource(cache)
+    _request(resource, index=1)
+    _request(resource, index=1)
+    assert resource.retrieved == 2
+
+
+class UserCachedResource(
+    mixins.RetrieveMixin, BaseResource, with_context=True
+):
+    def __init__(self, cache):
+        self.response_cache = cache
+        self.retrieved = 0
+
+    def retrieve(self, params, meta, context, **kwargs):
+        self.retrieved += 1
+        return {'user': context.get('user')}
+
+
+def _user_request(resource, user):
+    req = Request(create_environ())
+    if user is not None:
+        req.context['user'] = user
+    resp = Response()
+    resource.on_get(req, resp)
+    return json.loads(_get_body(resp))['content']['user']
+
+
+def test_resource_response_cache_varies_by_user(cache):
+    resource = UserCachedResource(cache)
+
+    assert _user_request(resource, {'id': 'alice'}) == {'id': 'alice'}
+    assert _user_request(resource, {'id': 'bob'}) == {'id': 'bob'}
+    assert _user_request(resource, None) is None
+    assert resource.retrieved == 3
+
+    assert _user_request(resource, {'id': 'alice'}) == {'id': 'alice'}
+    assert _user_request(resource, {'id': 'bob'}) == {'id': 'bob'}
+    assert _user_request(resource, None) is None
+    assert resource.retrieved == 3
+
+    # note: vary key can be customized with hook
+    resource.get_cache_vary_key = (
+        lambda params, context, **kwargs: 'everyone'
+    )
+    assert _user_request(resource, {'id': 'alice'}) == {'id': 'alice'}
+    assert _user_request(resource, {'id': 'bob'}) == {'id': 'alice'}
+    assert resource.retrieved == 4
+
+
+class UserPaginatedResource(PaginatedListAPI, with_context=True):
+    serializer = ItemSerializer()
+    total_count = 'exact'
+    total_count_ttl = 60
+
+    def __init__(self):
+        self.storage = {'alice': [{'id': 1}, {'id': 2}], 'bob': [{'id': 3}]}
+        self.counted = 0
+
+    def list(self, params, meta, context, **kwargs):
+        return self.storage[context['user']['id']][:params['page_size']]
+
+    def count(self, params, context, **kwargs):
+        self.counted += 1
+        return len(self.storage[context['user']['id']])
+
+
+def test_paginated_total_count_cache_varies_by_user():
+    resource = UserPaginatedResource()
+
+    for user, total in [('alice', 2), ('bob', 1)] * 2:
+        req = Request(create_environ(query_string='page_size=1'))
+        req.context['user'] = {'id': user}
+        resp = Response()
+        resource.on_get(req, resp)
+        assert json.loads(_get_body(resp))['meta']['total'] == total
+
+    assert resource.counted == 2
+
+
+def test_resource_response_cache_unreliable_vary_key(cache):
+    class User:
+        pass
+
+    class AnyUserCachedResource(UserCachedResource):
+        def retrieve(self, params, meta, context, **kwargs):
+            self.retrieved += 1
+            return {'user': None}
+
+    resource = AnyUserCachedResource(cache)
+
+    # note: objects with default repr() can't be safely used in cache keys
+    #       so responses are not cached at all
+    _user_request(resource, User())
+    _user_request(resource, User())
+    assert resource.retrieved == 2
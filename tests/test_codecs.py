@@ -0,0 +1,277 @@
+from io import BytesIO
+import json
+
+import pytest
+
+from falcon import Request, Response, HTTPUnsupportedMediaType
+from falcon.testing import create_environ
+
+from graceful import codecs
+from graceful.resources.base import BaseResource, _get_body
+
+
+CODECS = [codecs.JSONCodec()]
+
+try:
+    CODECS.append(codecs.OrjsonCodec())
+except ImportError:  # pragma: nocover
+    pass
+
+
+class UpperCodec(codecs.BaseCodec):
+    """Dummy codec for testing codec configuration."""
+
+    media_type = 'text/upper'
+
+    def dumps(self, obj, indent=None):
+        return json.dumps(obj).upper()
+
+    def loads(self, data):
+        return json.loads(data.lower())
+
+
+def _text(encoded):
+    return encoded.decode() if isinstance(encoded, bytes) else encoded
+
+
+def test_base_codec_not_implemented():
+    with pytest.raises(NotImplementedError):
+        codecs.BaseCodec().dumps({})
+
+    with pytest.raises(NotImplementedError):
+        codecs.BaseCodec().loads('{}')
+
+
+@pytest.mark.parametrize('codec', CODECS)
+def test_codec_roundtrip(codec):
+    obj = {'foo': 'bar', 'baz': [1, 2.5, None, True], 'zażółć': 'gęślą'}
+
+    assert codec.loads(codec.dumps(obj)) == obj
+    assert codec.loads(_text(codec.dumps(obj))) == obj
+    assert codec.loads(_text(codec.dumps(obj)).encode('utf-8')) == obj
+
+
+@pytest.mark.parametrize('codec', CODECS)
+@pytest.mark.parametrize('indent', [None, 2, 4])
+def test_codec_indent(codec, indent):
+    obj = {'foo': {'bar': 'baz'}}
+    encoded = _text(codec.dumps(obj, indent=indent))
+
+    assert json.loads(encoded) == obj
+
+    if indent:
+        assert '\n' + ' ' * indent + '"foo"' in encoded
+    else:
+        assert '\n' not in encoded
+
+
+@pytest.mark.parametrize('codec', CODECS)
+def test_codec_compatible_with_json(codec):
+    # note: non-string keys and big integers are supported by stdlib json
+    obj = {1: 'one', 'big': 2 ** 70}
+
+    assert json.loads(_text(codec.dumps(obj))) == json.loads(json.dumps(obj))
+
+
+@pytest.mark.parametrize('codec', CODECS)
+def test_codec_non_finite_floats(codec):
+    obj = codec.loads('[NaN, Infinity, -Infinity]')
+
+    assert obj[0] != obj[0]
+    assert obj[1:] == [float('inf'), float('-inf')]
+
+
+@pytest.mark.parametrize('codec', CODECS)
+def test_codec_invalid_document(codec):
+    with pytest.raises(ValueError):
+        codec.loads(b'{not a json')
+
+
+@pytest.mark.parametrize('codec', CODECS)
+@pytest.mark.parametrize('chunk_size', [1, 3, 1024])
+def test_codec_iterloads(codec, chunk_size):
+    obj = [1, 12345, 3.5e10, 'zażółć', ']', {'foo': [1, {'bar': None}]}, []]
+
+    for indent in (None, 2):
+        stream = BytesIO(json.dumps(obj, indent=indent).encode('utf-8'))
+        assert list(codec.iterloads(stream, chunk_size)) == obj
+
+    assert list(codec.iterloads(BytesIO(b' [ ] '), chunk_size)) == []
+
+
+@pytest.mark.parametrize('codec', CODECS)
+@pytest.mark.parametrize('document', [
+    b'', b'{}', b'[1 2]', b'[1,', b'[1,]', b'[1] x', b'[{not a json}]'
+])
+def test_codec_iterloads_invalid_document(codec, document):
+    with pytest.raises(ValueError):
+        list(codec.iterloads(BytesIO(document), 2))
+
+
+def test_default_codec():
+    default = codecs.get_default_codec()
+
+    # note: orjson is never used implicitly even if it is importable
+    assert type(default) is codecs.JSONCodec
+
+    try:
+        custom = UpperCodec()
+        codecs.set_default_codec(custom)
+        assert codecs.get_default_codec() is custom
+        assert BaseResource().get_codec() is custom
+    finally:
+        codecs.set_default_codec(default)
+
+
+def test_resource_codec(req, resp):
+    class UpperResource(BaseResource):
+        codec = UpperCodec()
+
+        def on_get(self, req, resp, **kwargs):
+            self.make_body(resp, {}, {}, {'foo': 'bar'})
+
+    resource = UpperResource()
+
+    resource.on_get(req, resp)
+    assert resp.content_type == 'text/upper'
+    assert _get_body(resp) == '{"META": {}, "CONTENT": {"FOO": "BAR"}}'
+
+    resource.on_options(req, resp)
+    assert resp.content_type == 'text/upper'
+    assert json.loads(_get_body(resp).lower())['name'] == 'upperresource'
+
+
+class CountingStream(BytesIO):
+    def __init__(self, data):
+        super().__init__(data)
+        self.reads = 0
+
+    def read(self, size=-1):
+        self.reads += 1
+        return super().read(size)
+
+
+@pytest.mark.parametrize('codec', CODECS)
+@pytest.mark.parametrize('document', [
+    b'[{not a json}, ', b'[1, 2 3, ', b'[{"foo": [1, 2}, ',
+])
+def test_codec_iterloads_fails_fast(codec, document):
+    # note: syntax errors are reported without reading the rest of document
+    stream = CountingStream(document + b', '.join([b'{"foo": 1}'] * 10000))
+
+    with pytest.raises(ValueError):
+        list(codec.iterloads(stream, 1024))
+
+    assert stream.reads == 1
+
+
+@pytest.mark.parametrize('codec', CODECS)
+def test_codec_iterloads_max_element_size(codec):
+    codec = type(codec)()
+    codec.max_element_size = 1000
+    document = json.dumps(['x' * 900, {'foo': 'x' * 900}]).encode()
+
+    assert len(list(codec.iterloads(BytesIO(document), 64))) == 2
+
+    for document in (
+        b'["' + b'x' * 5000 + b'"]', b'[' + b'[' * 500, b'[' + b'[' * 10 ** 5,
+    ):
+        with pytest.raises(ValueError):
+            list(codec.iterloads(BytesIO(document), 64))
+
+
+def test_msgpack_codec():
+    pytest.importorskip('msgpack')
+    codec = codecs.MessagePackCodec()
+    obj = {'foo': 'bar', 'baz': [1, 2.5, None, True], 'bin': b'\x00'}
+
+    encoded = codec.dumps(obj, indent=4)
+    assert isinstance(encoded, bytes)
+    assert codec.loads(encoded) == obj
+
+    with pytest.raises(ValueError):
+        codec.loads(b'\xc1')
+
+    document = codec.dumps([obj, 1, 'foo'])
+    assert list(codec.iterloads(BytesIO(document), 1)) == [obj, 1, 'foo']
+
+    for document in (codec.dumps(obj), codec.dumps([1, 2])[:-1]):
+        with pytest.raises(ValueError):
+            list(codec.iterloads(BytesIO(document), 1))
+
+
+def test_base_codec_iterloads():
+    codec = UpperCodec()
+
+    assert list(codec.iterloads(BytesIO(b'[1, 2]'))) == [1, 2]
+
+    with pytest.raises(ValueError):
+        list(codec.iterloads(BytesIO(b'{}')))
+
+
+class NegotiatedResource(BaseResource):
+    media_handlers = [UpperCodec()]
+
+    def on_get(self, req, resp, **kwargs):
+        self.negotiate_content_type(req, resp)
+        self.make_body(resp, {}, {}, self.require_representation(req))
+
+
+@pytest.mark.parametrize('accept, expected', [
+    (None, 'application/json'),
+    ('*/*', 'application/json'),
+    ('application/json', 'application/json'),
+    ('text/upper', 'text/upper'),
+    ('text/upper;q=0.5, application/json', 'application/json'),
+    ('application/json;q=0.5, text/upper', 'text/upper'),
+    ('text/*', 'text/upper'),
+    ('image/png', 'application/json'),
+    ('definitely/not/valid;;;', 'application/json'),
+])
+def test_resource_content_negotiation(accept, expected):
+    headers = {'Content-Type': 'application/json'}
+    if accept:
+        headers['Accept'] = accept
+
+    req = Request(create_environ(headers=headers, body='{"foo": "bar"}'))
+    resp = Response()
+    resource = NegotiatedResource()
+
+    resource.on_get(req, resp)
+
+    assert resp.content_type == expected
+    assert resp.get_header('Vary') == 'Accept'
+    assert resource.describe(req, resp)['media_type'] == expected
+    assert resource.describe()['media_types'] == [
+        'application/json', 'text/upper'
+    ]
+
+    body = _text(_get_body(resp))
+    assert json.loads(body.lower())['content'] == {'foo': 'bar'}
+
+
+def test_resource_content_type_decoding():
+    req = Request(create_environ(
+        headers={'Content-Type': 'text/upper; charset=utf-8'},
+        body='{"FOO": "BAR"}'
+    ))
+    assert NegotiatedResource().require_representation(req) == {'foo': 'bar'}
+
+    req = Request(create_environ(
+        headers={'Content-Type': 'image/png'},
+        body='{"FOO": "BAR"}'
+    ))
+    with pytest.raises(HTTPUnsupportedMediaType):
+        NegotiatedResource().require_representation(req)
+
+
+def test_resource_options_negotiation():
+    req = Request(create_environ(
+        method='OPTIONS', headers={'Accept': 'text/upper'}
+    ))
+    resp = Response()
+
+    NegotiatedResource().on_options(req, resp)
+
+    assert resp.content_type == 'text/upper'
+    assert json.loads(_get_body(resp).lower())['media_type'] == 'text/upper'
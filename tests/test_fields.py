@@ -8,7 +8,9 @@ from graceful.fields import (
     IntField,
     FloatField,
     BoolField,
+    SerializerField,
 )
+from graceful.serializers import BaseSerializer
 
 
 def test_base_field_implementation_hooks():
@@ -195,3 +197,33 @@ def test_float_field():
         field.validate(-10)
     with pytest.raises(ValidationError):
         field.validate(123)
+
+
+def test_serializer_field():
+    class NestedSerializer(BaseSerializer):
+        name = StringField("name")
+        age = IntField("age", min_value=0)
+
+    field = SerializerField("nested", serializer=NestedSerializer())
+
+    assert field.to_representation({'name': 'foo', 'age': 1}) == {
+        'name': 'foo', 'age': 1
+    }
+    assert field.from_representation({'name': 'foo', 'age': '1'}) == {
+        'name': 'foo', 'age': 1
+    }
+    assert field.describe()['type'] == 'object'
+    assert list(field.describe()['fields']) == ['name', 'age']
+
+    # accept only objects
+    with pytest.raises(ValueError):
+        field.from_representation('foo')
+    with pytest.raises(ValueError):
+        field.from_representation({'name': 'foo', 'age': 'foo'})
+
+    # check nested validation
+    field.validate({'name': 'foo', 'age': 1})
+    with pytest.raises(ValidationError):
+        field.validate({'name': 'foo', 'age': -1})
+    with pytest.raises(ValidationError):
+        field.validate({'name': 'foo'})
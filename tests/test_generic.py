@@ -1,3 +1,4 @@
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from functools import wraps
 import json
 
@@ -7,6 +8,7 @@ from falcon.errors import HTTPNotFound
 import falcon
 from falcon.testing import TestBase
 
+from graceful.codecs import MessagePackCodec
 from graceful.serializers import BaseSerializer
 from graceful.fields import RawField, IntField
 from graceful.validators import min_validator
@@ -18,6 +20,7 @@ from graceful.resources.generic import (
     ListCreateAPI,
     PaginatedListAPI,
     PaginatedListCreateAPI,
+    CursorPaginatedListAPI,
 )
 
 
@@ -117,6 +120,29 @@ class ExampleListCreateAPI(ListCreateAPI, StoredResource):
         return validated
 
 
+class ExampleStreamingBulkCreateAPI(ExampleListCreateAPI):
+    bulk_streaming = True
+    bulk_batch_size = 2
+
+    def create_bulk(self, params, meta, validated, **kwargs):
+        batches = [list(batch) for batch in validated]
+        meta['batches'] = [len(batch) for batch in batches]
+        return [item for batch in batches for item in batch]
+
+
+class ExampleConcurrentBulkCreateAPI(ExampleListCreateAPI):
+    create_bulk_executor = ThreadPoolExecutor(4)
+
+    def create(self, params, meta, validated, **kwargs):
+        if validated['writable'] == 'conflict':
+            raise falcon.HTTPConflict(description='already exists')
+        if validated['writable'] == 'broken':
+            raise RuntimeError('secret details')
+
+        meta['last'] = validated['writable']
+        return super().create(params, meta, validated, **kwargs)
+
+
 class ExamplePaginatedListAPI(PaginatedListAPI, StoredResource):
     serializer = ExampleSerializer()
 
@@ -126,6 +152,45 @@ class ExamplePaginatedListAPI(PaginatedListAPI, StoredResource):
         return self.storage[start:end]
 
 
+class ExampleStreamingListAPI(ListAPI, StoredResource):
+    serializer = ExampleSerializer()
+    streaming = True
+    stream_chunk_size = 10
+
+    def list(self, params, meta, **kwargs):
+        yield from self.storage
+        meta['total'] = len(self.storage)
+
+
+class ExampleStreamingPaginatedListAPI(PaginatedListAPI, StoredResource):
+    serializer = ExampleSerializer()
+    streaming = True
+
+    def list(self, params, meta, **kwargs):
+        start = params['page_size'] * (params['page'])
+        end = params['page_size'] * (params['page'] + 1)
+        yield from self.storage[start:end]
+        meta['has_more'] = end < len(self.storage)
+        meta['total'] = len(self.storage)
+
+
+class ExampleExtraItemPaginatedListAPI(PaginatedListAPI, StoredResource):
+    serializer = ExampleSerializer()
+    fetch_extra_item = True
+    total_count = 'exact'
+    total_count_ttl = 60
+
+    def list(self, params, meta, **kwargs):
+        start = params['page_size'] * (params['page'])
+        end = params['page_size'] * (params['page'] + 1) + 1
+        # note: generator makes sure overflow item is trimmed in both modes
+        yield from self.storage[start:end]
+
+    def count(self, params, **kwargs):
+        self.counted = getattr(self, 'counted', 0) + 1
+        return len(self.storage)
+
+
 class ExamplePaginatedListCreateAPI(PaginatedListCreateAPI, StoredResource):
     serializer = ExampleSerializer()
 
@@ -139,6 +204,28 @@ class ExamplePaginatedListCreateAPI(PaginatedListCreateAPI, StoredResource):
         return validated
 
 
+class ExampleCursorPaginatedListAPI(CursorPaginatedListAPI, StoredResource):
+    serializer = ExampleSerializer()
+    cursor_secret = b'secret'
+    cursor_fields = ('readonly',)
+
+    def list(self, params, meta, **kwargs):
+        # note: storage is sorted by the 'readonly' key
+        key = params.get('cursor', [None])[0]
+        size = params['page_size']
+
+        if params.get('cursor_direction') == 'prev':
+            before = [obj for obj in self.storage if obj['readonly'] < key]
+            meta['has_more'] = len(before) > size
+            return before[-size:]
+
+        after = [
+            obj for obj in self.storage if key is None or obj['readonly'] > key
+        ]
+        meta['has_more'] = len(after) > size
+        return after[:size]
+
+
 def test_implementation_hook_update():
     with pytest.raises(NotImplementedError):
         RetrieveUpdateDeleteAPI().update(None, None)
@@ -159,6 +246,14 @@ def test_implementation_hook_list():
         PaginatedListCreateAPI().list(None, None)
 
 
+def test_implementation_hook_count():
+    with pytest.raises(NotImplementedError):
+        PaginatedListAPI().count({})
+
+    with pytest.raises(NotImplementedError):
+        PaginatedListAPI().estimate_count({})
+
+
 def test_implementation_hook_create():
     with pytest.raises(NotImplementedError):
         PaginatedListCreateAPI().create(None, None)
@@ -208,6 +303,23 @@ class RetrieveTestsMixin:
         )
         assert self.srmock.status == falcon.HTTP_NOT_FOUND
 
+    def test_retrieve_sparse_fieldset(self):
+        result = self.simulate_request(
+            self.uri_template.format(index=0), decode='utf-8',
+            query_string="fields=readonly,writable,readonly"
+        )
+        body = json.loads(result)
+
+        assert body['content'] == {'writable': None, 'readonly': 'bar'}
+        assert body['meta']['params']['fields'] == ['writable', 'readonly']
+
+    def test_retrieve_sparse_fieldset_unknown_field(self):
+        self.simulate_request(
+            self.uri_template.format(index=0), decode='utf-8',
+            query_string="fields=readonly,nonexistent"
+        )
+        assert self.srmock.status == falcon.HTTP_BAD_REQUEST
+
     def test_options(self):
         result = self.simulate_request(
             self.uri_template.format(index=1), decode='utf-8', method='OPTIONS'
@@ -314,6 +426,19 @@ class ListTestsMixin:
 
         assert self.srmock.status == falcon.HTTP_OK
 
+    def test_list_sparse_fieldset(self):
+        result = self.simulate_request(
+            self.uri_template, decode='utf-8', query_string="fields=readonly"
+        )
+        body = json.loads(result)
+
+        assert body['content'] == [{'readonly': 'bar'}]
+
+        self.simulate_request(
+            self.uri_template, decode='utf-8', query_string="fields=foo"
+        )
+        assert self.srmock.status == falcon.HTTP_BAD_REQUEST
+
     def test_options(self):
         result = self.simulate_request(
             self.uri_template, decode='utf-8', method='OPTIONS'
@@ -345,6 +470,36 @@ class PaginationTestsMixin:
         assert len(body['content']) == 0
 
 
+class StreamingTestsMixin:
+    uri_template = '/items/'
+
+    def simulate_request(self, *args, decode=None, **kwargs):
+        result = super().simulate_request(*args, **kwargs)
+        # note: falcon's TestBase is able to decode only non-streamed bodies
+        return b''.join(result).decode(decode) if decode else result
+
+    def test_list_streaming(self):
+        for _ in range(20):
+            self.storage.append({"writeble": "foo", "readonly": "bar"})
+
+        result = self.simulate_request(
+            self.uri_template, decode='utf-8', query_string="indent=2"
+        )
+        body = json.loads(result)
+
+        assert body['content']
+        assert all(
+            item == {
+                'writable': None, 'readonly': 'bar',
+                'nullable': None, 'unsigned': None
+            }
+            for item in body['content']
+        )
+        # note: meta is populated by handler after all items were listed
+        assert body['meta']['total'] == len(self.storage)
+        assert body['meta']['params']['indent'] == 2
+
+
 class CreateTestsMixin:
     """
     Contains all tests that should be performed on resource that suports create
@@ -502,6 +657,196 @@ class ListCreateTestCase(
         )
 
 
+class StreamingBulkCreateTestCase(
+    ListTestsMixin,
+    CreateTestsMixin,
+    GenericsTestBase,
+):
+    def setUp(self):
+        super(StreamingBulkCreateTestCase, self).setUp()
+        self.api.add_route(
+            self.uri_template,
+            ExampleStreamingBulkCreateAPI(self.storage)
+        )
+
+    def test_create_bulk_in_batches(self):
+        items = [
+            {'writable': str(index), 'unsigned': index, 'nullable': None}
+            for index in range(5)
+        ]
+        result = self.do_create_bulk(items)
+        body = json.loads(result)
+
+        assert self.srmock.status == falcon.HTTP_CREATED
+        assert body['meta']['batches'] == [2, 2, 1]
+        assert [item['writable'] for item in body['content']] == [
+            '0', '1', '2', '3', '4'
+        ]
+
+    def test_create_bulk_reports_failed_items(self):
+        items = [
+            {'writable': 'valid', 'unsigned': 1, 'nullable': None},
+            {'writable': 'invalid', 'unsigned': -1, 'nullable': None},
+            {'writable': 'missing'},
+            'not an object',
+        ]
+        result = self.do_create_bulk(items)
+        body = json.loads(result)
+
+        assert self.srmock.status == falcon.HTTP_BAD_REQUEST
+        assert body['description'] == "Invalid items at indices: 1, 2, 3"
+        assert [error['index'] for error in body['errors']] == [1, 2, 3]
+        assert [error['title'] for error in body['errors']] == [
+            "Representation deserialization failed",
+            "Representation deserialization failed",
+            "Validation failed",
+        ]
+        assert all(
+            error['status'] == falcon.HTTP_BAD_REQUEST
+            for error in body['errors']
+        )
+        assert body['errors'][2]['description'] == "item should be object"
+
+    def test_create_bulk_malformed_payload(self):
+        self.simulate_request(
+            self.uri_template,
+            decode='utf-8',
+            method='PATCH',
+            headers={'Content-Type': 'application/json'},
+            body='[{"writable": "foo", "unsigned": 1, "nullable": null}',
+        )
+        assert self.srmock.status == falcon.HTTP_BAD_REQUEST
+
+
+class DefaultStreamingBulkCreateTestCase(CreateTestsMixin, GenericsTestBase):
+    class resource_class(ExampleListCreateAPI):
+        bulk_streaming = True
+        bulk_batch_size = 2
+
+    def setUp(self):
+        super(DefaultStreamingBulkCreateTestCase, self).setUp()
+        self.api.add_route(
+            self.uri_template, self.resource_class(self.storage)
+        )
+
+    def test_create_bulk_validates_whole_stream_first(self):
+        items = [
+            {'writable': str(index), 'unsigned': index, 'nullable': None}
+            for index in range(4)
+        ] + [{'writable': 'invalid', 'unsigned': -1, 'nullable': None}]
+        result = self.do_create_bulk(items)
+        body = json.loads(result)
+
+        assert self.srmock.status == falcon.HTTP_BAD_REQUEST
+        assert [error['index'] for error in body['errors']] == [4]
+        # note: batches of valid items preceding the invalid one are
+        #       never passed to .create()
+        assert self.storage == [{"writeble": "foo", "readonly": "bar"}]
+
+
+class ConcurrentStreamingBulkCreateFailureTestCase(
+    DefaultStreamingBulkCreateTestCase
+):
+    class resource_class(ExampleConcurrentBulkCreateAPI):
+        bulk_streaming = True
+        bulk_batch_size = 2
+
+
+class ConcurrentBulkCreateTestCase(CreateTestsMixin, GenericsTestBase):
+    resource_class = ExampleConcurrentBulkCreateAPI
+
+    def setUp(self):
+        super(ConcurrentBulkCreateTestCase, self).setUp()
+        self.api.add_route(
+            self.uri_template, self.resource_class(self.storage)
+        )
+
+    def test_create_bulk_multi_status(self):
+        items = [
+            {'writable': name, 'unsigned': 1, 'nullable': None}
+            for name in ('0', 'conflict', '2', 'broken', '4')
+        ]
+
+        with self.assertLogs('graceful.resources.generic', 'ERROR') as logs:
+            body = json.loads(self.do_create_bulk(items))
+
+        # note: only unexpected errors are logged (with their tracebacks)
+        assert len(logs.records) == 1
+        assert logs.records[0].exc_info[0] is RuntimeError
+
+        assert self.srmock.status == falcon.HTTP_MULTI_STATUS
+        assert [
+            item and item['writable'] for item in body['content']
+        ] == ['0', None, '2', None, '4']
+        assert body['meta']['errors'] == [
+            {
+                'index': 1, 'status': falcon.HTTP_CONFLICT,
+                'title': falcon.HTTP_CONFLICT, 'description': 'already exists',
+            },
+            {
+                'index': 3, 'status': falcon.HTTP_500,
+                'title': falcon.HTTP_500, 'description': None,
+            },
+        ]
+        # note: metas of items are merged in payload order
+        assert body['meta']['last'] == '4'
+        assert len(self.storage) == 4
+
+
+class ConcurrentStreamingBulkCreateTestCase(ConcurrentBulkCreateTestCase):
+    class resource_class(ExampleConcurrentBulkCreateAPI):
+        bulk_streaming = True
+        bulk_batch_size = 2
+
+
+class ParallelValidationTestCase(
+    CreateTestsMixin,
+    GenericsTestBase,
+):
+    def setUp(self):
+        super(ParallelValidationTestCase, self).setUp()
+        self.executor = ProcessPoolExecutor(max_workers=2)
+
+        resource = ExampleListCreateAPI(self.storage)
+        resource.validation_executor = self.executor
+        resource.validation_executor_threshold = 3
+        resource.validation_chunk_size = 2
+
+        self.api.add_route(self.uri_template, resource)
+
+    def tearDown(self):
+        self.executor.shutdown()
+        super(ParallelValidationTestCase, self).tearDown()
+
+    def test_create_bulk_in_parallel(self):
+        items = [
+            {'writable': str(index), 'unsigned': index, 'nullable': None}
+            for index in range(7)
+        ]
+        result = self.do_create_bulk(items)
+        body = json.loads(result)
+
+        assert self.srmock.status == falcon.HTTP_CREATED
+        assert [item['writable'] for item in body['content']] == [
+            str(index) for index in range(7)
+        ]
+
+    def test_create_bulk_in_parallel_reports_first_error(self):
+        items = [
+            {'writable': str(index), 'unsigned': index, 'nullable': None}
+            for index in range(7)
+        ]
+        items[5]['unsigned'] = 'foo'
+        items[3]['unsigned'] = -1
+
+        result = self.do_create_bulk(items)
+        body = json.loads(result)
+
+        assert self.srmock.status == falcon.HTTP_BAD_REQUEST
+        # note: error of the first invalid item (in payload order)
+        assert body['description'].startswith('invalid')
+
+
 class PaginatedListTestCase(
     ListTestsMixin,
     PaginationTestsMixin,
@@ -527,3 +872,235 @@ class PaginatedListCreateTestCase(
             self.uri_template,
             ExamplePaginatedListCreateAPI(self.storage)
         )
+
+
+class ExtraItemPaginatedListTestCase(
+    ListTestsMixin,
+    PaginationTestsMixin,
+    GenericsTestBase,
+):
+    resource_class = ExampleExtraItemPaginatedListAPI
+
+    def setUp(self):
+        super(ExtraItemPaginatedListTestCase, self).setUp()
+        self.resource = self.resource_class(self.storage)
+        self.api.add_route(self.uri_template, self.resource)
+
+    def test_list_extra_item_pagination_meta(self):
+        for _ in range(5):
+            self.storage.append({"writeble": "foo", "readonly": "bar"})
+
+        body = json.loads(self.simulate_request(
+            self.uri_template, decode='utf-8', query_string="page_size=3"
+        ))
+        assert len(body['content']) == 3
+        assert body['meta']['has_more'] is True
+        assert body['meta']['next'] == "page=1&page_size=3"
+        assert body['meta']['total'] == 6
+
+        body = json.loads(self.simulate_request(
+            self.uri_template, decode='utf-8',
+            query_string="page=1&page_size=3"
+        ))
+        assert len(body['content']) == 3
+        assert body['meta']['has_more'] is False
+        assert body['meta']['next'] is None
+        assert body['meta']['total'] == 6
+
+        # note: total of the last page is known without counting and
+        #       other totals are cached regardless of page and page_size
+        self.simulate_request(
+            self.uri_template, decode='utf-8', query_string="page_size=2"
+        )
+        assert self.resource.counted == 1
+
+    def test_list_approximate_total(self):
+        self.resource.total_count = 'approximate'
+        self.resource.total_count_ttl = None
+        self.resource.estimate_count = lambda params, **kwargs: 100
+
+        for _ in range(20):
+            self.storage.append({"writeble": "foo", "readonly": "bar"})
+
+        body = json.loads(
+            self.simulate_request(self.uri_template, decode='utf-8')
+        )
+        assert body['meta']['total'] == 100
+        assert body['meta']['total_approximate'] is True
+        assert not hasattr(self.resource, 'counted')
+
+
+class StreamingExtraItemPaginatedListTestCase(
+    StreamingTestsMixin,
+    ExtraItemPaginatedListTestCase,
+):
+    class resource_class(ExampleExtraItemPaginatedListAPI):
+        streaming = True
+
+
+class StreamingListTestCase(
+    StreamingTestsMixin,
+    ListTestsMixin,
+    GenericsTestBase,
+):
+    def setUp(self):
+        super(StreamingListTestCase, self).setUp()
+        self.api.add_route(
+            self.uri_template,
+            ExampleStreamingListAPI(self.storage)
+        )
+
+
+class StreamingPaginatedListTestCase(
+    StreamingTestsMixin,
+    ListTestsMixin,
+    PaginationTestsMixin,
+    GenericsTestBase,
+):
+    def setUp(self):
+        super(StreamingPaginatedListTestCase, self).setUp()
+        self.api.add_route(
+            self.uri_template,
+            ExampleStreamingPaginatedListAPI(self.storage)
+        )
+
+    def test_list_streaming_pagination_meta(self):
+        for _ in range(5):
+            self.storage.append({"writeble": "foo", "readonly": "bar"})
+
+        body = json.loads(self.simulate_request(
+            self.uri_template, decode='utf-8', query_string="page_size=3"
+        ))
+        assert len(body['content']) == 3
+        assert body['meta']['next'] == "page=1&page_size=3"
+
+        body = json.loads(self.simulate_request(
+            self.uri_template, decode='utf-8',
+            query_string="page=1&page_size=3"
+        ))
+        assert len(body['content']) == 3
+        assert body['meta']['next'] is None
+        assert body['meta']['prev'] == "page=0&page_size=3"
+
+
+class CursorPaginatedListTestCase(ListTestsMixin, GenericsTestBase):
+    def setUp(self):
+        super(CursorPaginatedListTestCase, self).setUp()
+        self.storage[:] = [
+            {"writable": "foo", "readonly": "{:03}".format(i)}
+            for i in range(7)
+        ]
+        self.api.add_route(
+            self.uri_template,
+            ExampleCursorPaginatedListAPI(self.storage)
+        )
+
+    def _get_page(self, query_string):
+        body = json.loads(self.simulate_request(
+            self.uri_template, decode='utf-8', query_string=query_string
+        ))
+        return [item.get('readonly') for item in body['content']], body['meta']
+
+    def test_list_sparse_fieldset(self):
+        # note: cursors are made of objects, not of their representations
+        page, meta = self._get_page("page_size=3&fields=writable")
+        assert page == [None] * 3
+
+        page, meta = self._get_page(meta['next'])
+        assert page == ['003', '004', '005']
+
+    def test_list_cursor_pagination(self):
+        page, meta = self._get_page("page_size=3")
+        assert page == ['000', '001', '002']
+        assert meta['prev'] is None
+
+        page, meta = self._get_page(meta['next'])
+        assert page == ['003', '004', '005']
+
+        page, meta = self._get_page(meta['next'])
+        assert page == ['006']
+        assert meta['next'] is None
+
+        page, meta = self._get_page(meta['prev'])
+        assert page == ['003', '004', '005']
+
+        page, meta = self._get_page(meta['prev'])
+        assert page == ['000', '001', '002']
+        assert meta['prev'] is None
+        assert meta['next']
+
+    def test_list_cursor_invalid(self):
+        resource = ExampleCursorPaginatedListAPI()
+        cursor = resource.encode_cursor(['002'])
+
+        forged = resource.encode_cursor(['002'], 'prev').split('.')[0]
+        forged += '.' + cursor.split('.')[1]
+
+        for invalid in ('foo', 'foo.bar.baz', cursor[:-2], forged):
+            self.simulate_request(
+                self.uri_template, query_string="cursor=" + invalid
+            )
+            assert self.srmock.status == falcon.HTTP_BAD_REQUEST
+
+    def test_cursor_secret_required(self):
+        with pytest.raises(RuntimeError):
+            CursorPaginatedListAPI().encode_cursor([1])
+
+
+class MessagePackTestCase(GenericsTestBase):
+    uri_template = '/items/'
+
+    def setUp(self):
+        super(MessagePackTestCase, self).setUp()
+        self.msgpack = pytest.importorskip('msgpack')
+
+        class NegotiatedListCreateAPI(ExampleListCreateAPI):
+            media_handlers = [MessagePackCodec()]
+
+        class NegotiatedStreamingListAPI(ExampleStreamingListAPI):
+            media_handlers = [MessagePackCodec()]
+
+        self.api.add_route(
+            self.uri_template, NegotiatedListCreateAPI(self.storage)
+        )
+        self.api.add_route(
+            '/streamed/', NegotiatedStreamingListAPI(self.storage)
+        )
+
+    def test_list_msgpack(self):
+        for uri in (self.uri_template, '/streamed/'):
+            result = self.simulate_request(
+                uri, headers={'Accept': 'application/msgpack'}
+            )
+            body = self.msgpack.unpackb(b''.join(result), raw=False)
+
+            assert self.srmock.status == falcon.HTTP_OK
+            assert (
+                self.srmock.headers_dict['Content-Type'] ==
+                'application/msgpack'
+            )
+            assert len(body['content']) == len(self.storage)
+
+    def test_create_msgpack(self):
+        self.simulate_request(
+            self.uri_template,
+            method='POST',
+            headers={'Content-Type': 'application/msgpack'},
+            body=self.msgpack.packb(
+                {'writable': 'changed', 'unsigned': 12, 'nullable': None}
+            ),
+        )
+        assert self.srmock.status == falcon.HTTP_CREATED
+        assert self.storage[-1]['unsigned'] == 12
+
+    def test_options_msgpack(self):
+        result = self.simulate_request(
+            self.uri_template, method='OPTIONS',
+            headers={'Accept': 'application/msgpack'}
+        )
+        description = self.msgpack.unpackb(b''.join(result), raw=False)
+
+        assert description['media_type'] == 'application/msgpack'
+        assert description['media_types'] == [
+            'application/json', 'application/msgpack'
+        ]
@@ -1,16 +1,18 @@
 import copy
+from datetime import datetime
 import json
 from collections.abc import Iterable
 
 from falcon.testing import create_environ
-from falcon import Request
+from falcon import Request, Response
 from falcon import errors
 import falcon
 import pytest
 from unittest.mock import Mock
 
+from graceful.codecs import JSONCodec
 from graceful.errors import ValidationError
-from graceful.resources.base import BaseResource
+from graceful.resources.base import BaseResource, _etag_matches, _get_body
 from graceful.resources.generic import Resource
 from graceful.resources import mixins
 from graceful.parameters import StringParam, BaseParam, IntParam
@@ -63,7 +65,7 @@ def test_base_resource_get(req, resp):
     resource.on_get(req, resp)
 
     assert resp.content_type == "application/json"
-    assert resp.body
+    assert _get_body(resp)
     assert resp.status == falcon.HTTP_200
 
 
@@ -72,13 +74,13 @@ def test_resource_indent(req, resp):
 
     # default: without indent
     resource.on_get(req, resp)
-    assert "    " not in resp.body
-    assert "\n" not in resp.body
+    assert "    " not in _get_body(resp)
+    assert "\n" not in _get_body(resp)
 
     # with explicit indent
     req.params['indent'] = '4'
     resource.on_get(req, resp)
-    assert "    " in resp.body
+    assert "    " in _get_body(resp)
 
 
 def test_resource_meta(req, resp):
@@ -94,7 +96,7 @@ def test_resource_meta(req, resp):
     resource = TestResource()
     resource.on_get(req, resp)
 
-    body = json.loads(resp.body)
+    body = json.loads(_get_body(resp))
 
     assert 'meta' in body
     assert 'params' in body['meta']
@@ -189,9 +191,86 @@ def test_options(resp):
         'GET' in _retrieve_header(resp, 'allow'),
     ])
     assert resp.status == falcon.HTTP_200
-    assert json.loads(resp.body)
+    assert json.loads(_get_body(resp))
     # assert this is obviously the same
-    assert resource.describe(req, resp) == json.loads(resp.body)
+    assert resource.describe(req, resp) == json.loads(_get_body(resp))
+
+
+@pytest.mark.parametrize('cache_description', [True, False])
+def test_options_cached_description(cache_description):
+    class DescribedResource(Resource):
+        pass
+
+    DescribedResource.cache_description = cache_description
+    resource = DescribedResource()
+
+    for path in ('/first', '/second/path', '/first'):
+        req = Request(create_environ(path=path, method="OPTIONS"))
+        resp = Response()
+
+        resource.on_options(req, resp)
+
+        assert resp.status == falcon.HTTP_200
+        assert json.loads(_get_body(resp)) == resource.describe(req, resp)
+        assert _retrieve_header(resp, 'allow') == 'GET, OPTIONS'
+
+
+@pytest.mark.parametrize('if_none_match, expected', [
+    ('"v1"', True),
+    ('W/"v1"', True),
+    ('"other", W/"v1"', True),
+    ('*', True),
+    ('"other"', False),
+    ('"v1-other"', False),
+])
+def test_etag_matches(if_none_match, expected):
+    req = Request(create_environ(headers={'If-None-Match': if_none_match}))
+
+    assert _etag_matches(req.get_header('If-None-Match'), '"v1"') == expected
+    # note: req.if_none_match is a list of ETag objects on falcon>=2.0
+    assert _etag_matches(req.if_none_match, '"v1"') == expected
+
+    assert not _etag_matches(None, '"v1"')
+    assert not _etag_matches('', '"v1"')
+
+
+def test_options_etag():
+    resource = Resource()
+
+    resp = Response()
+    resource.on_options(Request(create_environ(method="OPTIONS")), resp)
+    etag = resp.etag
+
+    assert etag.startswith('"') and etag.endswith('"')
+
+    for if_none_match, expected_status in (
+        (etag, falcon.HTTP_NOT_MODIFIED),
+        ('W/' + etag, falcon.HTTP_NOT_MODIFIED),
+        ('"other", ' + etag, falcon.HTTP_NOT_MODIFIED),
+        ('*', falcon.HTTP_NOT_MODIFIED),
+        ('"other"', falcon.HTTP_OK),
+    ):
+        req = Request(create_environ(
+            method="OPTIONS", headers={'If-None-Match': if_none_match}
+        ))
+        resp = Response()
+        resource.on_options(req, resp)
+
+        assert resp.status == expected_status
+        assert resp.etag == etag
+        assert bool(_get_body(resp)) == (expected_status == falcon.HTTP_OK)
+
+    class TextJSONCodec(JSONCodec):
+        media_type = 'text/json'
+
+    # note: different media types have different representations
+    resource.media_handlers = [TextJSONCodec()]
+    resp = Response()
+    resource.on_options(Request(create_environ(
+        method="OPTIONS", headers={'Accept': 'text/json'}
+    )), resp)
+
+    assert resp.etag != etag
 
 
 def test_options_with_additional_args(req, resp):
@@ -392,6 +471,51 @@ def test_default_parameters(req):
     assert 'bar' not in params
 
 
+def test_default_parameters_parsed_once(req):
+    class CountingParam(IntParam):
+        parsed = 0
+
+        def value(self, raw_value):
+            CountingParam.parsed += 1
+            return super().value(raw_value)
+
+    class ResourceWithDefaults(Resource):
+        foo = CountingParam(details="foo with default", default="10")
+        bar = CountingParam(details="bar with default", default="5", many=True)
+        baz = IntParam(details="baz with invalid default", default="baz")
+
+    resource = ResourceWithDefaults()
+    assert CountingParam.parsed == 2
+
+    for _ in range(3):
+        params = resource.require_params(
+            Request(create_environ(query_string="baz=1"))
+        )
+        assert params == {'foo': 10, 'bar': [5], 'baz': 1, 'indent': 0}
+
+    assert CountingParam.parsed == 2
+
+    # note: invalid default is reported only when it is actually used
+    with pytest.raises(errors.HTTPInvalidParam):
+        resource.require_params(req)
+
+
+def test_required_params_all_missing_reported():
+    class SomeResource(Resource):
+        foo = StringParam(details="give me foo", required=True)
+        bar = StringParam(details="give me bar", required=True)
+        baz = StringParam(details="give me baz", required=False)
+
+    resource = SomeResource()
+
+    with pytest.raises(errors.HTTPMissingParam) as excinfo:
+        resource.require_params(Request(create_environ(query_string="baz=1")))
+
+    assert 'foo' in excinfo.value.description
+    assert 'bar' in excinfo.value.description
+    assert 'baz' not in excinfo.value.description
+
+
 def test_whole_serializer_validation_as_hhtp_bad_request(req):
 
     class TestSerializer(BaseSerializer):
@@ -541,3 +665,127 @@ def test_warns_about_context_disabled_implicitly():
 
     with pytest.warns(FutureWarning):
         ResourceWithoutContext()
+
+
+class ConditionalResource(mixins.RetrieveMixin, BaseResource):
+    def __init__(self, version=None, modified=None):
+        self.version = version
+        self.modified = modified
+        self.retrieved = 0
+
+    def get_etag(self, params, **kwargs):
+        return self.version
+
+    def get_last_modified(self, params, **kwargs):
+        return self.modified
+
+    def retrieve(self, params, meta, **kwargs):
+        self.retrieved += 1
+        return {'foo': 'bar'}
+
+
+def _conditional_get(resource, **headers):
+    req = Request(create_environ(method='GET', headers=headers))
+    resp = Response()
+    resource.on_get(req, resp)
+    return resp
+
+
+def test_conditional_get_etag_hook():
+    resource = ConditionalResource(version='v1')
+
+    resp = _conditional_get(resource)
+    assert resp.status == falcon.HTTP_OK
+    assert resp.etag == '"v1"'
+    assert resource.retrieved == 1
+
+    resp = _conditional_get(resource, **{'If-None-Match': '"v1"'})
+    assert resp.status == falcon.HTTP_NOT_MODIFIED
+    assert _get_body(resp) is None
+    # note: handler was not called at all
+    assert resource.retrieved == 1
+
+    resource.version = 'v2'
+    resp = _conditional_get(resource, **{'If-None-Match': '"v1"'})
+    assert resp.status == falcon.HTTP_OK
+    assert resp.etag == '"v2"'
+    assert resource.retrieved == 2
+
+
+def test_conditional_get_last_modified_hook():
+    resource = ConditionalResource(modified=datetime(2016, 1, 1, 12, 0, 0, 5))
+
+    resp = _conditional_get(resource)
+    assert resp.status == falcon.HTTP_OK
+    assert resp.last_modified == 'Fri, 01 Jan 2016 12:00:00 GMT'
+
+    resp = _conditional_get(
+        resource, **{'If-Modified-Since': 'Fri, 01 Jan 2016 12:00:00 GMT'}
+    )
+    assert resp.status == falcon.HTTP_NOT_MODIFIED
+    assert resource.retrieved == 1
+
+    resp = _conditional_get(
+        resource, **{'If-Modified-Since': 'Fri, 01 Jan 2016 11:59:59 GMT'}
+    )
+    assert resp.status == falcon.HTTP_OK
+
+    # note: If-Modified-Since is ignored when If-None-Match is present
+    resp = _conditional_get(resource, **{
+        'If-Modified-Since': 'Fri, 01 Jan 2016 12:00:00 GMT',
+        'If-None-Match': '"anything"',
+    })
+    assert resp.status == falcon.HTTP_OK
+
+
+def test_conditional_get_body_hash():
+    resource = ConditionalResource()
+
+    # note: body hashing is opt-in
+    resp = _conditional_get(resource)
+    assert resp.status == falcon.HTTP_OK
+    assert resp.etag is None
+
+    resource.hash_etags = True
+    resp = _conditional_get(resource)
+    etag = resp.etag
+    assert resp.status == falcon.HTTP_OK
+    assert etag
+
+    resp = _conditional_get(resource, **{'If-None-Match': etag})
+    assert resp.status == falcon.HTTP_NOT_MODIFIED
+    assert _get_body(resp) is None
+    assert resp.etag == etag
+
+    resource.hash_etags = False
+    resp = _conditional_get(resource, **{'If-None-Match': etag})
+    assert resp.status == falcon.HTTP_OK
+    assert resp.etag is None
+
+
+class SparseSerializer(BaseSerializer):
+    id = StringField("identifier")
+    name = StringField("name")
+
+
+class SparseResource(mixins.SparseFieldsetMixin, BaseResource):
+    serializer = SparseSerializer()
+
+
+@pytest.mark.parametrize('query_string', [
+    'fields=name,id',
+    'fields=name&fields=id',
+    'fields=name,id,name,',
+])
+def test_sparse_fieldset_comma_separated(query_string):
+    req = Request(create_environ(query_string=query_string))
+    params = SparseResource().require_params(req)
+
+    assert params['fields'] == ['id', 'name']
+
+
+def test_sparse_fieldset_unknown_field():
+    req = Request(create_environ(query_string='fields=id,foo'))
+
+    with pytest.raises(errors.HTTPInvalidParam):
+        SparseResource().require_params(req)
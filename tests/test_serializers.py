@@ -7,7 +7,7 @@ import pytest
 
 import graceful
 from graceful.errors import DeserializationError
-from graceful.fields import BaseField, StringField
+from graceful.fields import BaseField, StringField, SerializerField
 from graceful.serializers import BaseSerializer
 
 
@@ -433,3 +433,235 @@ def test_serializer_many_allow_null_validation():
         serializer.validate(invalid)
 
     serializer.validate(valid)
+
+
+def test_serializer_compiled_plans_match_generic():
+    class ExampleSerializer(BaseSerializer):
+        name = ExampleField(details="name of instance object")
+        renamed = ExampleField(details="renamed field", source="_renamed")
+        star = ExampleField(details="whole object", source="*")
+        many = StringField(details="many field", many=True)
+        nullable = ExampleField(details="nullable", allow_null=True)
+        secret = ExampleField(details="write only", write_only=True)
+
+    class GenericSerializer(ExampleSerializer):
+        compiled = False
+
+    class SomeObject:
+        def __init__(self):
+            self.name = "John"
+            self._renamed = "renamed"
+            self.many = [1, 2]
+            self.nullable = None
+            self.secret = "secret"
+
+    compiled = ExampleSerializer()
+    generic = GenericSerializer()
+
+    instances = [
+        {"name": "John", "_renamed": "x", "many": [1, 2], "secret": "x"},
+        {"many": None},
+        SomeObject(),
+    ]
+
+    for instance in instances:
+        assert (
+            compiled.to_representation(instance) ==
+            generic.to_representation(instance)
+        )
+
+    representations = [
+        {"name": "John", "renamed": "x", "many": ["a"], "nullable": None},
+        {"name": "John", "nullable": "", "secret": "x"},
+    ]
+
+    for representation in representations:
+        assert (
+            compiled.from_representation(representation) ==
+            generic.from_representation(representation)
+        )
+
+    with pytest.raises(DeserializationError) as compiled_info:
+        compiled.from_representation({"many": "not a sequence"})
+
+    with pytest.raises(DeserializationError) as generic_info:
+        generic.from_representation({"many": "not a sequence"})
+
+    assert compiled_info.value.failed == generic_info.value.failed
+    assert compiled_info.value.missing == generic_info.value.missing
+
+
+def test_serializer_compiled_plan_respects_custom_get_attribute():
+    class ExampleSerializer(BaseSerializer):
+        foo = ExampleField(details="foo field")
+        star = ExampleField(details="whole object", source="*")
+
+        def get_attribute(self, obj, attr):
+            return "custom " + attr
+
+    class DerivedSerializer(ExampleSerializer):
+        pass
+
+    for serializer in (ExampleSerializer(), DerivedSerializer()):
+        assert serializer.to_representation({"foo": "bar"}) == {
+            "foo": "custom foo",
+            "star": "custom *",
+        }
+
+
+def test_serializer_to_representation_many():
+    class ExampleSerializer(BaseSerializer):
+        foo = ExampleField(details="foo field")
+        star = ExampleField(details="whole object", source="*")
+
+    class SomeObject:
+        foo = 'attr'
+
+    serializer = ExampleSerializer()
+    obj = SomeObject()
+    objs = [{'foo': 'key'}, {'foo': 'other'}, obj, {}]
+
+    assert serializer.to_representation_many(iter(objs)) == [
+        serializer.to_representation(item) for item in objs
+    ]
+    assert serializer.to_representation_many(objs)[2] == {
+        'foo': 'attr', 'star': obj
+    }
+    assert serializer.to_representation_many([]) == []
+
+
+def test_serializer_to_representation_many_custom_to_representation():
+    class ExampleSerializer(BaseSerializer):
+        foo = ExampleField(details="foo field")
+
+        def to_representation(self, obj):
+            representation = super().to_representation(obj)
+            representation['extra'] = True
+            return representation
+
+    serializer = ExampleSerializer()
+
+    assert serializer.to_representation_many([{'foo': 'bar'}]) == [
+        {'foo': 'bar', 'extra': True}
+    ]
+
+
+def test_serializer_validation_missing_forbidden():
+    class ExampleSerializer(BaseSerializer):
+        first = ExampleField(details="first field")
+        second = ExampleField(details="second field", source="_second")
+        third = ExampleField(details="third field")
+        readonly = ExampleField(details="read only field", read_only=True)
+
+    serializer = ExampleSerializer()
+
+    serializer.validate({'first': 1, '_second': 2, 'third': 3})
+    serializer.validate({'first': 1}, partial=True)
+
+    with pytest.raises(DeserializationError) as excinfo:
+        serializer.validate({'second': 2, 'readonly': 1, 'unknown': 1})
+
+    # note: source names are translated back to field names and order
+    #       of fields definition is preserved
+    assert excinfo.value.missing == ['first', 'second', 'third']
+    assert excinfo.value.forbidden == ['second', 'readonly', 'unknown']
+    assert not excinfo.value.invalid
+
+    with pytest.raises(DeserializationError) as excinfo:
+        serializer.validate({'unknown': 1}, partial=True)
+
+    assert not excinfo.value.missing
+    assert excinfo.value.forbidden == ['unknown']
+
+
+def test_serializer_sparse_representation():
+    class ExampleSerializer(BaseSerializer):
+        foo = ExampleField(details="foo field")
+        bar = ExampleField(details="bar field", source="_bar")
+        secret = ExampleField(details="write only field", write_only=True)
+
+    class CustomSerializer(ExampleSerializer):
+        def to_representation(self, obj):
+            representation = super().to_representation(obj)
+            representation['extra'] = True
+            return representation
+
+    obj = {'foo': 'a', '_bar': 'b', 'secret': 'c'}
+
+    for serializer in (ExampleSerializer(), CustomSerializer()):
+        assert serializer.to_sparse_representation(obj, ['_bar', 'bar']) == {
+            'bar': 'b'
+        }
+        assert serializer.to_representation_many(
+            [obj, obj], fields={'foo'}
+        ) == [{'foo': 'a'}, {'foo': 'a'}]
+
+    serializer = ExampleSerializer()
+    assert serializer.get_sources() == ['foo', '_bar']
+    assert serializer.get_sources(['bar', 'secret']) == ['_bar']
+
+
+def test_serializer_nested_serializer_field():
+    class NestedSerializer(BaseSerializer):
+        foo = ExampleField(details="foo field")
+        bar = StringField(details="bar field", source="_bar")
+
+    class CustomNestedSerializer(NestedSerializer):
+        def to_representation(self, obj):
+            representation = super().to_representation(obj)
+            representation['extra'] = True
+            return representation
+
+    class SomeObject:
+        foo = 'attr'
+        _bar = 'attr'
+
+    def make_serializer(nested):
+        class ExampleSerializer(BaseSerializer):
+            one = SerializerField(details="nested", serializer=nested)
+            many = SerializerField(
+                details="nested list", serializer=nested, many=True
+            )
+        return ExampleSerializer()
+
+    obj = {
+        'one': SomeObject(),
+        'many': [{'foo': 1, '_bar': 2}, SomeObject(), {'foo': 3}],
+    }
+
+    for nested in (NestedSerializer(), CustomNestedSerializer()):
+        serializer = make_serializer(nested)
+        generic = make_serializer(nested)
+        generic.compiled = False
+
+        assert serializer.to_representation(obj) == {
+            'one': nested.to_representation(obj['one']),
+            'many': [nested.to_representation(item) for item in obj['many']],
+        }
+        assert serializer.to_representation(obj) == (
+            generic.to_representation(obj)
+        )
+        assert serializer.to_representation({}) == {'one': None, 'many': []}
+
+    serializer = make_serializer(NestedSerializer())
+    representation = {
+        'one': {'foo': 1, 'bar': 'a'},
+        'many': [{'foo': 2, 'bar': 'b'}],
+    }
+    object_dict = serializer.from_representation(representation)
+
+    assert object_dict == {
+        'one': {'foo': 1, '_bar': 'a'},
+        'many': [{'foo': 2, '_bar': 'b'}],
+    }
+    serializer.validate(object_dict)
+
+    with pytest.raises(DeserializationError) as excinfo:
+        serializer.validate({'one': {'foo': 1}, 'many': [{'_bar': 'b'}]})
+
+    assert set(excinfo.value.invalid) == {'one', 'many'}
+
+    with pytest.raises(DeserializationError) as excinfo:
+        serializer.from_representation({'one': 'foo', 'many': []})
+
+    assert set(excinfo.value.failed) == {'one'}
@@ -0,0 +1,212 @@
+import json
+import logging
+
+import pytest
+
+from falcon import Request, Response
+from falcon.testing import create_environ
+import falcon
+
+from graceful.caching import InMemoryCache
+from graceful.fields import RawField
+from graceful.resources.base import BaseResource, _get_body
+from graceful.resources import generic, mixins
+from graceful.serializers import BaseSerializer
+from graceful.timing import (
+    PhaseTimer,
+    CallbackTimingSink,
+    LoggingTimingSink,
+    InMemoryTimingAggregator,
+)
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0
+
+    def __call__(self):
+        self.now += 1
+        return self.now
+
+
+def test_phase_timer():
+    timer = PhaseTimer(clock=Clock())
+
+    timer.start()
+    timer.lap('first')
+    timer.lap('second')
+
+    with timer.measure('nested'):
+        pass
+
+    assert timer.phases == [('first', 1), ('second', 1), ('nested', 1)]
+    assert timer.server_timing() == (
+        'first;dur=1000.000, second;dur=1000.000, nested;dur=1000.000'
+    )
+
+
+class ListHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+def test_timing_sinks():
+    req = Request(create_environ(method='GET', path='/items'))
+    resource = BaseResource()
+    phases = [('params', 0.001), ('handler', 0.002)]
+
+    recorded = []
+    CallbackTimingSink(lambda *args: recorded.append(args)).record(
+        resource, req, phases
+    )
+    assert recorded == [(resource, req, phases)]
+
+    handler = ListHandler()
+    logger = logging.Logger('timing', level=logging.INFO)
+    logger.addHandler(handler)
+
+    LoggingTimingSink(logger).record(resource, req, phases)
+    LoggingTimingSink(logger, logging.INFO).record(resource, req, phases)
+
+    assert [record.getMessage() for record in handler.records] == [
+        'GET /items BaseResource params=1.000ms handler=2.000ms'
+    ]
+
+    aggregator = InMemoryTimingAggregator()
+    aggregator.record(resource, req, phases)
+    aggregator.record(resource, req, [('params', 0.003)])
+
+    assert aggregator.stats() == {
+        'BaseResource': {
+            'params': {
+                'count': 2, 'total': 0.004, 'mean': 0.002, 'max': 0.003
+            },
+            'handler': {
+                'count': 1, 'total': 0.002, 'mean': 0.002, 'max': 0.002
+            },
+        }
+    }
+
+    aggregator.reset()
+    assert aggregator.stats() == {}
+
+
+class ItemSerializer(BaseSerializer):
+    name = RawField("item name")
+
+
+class TimedResource(generic.RetrieveUpdateAPI, with_context=True):
+    serializer = ItemSerializer()
+    timing_sink = InMemoryTimingAggregator()
+    server_timing = True
+
+    def retrieve(self, params, meta, context, **kwargs):
+        with context['graceful.timer'].measure('db'):
+            return {'name': 'foo'}
+
+    def update(self, params, meta, validated, context, **kwargs):
+        return validated
+
+
+def _request(method='GET', body=None, headers=None):
+    req = Request(create_environ(
+        method=method, headers=dict(
+            headers or {}, **{'Content-Type': 'application/json'}
+        ), body=json.dumps(body) if body is not None else '',
+    ))
+    return req, Response()
+
+
+def _phases(resp):
+    return [
+        entry.split(';')[0]
+        for entry in resp.get_header('Server-Timing').split(', ')
+    ]
+
+
+def test_resource_timing():
+    resource = TimedResource()
+    resource.timing_sink.reset()
+
+    req, resp = _request()
+    resource.on_get(req, resp)
+    assert json.loads(_get_body(resp))['content'] == {'name': 'foo'}
+    assert _phases(resp) == [
+        'params', 'precondition', 'db', 'handler', 'render', 'finalize'
+    ]
+
+    req, resp = _request('PUT', {'name': 'bar'})
+    resource.on_put(req, resp)
+    assert _phases(resp) == [
+        'decode', 'validate', 'params', 'precondition', 'handler', 'render',
+        'finalize',
+    ]
+
+    stats = resource.timing_sink.stats()['TimedResource']
+    assert stats['params']['count'] == 2
+    assert stats['validate']['count'] == 1
+
+
+def test_resource_timing_answered_without_handler():
+    class CachedTimedResource(TimedResource):
+        response_cache = InMemoryCache()
+        timing_sink = None
+
+    resource = CachedTimedResource()
+
+    for _ in range(2):
+        req, resp = _request()
+        resource.on_get(req, resp)
+
+    assert json.loads(_get_body(resp))['content'] == {'name': 'foo'}
+    assert _phases(resp) == ['params', 'precondition']
+
+    req, resp = _request(headers={'If-None-Match': '"foo"'})
+    resource.get_etag = lambda params, **kwargs: 'foo'
+    resource.on_get(req, resp)
+    assert resp.status == falcon.HTTP_NOT_MODIFIED
+    assert _phases(resp) == ['params', 'precondition']
+
+
+def test_resource_timing_errors():
+    class FailingTimedResource(TimedResource):
+        timing_sink = InMemoryTimingAggregator()
+
+        def retrieve(self, params, meta, context, **kwargs):
+            raise falcon.HTTPNotFound()
+
+    resource = FailingTimedResource()
+
+    req, resp = _request()
+    with pytest.raises(falcon.HTTPNotFound):
+        resource.on_get(req, resp)
+    assert _phases(resp) == ['params', 'precondition']
+
+    req, resp = _request('PUT', {})
+    with pytest.raises(falcon.HTTPBadRequest):
+        resource.on_put(req, resp)
+    assert _phases(resp) == ['decode']
+
+    stats = resource.timing_sink.stats()[
+        FailingTimedResource.__qualname__
+    ]
+    assert stats['params']['count'] == 1
+    assert stats['decode']['count'] == 1
+
+
+def test_resource_timing_disabled():
+    class UntimedResource(mixins.RetrieveMixin, BaseResource,
+                          with_context=True):
+        def retrieve(self, params, meta, context, **kwargs):
+            assert 'graceful.timer' not in context
+            return {}
+
+    req, resp = _request()
+    UntimedResource().on_get(req, resp)
+
+    assert resp.get_header('Server-Timing') is None
+    assert 'graceful.timer' not in req.context